@@ -0,0 +1,29 @@
+# Generated by Django 5.1.9 on 2026-10-19 13:27
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "activity_stream",
+            "0017_alter_activitystreamstaffssouseremail_email_address_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="activitystreamstaffssouser",
+            name="service_now_verified_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="activitystreamstaffssouser",
+            name="service_now_verified_emails",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=255), default=list, size=None
+            ),
+        ),
+    ]
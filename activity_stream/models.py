@@ -78,6 +78,12 @@ class ActivityStreamStaffSSOUser(models.Model):
     service_now_email_address = models.EmailField(
         max_length=255, unique=True, null=True
     )
+    # When the Service Now mapping was last checked, and the SSO emails it was
+    # checked against.
+    service_now_verified_at = models.DateTimeField(null=True, blank=True)
+    service_now_verified_emails = ArrayField(
+        models.CharField(max_length=255), default=list
+    )
 
     # Used to denote if the user is still returned by the ActivityStream API.
     available = models.BooleanField(default=False)
@@ -92,10 +98,23 @@ class ActivityStreamStaffSSOUser(models.Model):
         return f"{self.first_name} {self.last_name}"
 
     def get_primary_email(self) -> Optional[str]:
-        primary_emails: QuerySet[ActivityStreamStaffSSOUserEmail] = (
-            self.sso_emails.filter(is_primary=True)
-        )
-        primary_email = primary_emails.first()
+        primary_email: Optional[ActivityStreamStaffSSOUserEmail]
+        if "sso_emails" in getattr(self, "_prefetched_objects_cache", {}):
+            # Use the prefetched emails, rather than querying them again.
+            primary_email = min(
+                (
+                    sso_email
+                    for sso_email in self.sso_emails.all()
+                    if sso_email.is_primary
+                ),
+                key=lambda sso_email: sso_email.pk,
+                default=None,
+            )
+        else:
+            primary_emails: QuerySet[ActivityStreamStaffSSOUserEmail] = (
+                self.sso_emails.filter(is_primary=True)
+            )
+            primary_email = primary_emails.first()
         if primary_email:
             return primary_email.email_address
         return None
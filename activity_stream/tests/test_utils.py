@@ -3,6 +3,7 @@ from django.test import override_settings
 
 from activity_stream.models import ActivityStreamStaffSSOUser
 from activity_stream.utils import ingest_staff_sso_s3
+from core.staff_search.models import StaffIndexChange
 from core.utils.boto import StaffSSOS3Ingest
 
 
@@ -66,3 +67,32 @@ class TestIngestStaffSsoS3:
 
         assert ActivityStreamStaffSSOUser.objects.filter(available=True).count() == 2
         assert not ActivityStreamStaffSSOUser.objects.get(user_id=3).available
+
+    @override_settings(S3_LOCAL_ENDPOINT_URL=None, APP_ENV="production")
+    def test_records_staff_index_changes(self, sso_user_factory):
+        items = [sso_user_factory(1), sso_user_factory(2)]
+
+        class Test6StaffSSOS3Ingest(TestStaffSSOS3Ingest):
+            def get_data_to_ingest(self):
+                yield from items
+
+        ingest_staff_sso_s3(ingest_manager_class=Test6StaffSSOS3Ingest)
+
+        assert StaffIndexChange.objects.count() == 2
+        StaffIndexChange.objects.all().delete()
+
+        # Nothing has changed.
+        ingest_staff_sso_s3(ingest_manager_class=Test6StaffSSOS3Ingest)
+
+        assert StaffIndexChange.objects.count() == 0
+
+        class Test7StaffSSOS3Ingest(TestStaffSSOS3Ingest):
+            def get_data_to_ingest(self):
+                yield items[0]
+
+        # User 2 is no longer available.
+        ingest_staff_sso_s3(ingest_manager_class=Test7StaffSSOS3Ingest)
+
+        assert list(
+            StaffIndexChange.objects.values_list("email_user_id", flat=True)
+        ) == [ActivityStreamStaffSSOUser.objects.get(user_id=2).email_user_id]
@@ -5,13 +5,29 @@ from django.conf import settings
 
 from activity_stream import models
 from core.utils.boto import StaffSSOS3Ingest
+from core.utils.staff_index import record_staff_index_changes
 
 logger = logging.getLogger(__name__)
 
+# ActivityStreamStaffSSOUser fields that are stored in the Staff index.
+STAFF_INDEX_FIELDS = [
+    "available",
+    "first_name",
+    "last_name",
+    "user_id",
+    "email_user_id",
+    "contact_email_address",
+]
+
 
 def staff_sso_s3_to_db(item) -> int:
     user = json.loads(item)
     user_obj = user["object"]
+    previous_values = (
+        models.ActivityStreamStaffSSOUser.objects.filter(identifier=user_obj["id"])
+        .values(*STAFF_INDEX_FIELDS)
+        .first()
+    )
     (
         as_staff_sso_user,
         _,
@@ -33,11 +49,25 @@ def staff_sso_s3_to_db(item) -> int:
         },
     )
 
+    changed = previous_values != {
+        field: models.ActivityStreamStaffSSOUser._meta.get_field(field).to_python(
+            getattr(as_staff_sso_user, field)
+        )
+        for field in STAFF_INDEX_FIELDS
+    }
     for email in user_obj["dit:emailAddress"]:
-        models.ActivityStreamStaffSSOUserEmail.objects.get_or_create(
+        _, email_created = models.ActivityStreamStaffSSOUserEmail.objects.get_or_create(
             email_address=email,
             staff_sso_user=as_staff_sso_user,
         )
+        changed = changed or email_created
+
+    if changed:
+        email_user_ids = [as_staff_sso_user.email_user_id]
+        if previous_values:
+            # Remove the document stored under the old id if it has changed.
+            email_user_ids.append(previous_values["email_user_id"])
+        record_staff_index_changes(email_user_ids=email_user_ids)
 
     logger.info(
         "ingest_staff_sso_s3: Added SSO activity stream record for %s",
@@ -65,8 +95,14 @@ def ingest_staff_sso_s3(ingest_manager_class=StaffSSOS3Ingest) -> None:
         logger.info(
             "ingest_staff_sso_s3: Deactivating accounts %s", created_updated_ids
         )
-        models.ActivityStreamStaffSSOUser.objects.exclude(
+        missing_sso_users = models.ActivityStreamStaffSSOUser.objects.exclude(
             id__in=created_updated_ids
-        ).update(available=False)
+        )
+        record_staff_index_changes(
+            email_user_ids=missing_sso_users.filter(available=True).values_list(
+                "email_user_id", flat=True
+            )
+        )
+        missing_sso_users.update(available=False)
 
     ingest_manager.cleanup()
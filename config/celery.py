@@ -14,6 +14,11 @@ celery_app.conf.beat_schedule = {
         "task": "core.tasks.progress_workflows",
         "schedule": crontab(minute="*/5"),
     },
+    # Delete the old workflow step timings once a day.
+    "delete-old-workflow-step-runs-task": {
+        "task": "core.tasks.delete_old_workflow_step_runs_task",
+        "schedule": crontab(minute="30", hour="3"),
+    },
     # Ingest Data from S3 every 30mins
     "ingest-activity-stream-task": {
         "task": "core.tasks.ingest_activity_stream_task",
@@ -23,19 +28,40 @@ celery_app.conf.beat_schedule = {
         "task": "core.tasks.ingest_people_s3_task",
         "schedule": crontab(minute="*/30"),
     },
+    # Apply Staff SSO changes to the Staff search index every 5mins
+    "process-staff-index-changes-task": {
+        "task": "core.tasks.process_staff_index_changes_task",
+        "schedule": crontab(minute="*/5"),
+    },
+    # Repair any drift between the Staff search index and the database hourly.
+    "reconcile-staff-index-task": {
+        "task": "core.tasks.reconcile_staff_index_task",
+        "schedule": crontab(minute="45"),
+    },
+    # Refresh a batch of stale UK SBS org hierarchies every 15mins.
+    "refresh-org-hierarchies-task": {
+        "task": "core.tasks.refresh_org_hierarchies_task",
+        "schedule": crontab(minute="*/15"),
+    },
     # Search for incomplete leavers once a day.
     # Execute daily at 7am
     "incomplete-leaver-pay-cut-off-task": {
         "task": "leavers.tasks.notify_hr",
         "schedule": crontab(minute=0, hour=7, day_of_week="mon,tue,wed,thu,fri"),
     },
+    # Refresh the time in step reports every hour.
+    "refresh-time-in-step-reports-task": {
+        "task": "leavers.tasks.refresh_time_in_step_reports",
+        "schedule": crontab(minute="10"),
+    },
     # Send weekly email to notify of last week's leavers.
     # Execute on monday morning at 8 am
     "weekly-leavers-email-task": {
         "task": "leavers.tasks.weekly_leavers_email",
         "schedule": crontab(minute=0, hour=8, day_of_week="mon"),
     },
-    # Nightly tasks to update the Staff search index.
+    # Nightly tasks to update the Staff search index, this full rebuild is a
+    # safety net for the changes applied by "process-staff-index-changes-task".
     "index-sso-users-task": {
         "task": "core.tasks.index_sso_users_task",
         "schedule": crontab(minute="0", hour="4"),
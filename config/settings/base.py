@@ -58,6 +58,7 @@ LOCAL_APPS = [
     "core.landing_pages",
     "core.health_check.apps.HealthCheckConfig",
     "core.staff_search",
+    "core.uksbs",
     "activity_stream",
     "health_check",
     "health_check.db",
@@ -240,6 +241,7 @@ SETTINGS_EXPORT = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.middleware.security.SecurityMiddleware",
@@ -350,6 +352,16 @@ PEOPLE_FINDER_HAWK_SECRET_KEY = env("PEOPLE_FINDER_HAWK_SECRET_KEY")
 # People Finder
 PEOPLE_FINDER_URL = env("PEOPLE_FINDER_URL")
 PEOPLE_FINDER_INTERFACE = env("PEOPLE_FINDER_INTERFACE")
+PEOPLE_FINDER_TIMEOUT = env.int("PEOPLE_FINDER_TIMEOUT", default=30)
+PEOPLE_FINDER_MAX_RETRIES = env.int("PEOPLE_FINDER_MAX_RETRIES", default=3)
+PEOPLE_FINDER_PREFETCH_PAGES = env.int("PEOPLE_FINDER_PREFETCH_PAGES", default=2)
+# Long enough for the cache to be warmed again by the nightly ingest.
+PEOPLE_FINDER_CACHE_TIMEOUT = env.int(
+    "PEOPLE_FINDER_CACHE_TIMEOUT", default=60 * 60 * 26
+)
+PEOPLE_FINDER_NOT_FOUND_CACHE_TIMEOUT = env.int(
+    "PEOPLE_FINDER_NOT_FOUND_CACHE_TIMEOUT", default=60 * 60
+)
 
 # People Data report
 PEOPLE_DATA_INTERFACE = env("PEOPLE_DATA_INTERFACE")
@@ -364,6 +376,20 @@ DJANGO_WORKFLOWS = {
     "leaving": "leavers.workflow.leaving.LeaversWorkflow",
 }
 RUN_DJANGO_WORKFLOWS = env.bool("RUN_DJANGO_WORKFLOWS", default=False)
+# Bursts of submissions within this window progress the workflow once.
+WORKFLOW_PROGRESS_DEBOUNCE_SECONDS = env.int(
+    "WORKFLOW_PROGRESS_DEBOUNCE_SECONDS", default=5
+)
+# The number of workflows each progress_workflow_batch task progresses.
+WORKFLOW_PROGRESS_BATCH_SIZE = env.int("WORKFLOW_PROGRESS_BATCH_SIZE", default=50)
+# How long a workflow run can be queued or running for before another can be.
+WORKFLOW_PROGRESS_LOCK_TIMEOUT = env.int(
+    "WORKFLOW_PROGRESS_LOCK_TIMEOUT", default=60 * 15
+)
+# How long the timings of workflow step runs are kept for.
+WORKFLOW_STEP_RUN_RETENTION_DAYS = env.int(
+    "WORKFLOW_STEP_RUN_RETENTION_DAYS", default=30
+)
 
 
 # Site's own URL
@@ -384,6 +410,13 @@ SERVICE_NOW_GET_DIRECTORATE_PATH = env("SERVICE_NOW_GET_DIRECTORATE_PATH", defau
 SERVICE_NOW_DIT_DEPARTMENT_SYS_ID = env(
     "SERVICE_NOW_DIT_DEPARTMENT_SYS_ID", default=None
 )
+SERVICE_NOW_TIMEOUT = env.int("SERVICE_NOW_TIMEOUT", default=30)
+# Must not be larger than the max number of records Service Now returns per request.
+SERVICE_NOW_PAGE_SIZE = env.int("SERVICE_NOW_PAGE_SIZE", default=100)
+SERVICE_NOW_PREFETCH = env.bool("SERVICE_NOW_PREFETCH", default=True)
+SERVICE_NOW_VERIFICATION_MAX_AGE_DAYS = env.int(
+    "SERVICE_NOW_VERIFICATION_MAX_AGE_DAYS", default=7
+)
 
 # UK SBS API
 UKSBS_INTERFACE = env("UKSBS_INTERFACE", default=None)
@@ -394,6 +427,10 @@ UKSBS_HIERARCHY_API_URL = env("UKSBS_HIERARCHY_API_URL", default=None)
 UKSBS_GET_PEOPLE_HIERARCHY = env("UKSBS_GET_PEOPLE_HIERARCHY", default=None)
 UKSBS_LEAVER_API_URL = env("UKSBS_LEAVER_API_URL", default=None)
 UKSBS_POST_LEAVER_SUBMISSION = env("UKSBS_POST_LEAVER_SUBMISSION", default=None)
+UKSBS_HIERARCHY_CACHE_TIMEOUT = env.int("UKSBS_HIERARCHY_CACHE_TIMEOUT", default=60 * 5)
+UKSBS_ORG_HIERARCHY_MAX_AGE_HOURS = env.int(
+    "UKSBS_ORG_HIERARCHY_MAX_AGE_HOURS", default=12
+)
 
 # Legacy People Finder
 LEGACY_PEOPLE_FINDER_ES_INDEX = env("LEGACY_PEOPLE_FINDER_ES_INDEX", default=None)
@@ -453,6 +490,8 @@ else:
     ).split(",")
 
 SEARCH_STAFF_INDEX_NAME = env("SEARCH_STAFF_INDEX_NAME", default="staff")
+# Staff index operations that take longer than this are logged.
+SEARCH_SLOW_QUERY_THRESHOLD_MS = env.int("SEARCH_SLOW_QUERY_THRESHOLD_MS", default=500)
 
 # Index Current user middleware
 if env("INDEX_CURRENT_USER_MIDDLEWARE", default="false") == "true":
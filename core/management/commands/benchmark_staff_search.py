@@ -0,0 +1,103 @@
+"""Benchmark the staff search against a synthetic Staff index.
+
+A separate index is filled with synthetic staff (including the people from the
+query corpus), then the corpus queries are replayed through `search_staff_index`.
+Start a local OpenSearch container first, e.g. `docker compose up opensearch`.
+
+Usage:
+    # Benchmark a 10,000 person index with 1, 4 and 16 concurrent clients.
+    python manage.py benchmark_staff_search --size=10000 --clients 1 4 16
+
+    # Fail if recall drops below 0.9, and keep the results for comparison.
+    python manage.py benchmark_staff_search --min-recall=0.9 --output=results.json
+"""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.staff_search.benchmark import (
+    DEFAULT_CORPUS_PATH,
+    delete_synthetic_staff_index,
+    load_corpus,
+    load_synthetic_staff_index,
+    run_benchmark,
+)
+from core.utils.staff_index import STAFF_INDEX_NAME
+
+
+class Command(BaseCommand):
+    help = "Benchmark the staff search (DO NOT USE IN PROD)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=10000)
+        parser.add_argument("--clients", type=int, nargs="+", default=[1])
+        parser.add_argument("--iterations", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS_PATH)
+        parser.add_argument("--index-name", default=f"{STAFF_INDEX_NAME}_benchmark")
+        parser.add_argument("--skip-load", action="store_true")
+        parser.add_argument("--keep-index", action="store_true")
+        parser.add_argument("--min-recall", type=float, default=None)
+        parser.add_argument("--output", type=Path, default=None)
+
+    def handle(self, *args, **options) -> None:
+        if settings.APP_ENV == "production":
+            raise CommandError("The staff search benchmark can't be run in production")
+
+        index_name: str = options["index_name"]
+        if index_name == STAFF_INDEX_NAME:
+            raise CommandError("The benchmark can't be run against the Staff index")
+
+        corpus = load_corpus(options["corpus"])
+
+        if not options["skip_load"]:
+            self.stdout.write(f"Loading {options['size']} staff into '{index_name}'")
+            load_synthetic_staff_index(
+                index_name=index_name,
+                corpus=corpus,
+                size=options["size"],
+                seed=options["seed"],
+            )
+
+        runs = []
+        try:
+            for clients in options["clients"]:
+                run = run_benchmark(
+                    index_name=index_name,
+                    queries=corpus["queries"],
+                    clients=clients,
+                    iterations=options["iterations"],
+                )
+                runs.append(run.to_dict())
+                self.write_run(run.to_dict())
+        finally:
+            if not options["keep_index"]:
+                delete_synthetic_staff_index(index_name=index_name)
+
+        if options["output"]:
+            with open(options["output"], "w") as output_file:
+                json.dump(
+                    {"size": options["size"], "runs": runs}, output_file, indent=4
+                )
+
+        recall = min(run["recall"] for run in runs)
+        if options["min_recall"] is not None and recall < options["min_recall"]:
+            raise CommandError(
+                f"Recall {recall:.3f} is below the minimum of {options['min_recall']}"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Job finished successfully"))
+
+    def write_run(self, run) -> None:
+        latency = run["latency_ms"]
+        self.stdout.write(
+            f"clients={run['clients']} queries={run['queries']} "
+            f"throughput={run['throughput']:.1f}/s "
+            f"p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms "
+            f"p99={latency['p99']:.1f}ms recall={run['recall']:.3f}"
+        )
+        for kind, recall in run["recall_by_kind"].items():
+            self.stdout.write(f"    {kind}: recall={recall:.3f}")
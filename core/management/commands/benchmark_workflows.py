@@ -0,0 +1,78 @@
+"""Benchmark the leaving workflow with synthetic leavers.
+
+Synthetic leaving requests are created, then their flows are progressed with
+the real executor on a virtual clock that moves through the working days and
+reminder windows. UK SBS, Service Now, Notify, Slack and the Staff index are
+stubbed, and everything is rolled back when the simulation ends.
+
+Usage:
+    # Simulate 100 leavers over 6 weeks, with a beat every hour.
+    python manage.py benchmark_workflows --flows=100 --days=42
+
+    # Keep the results for comparison.
+    python manage.py benchmark_workflows --output=results.json
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from leavers.workflow.benchmark import run_simulation
+
+
+class Command(BaseCommand):
+    help = "Benchmark the leaving workflow (DO NOT USE IN PROD)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--flows", type=int, default=100)
+        parser.add_argument("--days", type=int, default=42)
+        parser.add_argument("--ticks-per-day", type=int, default=24)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--start",
+            type=datetime.fromisoformat,
+            default=None,
+            help="The start of the virtual clock, defaults to the next midnight",
+        )
+        parser.add_argument("--output", type=Path, default=None)
+
+    def handle(self, *args, **options) -> None:
+        if settings.APP_ENV == "production":
+            raise CommandError("The workflow benchmark can't be run in production")
+
+        start: datetime = options["start"] or (
+            timezone.now() + timedelta(days=1)
+        ).replace(hour=0, minute=0, second=0, microsecond=0)
+        if timezone.is_naive(start):
+            start = timezone.make_aware(start)
+
+        self.stdout.write(
+            f"Simulating {options['flows']} flows over {options['days']} days"
+        )
+        result = run_simulation(
+            flows=options["flows"],
+            days=options["days"],
+            ticks_per_day=options["ticks_per_day"],
+            start=start,
+            seed=options["seed"],
+        ).to_dict()
+
+        self.stdout.write(
+            f"flow_runs={result['flow_runs']} "
+            f"throughput={result['flows_per_second']:.1f} flows/s "
+            f"steps={result['steps']} "
+            f"queries_per_step={result['queries_per_step']:.1f} "
+            f"finished={result['finished_flows']}/{result['flows']}"
+        )
+        for day, emails in result["emails_by_day"].items():
+            self.stdout.write(f"    {day}: emails={emails}")
+
+        if options["output"]:
+            with open(options["output"], "w") as output_file:
+                json.dump(result, output_file, indent=4)
+
+        self.stdout.write(self.style.SUCCESS("Job finished successfully"))
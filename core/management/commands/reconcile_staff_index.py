@@ -0,0 +1,47 @@
+"""Compare the staff index with the database and repair any differences.
+
+Usage:
+    # Report and repair the drift.
+    python manage.py reconcile_staff_index
+
+    # Only report the drift.
+    python manage.py reconcile_staff_index --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.staff_search.utils import reconcile_staff_index
+
+
+class Command(BaseCommand):
+    help = "Reconcile the Staff index with the Staff SSO data"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options) -> None:
+        reconciliation = reconcile_staff_index(
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+
+        self.stdout.write(
+            f"Checked {reconciliation.sso_user_count} users against "
+            f"{reconciliation.indexed_document_count} indexed documents"
+        )
+        self.stdout.write(f"Missing: {reconciliation.missing_document_count}")
+        self.stdout.write(f"Stale: {reconciliation.stale_document_count}")
+        self.stdout.write(f"Orphaned: {reconciliation.orphaned_document_count}")
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("Dry run, nothing was repaired"))
+        elif reconciliation.failed_document_count:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Failed to repair {reconciliation.failed_document_count} "
+                    "documents"
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Job finished successfully"))
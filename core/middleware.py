@@ -9,6 +9,7 @@ from django.urls import resolve, reverse
 from django.utils import timezone
 
 from activity_stream.models import ActivityStreamStaffSSOUser
+from core.utils.cache import request_cache_scope
 from core.utils.staff_index import (
     StaffDocumentNotFound,
     build_staff_document,
@@ -131,3 +132,14 @@ class PrimaryEmailMiddleware:
                 return redirect(reverse(self.url_name) + "?next=" + request.path)
 
         return self.get_response(request)
+
+
+class RequestCacheMiddleware:
+    """Gives each request its own cache, see `core.utils.cache.get_request_cache`."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        with request_cache_scope():
+            return self.get_response(request)
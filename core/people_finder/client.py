@@ -1,11 +1,15 @@
 import json
 import logging
+import queue
+import threading
+import time
 import urllib.parse
-from typing import Iterator, List, Optional, TypedDict
+from typing import Any, Iterator, List, Optional, TypedDict
 
 import requests
 from django.conf import settings
 from mohawk import Sender
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +18,10 @@ class FailedToGetPersonRecord(Exception):
     pass
 
 
+class PersonRecordNotFound(FailedToGetPersonRecord):
+    pass
+
+
 class Role(TypedDict):
     role: str
     team_name: str
@@ -47,84 +55,155 @@ def get_sender(url, content_type):
     )
 
 
-class PeopleFinderIterator(Iterator):
-    current_index: int = 0
-    items: List[Person] = []
-    current_url: Optional[str] = None
-    next_url: Optional[str] = None
+# Status codes that are worth retrying.
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+RETRY_BACKOFF_SECONDS = 0.5
 
-    def __iter__(self) -> Iterator:
-        # Initialise the iterator by making the first call to the API.
-        self.current_url = f"{settings.PEOPLE_FINDER_URL}/peoplefinder/api/person-api/"
-        try:
-            self.call_api()
-        except StopIteration:
-            pass
-        return self
+_thread_local = threading.local()
 
-    def __next__(self) -> Person:
-        value = self.get_next_item()
-        self.current_index += 1
-        return value
 
-    def get_next_item(self) -> Person:
-        # If there are no items in the object, stop the iteration.
-        if len(self.items) == 0:
-            raise StopIteration
+def get_session() -> requests.Session:
+    """Get a pooled HTTP session for the People Finder API.
 
-        # Get the next item from the object.
-        try:
-            value = self.items[self.current_index]
-        except IndexError:
-            # If the index is out of range, move to the next page.
-            self.next_page()
-            self.call_api()
-            value = self.get_next_item()
-
-        return value
-
-    def next_page(self) -> None:
-        if not self.next_url or self.current_url == self.next_url:
-            raise StopIteration
-        self.current_url = self.next_url
-
-    def call_api(self) -> None:
-        if not self.current_url:
-            raise StopIteration
-
-        self.current_index = 0
-
-        content_type = "application/json"
-        sender = get_sender(self.current_url, content_type)
-        response = requests.get(
-            self.current_url,
-            headers={
-                "Authorization": sender.request_header,
-                "Content-Type": content_type,
-            },
-        )
+    Sessions aren't guaranteed to be thread safe, so each thread gets its own.
+    """
+    session: Optional[requests.Session] = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return session
+
+
+def people_finder_get(url: str) -> requests.Response:
+    """Make a signed GET request to the People Finder API.
+
+    Connection errors, timeouts and responses with a status code in
+    RETRY_STATUS_CODES are retried with an exponential backoff. Each attempt
+    is signed separately as Hawk rejects replayed nonces.
+    """
+    content_type = "application/json"
+    max_retries: int = settings.PEOPLE_FINDER_MAX_RETRIES
 
-        if response.status_code != 200:
-            logger.error(
-                f"{response.status_code} response from People Finder API - '{self.current_url}'"
+    attempt = 0
+    while True:
+        sender = get_sender(url, content_type)
+        try:
+            response = get_session().get(
+                url,
+                headers={
+                    "Authorization": sender.request_header,
+                    "Content-Type": content_type,
+                },
+                timeout=settings.PEOPLE_FINDER_TIMEOUT,
             )
-            raise FailedToGetPersonRecord()
+        except (requests.ConnectionError, requests.Timeout):
+            # Out of retries, let the error through.
+            if attempt == max_retries:
+                raise
+            logger.warning(f"People Finder API request failed, retrying - '{url}'")
+        else:
+            # Out of retries, the caller handles the last response.
+            if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                return response
+            logger.warning(
+                f"{response.status_code} response from People Finder API, "
+                f"retrying - '{url}'"
+            )
+
+        time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+        attempt += 1
 
-        data = response.json()
-        self.items = data.get("results", [])
-        self.next_url = data.get("next")
+
+# Put on the page queue when there are no more pages.
+END_OF_PAGES = object()
+
+
+class PeopleFinderIterator(Iterator):
+    """Iterate over every person in People Finder.
+
+    Pages are fetched on a background thread, up to `prefetch_pages` ahead of
+    the page that is being consumed.
+    """
+
+    def __init__(self, prefetch_pages: Optional[int] = None) -> None:
+        if prefetch_pages is None:
+            prefetch_pages = settings.PEOPLE_FINDER_PREFETCH_PAGES
+        self.prefetch_pages: int = max(prefetch_pages, 1)
+        self.items: Iterator[Person] = iter([])
+        self.pages: queue.Queue = queue.Queue(maxsize=self.prefetch_pages)
+        self.stopped = threading.Event()
+        self.fetcher: Optional[threading.Thread] = None
+
+    def __iter__(self) -> Iterator:
+        if not self.fetcher:
+            self.fetcher = threading.Thread(target=self.fetch_pages, daemon=True)
+            self.fetcher.start()
+        return self
+
+    def __next__(self) -> Person:
+        while True:
+            try:
+                return next(self.items)
+            except StopIteration:
+                pass
+
+            page = self.pages.get()
+            if page is END_OF_PAGES:
+                raise StopIteration
+            if isinstance(page, Exception):
+                raise page
+            self.items = iter(page)
+
+    def close(self) -> None:
+        """Stop fetching pages, for when the iteration ends early."""
+        self.stopped.set()
+
+    def put_page(self, page: Any) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.pages.put(page, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_pages(self) -> None:
+        url: Optional[str] = (
+            f"{settings.PEOPLE_FINDER_URL}/peoplefinder/api/person-api/"
+        )
+        try:
+            while url:
+                response = people_finder_get(url)
+                if response.status_code != 200:
+                    logger.error(
+                        f"{response.status_code} response from People Finder API - '{url}'"
+                    )
+                    raise FailedToGetPersonRecord()
+
+                data = response.json()
+                if not self.put_page(data.get("results", [])):
+                    return
+
+                next_url = data.get("next")
+                url = next_url if next_url != url else None
+        except Exception as e:
+            self.put_page(e)
+        else:
+            self.put_page(END_OF_PAGES)
 
 
 def get_details(sso_legacy_user_id) -> Person:
     safe_id = urllib.parse.quote_plus(sso_legacy_user_id)
     url = f"{settings.PEOPLE_FINDER_URL}/peoplefinder/api/person-api/{safe_id}/"
 
-    content_type = "application/json"
-    sender = get_sender(url, content_type)
-    response = requests.get(
-        url,
-        headers={"Authorization": sender.request_header, "Content-Type": content_type},
-    )
+    response = people_finder_get(url)
+
+    if response.status_code == 404:
+        logger.info(f"No People Finder record - '{url}'")
+        raise PersonRecordNotFound()
 
     if response.status_code != 200:
         logger.error(
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional
 
+from django.conf import settings
+from django.core.cache import cache
+
+from activity_stream.models import ActivityStreamStaffSSOUser
 from core.people_finder.client import (
     FailedToGetPersonRecord,
     PeopleFinderIterator,
     Person,
+    PersonRecordNotFound,
     get_details,
 )
 
@@ -35,6 +40,10 @@ class PeopleFinderBase(ABC):
     def get_all(self) -> Iterable[PersonDetail]:
         raise NotImplementedError
 
+    def warm_cache(self, people: Iterable[PersonDetail]) -> None:
+        """Cache the results of `get_all` so `get_details` doesn't need to call out."""
+        pass
+
 
 class PeopleFinderStubbed(PeopleFinderBase):
     def get_details(self, sso_legacy_user_id: str) -> PersonDetail:
@@ -86,18 +95,70 @@ class PeopleFinderPersonNotFound(Exception):
     pass
 
 
+# Cached in place of a PersonDetail when People Finder has no record.
+PERSON_NOT_FOUND = "person_not_found"
+
+
+def get_person_detail_cache_key(sso_legacy_user_id: str) -> str:
+    return f"people_finder_person_{sso_legacy_user_id}"
+
+
 class PeopleFinder(PeopleFinderBase):
     def get_details(self, sso_legacy_user_id: str) -> PersonDetail:
+        # Check if there is a cached result
+        cache_key = get_person_detail_cache_key(sso_legacy_user_id)
+        cached_result = cache.get(cache_key)
+        if cached_result == PERSON_NOT_FOUND:
+            raise PeopleFinderPersonNotFound()
+        if cached_result:
+            return cached_result
+
         try:
             person = get_details(sso_legacy_user_id)
+        except PersonRecordNotFound:
+            # Remember that there is no record, but not for as long as a hit.
+            cache.set(
+                cache_key,
+                PERSON_NOT_FOUND,
+                timeout=settings.PEOPLE_FINDER_NOT_FOUND_CACHE_TIMEOUT,
+            )
+            raise PeopleFinderPersonNotFound()
         except FailedToGetPersonRecord:
             raise PeopleFinderPersonNotFound()
 
-        return self._convert_to_person_detail(person)
+        person_detail = self._convert_to_person_detail(person)
+
+        # Store the result in the cache
+        cache.set(
+            cache_key, person_detail, timeout=settings.PEOPLE_FINDER_CACHE_TIMEOUT
+        )
+        return person_detail
+
+    def warm_cache(self, people: Iterable[PersonDetail]) -> None:
+        people_by_sso_user_id: Dict[str, PersonDetail] = {
+            person.sso_user_id: person for person in people if person.sso_user_id
+        }
+        # People Finder identifies people by their email user id, but
+        # `get_details` is called with the legacy SSO id.
+        legacy_user_ids = ActivityStreamStaffSSOUser.objects.filter(
+            email_user_id__in=people_by_sso_user_id.keys()
+        ).values_list("email_user_id", "user_id")
+
+        cached_people: Dict[str, PersonDetail] = {}
+        for email_user_id, legacy_user_id in legacy_user_ids:
+            cache_key = get_person_detail_cache_key(legacy_user_id)
+            cached_people[cache_key] = people_by_sso_user_id[email_user_id]
+
+        cache.set_many(cached_people, timeout=settings.PEOPLE_FINDER_CACHE_TIMEOUT)
 
     def get_all(self) -> Iterable[PersonDetail]:
-        for person in PeopleFinderIterator():
-            yield self._convert_to_person_detail(person)
+        people = PeopleFinderIterator()
+        try:
+            for person in people:
+                yield self._convert_to_person_detail(person)
+        finally:
+            # Stop prefetching pages if the caller doesn't consume them all.
+            people.close()
 
     @staticmethod
     def _convert_to_person_detail(person: Person) -> PersonDetail:
@@ -0,0 +1,117 @@
+from unittest import mock
+
+import requests
+import responses
+from django.test import TestCase, override_settings
+
+from core.people_finder.client import (
+    FailedToGetPersonRecord,
+    PeopleFinderIterator,
+    get_details,
+)
+
+PEOPLE_FINDER_URL = "https://fake-people-finder.domain"
+PERSON_API_URL = f"{PEOPLE_FINDER_URL}/peoplefinder/api/person-api/"
+
+
+def fake_person(sso_user_id: str):
+    return {
+        "sso_user_id": sso_user_id,
+        "first_name": "Joe",  # /PS-IGNORE
+        "last_name": "Bloggs",
+        "roles": [],
+        "email": "joe.bloggs@example.com",  # /PS-IGNORE
+        "primary_phone_number": None,
+        "grade": None,
+        "photo": None,
+        "photo_small": None,
+    }
+
+
+@override_settings(PEOPLE_FINDER_URL=PEOPLE_FINDER_URL, PEOPLE_FINDER_MAX_RETRIES=2)
+@mock.patch("core.people_finder.client.time.sleep")
+class TestPeopleFinderClient(TestCase):
+    @responses.activate
+    def test_iterator_pages(self, mock_sleep):
+        responses.add(
+            responses.GET,
+            PERSON_API_URL,
+            json={
+                "results": [fake_person("1"), fake_person("2")],
+                "next": f"{PERSON_API_URL}?page=2",
+            },
+            match=[responses.matchers.query_string_matcher("")],
+        )
+        responses.add(
+            responses.GET,
+            f"{PERSON_API_URL}?page=2",
+            json={"results": [fake_person("3")], "next": None},
+            match=[responses.matchers.query_string_matcher("page=2")],
+        )
+
+        people = list(PeopleFinderIterator(prefetch_pages=1))
+
+        self.assertEqual([person["sso_user_id"] for person in people], ["1", "2", "3"])
+        # Each request is signed separately.
+        authorization_headers = {
+            call.request.headers["Authorization"] for call in responses.calls
+        }
+        self.assertEqual(len(authorization_headers), 2)
+
+    @responses.activate
+    def test_iterator_retries(self, mock_sleep):
+        responses.add(responses.GET, PERSON_API_URL, status=503)
+        responses.add(
+            responses.GET,
+            PERSON_API_URL,
+            json={"results": [fake_person("1")], "next": None},
+        )
+
+        people = list(PeopleFinderIterator())
+
+        self.assertEqual(len(people), 1)
+        self.assertEqual(len(responses.calls), 2)
+        mock_sleep.assert_called_once()
+
+    @responses.activate
+    def test_iterator_error(self, mock_sleep):
+        responses.add(responses.GET, PERSON_API_URL, status=403)
+
+        with self.assertRaises(FailedToGetPersonRecord):
+            list(PeopleFinderIterator())
+        # Client errors aren't retried.
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_iterator_close(self, mock_sleep):
+        responses.add(
+            responses.GET,
+            PERSON_API_URL,
+            json={"results": [fake_person("1")], "next": PERSON_API_URL + "?page=2"},
+        )
+
+        people = iter(PeopleFinderIterator(prefetch_pages=1))
+        next(people)
+        people.close()
+        people.fetcher.join(timeout=5)
+
+        self.assertFalse(people.fetcher.is_alive())
+
+    @responses.activate
+    def test_get_details_retries_connection_errors(self, mock_sleep):
+        url = f"{PERSON_API_URL}123/"
+        responses.add(responses.GET, url, body=requests.ConnectionError())
+        responses.add(responses.GET, url, body=requests.ConnectionError())
+        responses.add(responses.GET, url, json=fake_person("123"))
+
+        self.assertEqual(get_details("123")["sso_user_id"], "123")
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @responses.activate
+    def test_get_details_gives_up(self, mock_sleep):
+        url = f"{PERSON_API_URL}123/"
+        responses.add(responses.GET, url, status=502)
+
+        with self.assertRaises(FailedToGetPersonRecord):
+            get_details("123")
+        self.assertEqual(len(responses.calls), 3)
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from activity_stream.factories import ActivityStreamStaffSSOUserFactory
+from core.people_finder.client import FailedToGetPersonRecord, PersonRecordNotFound
+from core.people_finder.interfaces import (
+    PeopleFinder,
+    PeopleFinderPersonNotFound,
+    PersonDetail,
+)
+
+
+def fake_person(sso_user_id: str):
+    return {
+        "sso_user_id": sso_user_id,
+        "first_name": "Joe",  # /PS-IGNORE
+        "last_name": "Bloggs",
+        "roles": [{"role": "Developer", "team_name": "DDaT"}],
+        "email": "joe.bloggs@example.com",  # /PS-IGNORE
+        "primary_phone_number": None,
+        "grade": None,
+        "photo": None,
+        "photo_small": None,
+    }
+
+
+@mock.patch("core.people_finder.interfaces.get_details")
+class TestPeopleFinderGetDetails(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_caches_hits(self, mock_get_details):
+        mock_get_details.return_value = fake_person("joe")
+
+        person_detail = PeopleFinder().get_details(sso_legacy_user_id="123")
+        self.assertEqual(person_detail.job_title, "Developer")
+        self.assertEqual(
+            PeopleFinder().get_details(sso_legacy_user_id="123"), person_detail
+        )
+        mock_get_details.assert_called_once_with("123")
+
+    def test_caches_not_found(self, mock_get_details):
+        mock_get_details.side_effect = PersonRecordNotFound()
+
+        for _ in range(2):
+            with self.assertRaises(PeopleFinderPersonNotFound):
+                PeopleFinder().get_details(sso_legacy_user_id="123")
+        mock_get_details.assert_called_once_with("123")
+
+    def test_does_not_cache_failures(self, mock_get_details):
+        mock_get_details.side_effect = FailedToGetPersonRecord()
+
+        for _ in range(2):
+            with self.assertRaises(PeopleFinderPersonNotFound):
+                PeopleFinder().get_details(sso_legacy_user_id="123")
+        self.assertEqual(mock_get_details.call_count, 2)
+
+    def test_warm_cache(self, mock_get_details):
+        sso_user = ActivityStreamStaffSSOUserFactory()
+        person_detail = PersonDetail(
+            sso_user_id=sso_user.email_user_id,
+            first_name="Joe",  # /PS-IGNORE
+            last_name="Bloggs",
+            job_title="Developer",
+            directorate="DDaT",
+            email="joe.bloggs@example.com",  # /PS-IGNORE
+            phone=None,
+            grade=None,
+            photo=None,
+            photo_small=None,
+        )
+
+        PeopleFinder().warm_cache([person_detail])
+
+        self.assertEqual(
+            PeopleFinder().get_details(sso_legacy_user_id=sso_user.user_id),
+            person_detail,
+        )
+        mock_get_details.assert_not_called()
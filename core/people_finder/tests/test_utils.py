@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+
+from core.people_finder.interfaces import PersonDetail
+from core.people_finder.utils import (
+    get_people_finder_staff_document_data,
+    index_people_finder_results,
+    ingest_people_finder,
+)
+from core.staff_search.models import StaffDirectoryEntry
+
+
+def fake_person_detail(sso_user_id: str, job_title: str = "Developer") -> PersonDetail:
+    return PersonDetail(
+        sso_user_id=sso_user_id,
+        first_name="Joe",  # /PS-IGNORE
+        last_name="Bloggs",
+        job_title=job_title,
+        directorate="DDaT",
+        email=f"{sso_user_id}@example.com",  # /PS-IGNORE
+        phone=None,
+        grade=None,
+        photo=None,
+        photo_small=None,
+    )
+
+
+def create_staff_directory_entry(person_detail: PersonDetail) -> None:
+    StaffDirectoryEntry.objects.create(
+        uuid=person_detail.sso_user_id,
+        staff_sso_email_user_id=person_detail.sso_user_id,
+        staff_sso_first_name="Joe",
+        staff_sso_last_name="Bloggs",
+        staff_sso_email_addresses=[person_detail.email],
+        **get_people_finder_staff_document_data(person_detail),
+    )
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.get_search_connection")
+@mock.patch("core.utils.staff_index.bulk", return_value=(0, []))
+def test_index_people_finder_results_skips_unchanged(
+    mock_bulk, mock_get_search_connection
+):
+    unchanged = fake_person_detail("unchanged")
+    changed = fake_person_detail("changed")
+    create_staff_directory_entry(unchanged)
+    create_staff_directory_entry(changed)
+    changed.job_title = "Senior Developer"
+
+    updated_count = index_people_finder_results(
+        [unchanged, changed, fake_person_detail("new"), fake_person_detail("")]
+    )
+
+    assert updated_count == 2
+    actions = mock_bulk.call_args.args[1]
+    assert [action["_id"] for action in actions] == ["changed", "new"]
+    assert actions[0]["doc"]["people_finder_job_title"] == "Senior Developer"
+    assert not actions[0]["doc_as_upsert"]
+    assert (
+        StaffDirectoryEntry.objects.get(
+            staff_sso_email_user_id="changed"
+        ).people_finder_job_title
+        == "Senior Developer"
+    )
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.get_search_connection")
+@mock.patch("core.utils.staff_index.bulk", return_value=(0, []))
+def test_index_people_finder_results_all_unchanged(
+    mock_bulk, mock_get_search_connection
+):
+    person_detail = fake_person_detail("unchanged")
+    create_staff_directory_entry(person_detail)
+
+    assert index_people_finder_results([person_detail]) == 0
+    mock_bulk.assert_not_called()
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.get_search_connection")
+@mock.patch("core.utils.staff_index.bulk")
+def test_index_people_finder_results_failed_update(
+    mock_bulk, mock_get_search_connection
+):
+    changed = fake_person_detail("changed")
+    create_staff_directory_entry(changed)
+    changed.job_title = "Senior Developer"
+    mock_bulk.return_value = (
+        0,
+        [{"update": {"_id": "changed", "status": 429, "error": "Rejected"}}],
+    )
+
+    index_people_finder_results([changed])
+
+    # The directory isn't updated, so the person is updated again next time.
+    assert (
+        StaffDirectoryEntry.objects.get(
+            staff_sso_email_user_id="changed"
+        ).people_finder_job_title
+        == "Developer"
+    )
+    mock_bulk.return_value = (1, [])
+    assert index_people_finder_results([changed]) == 1
+
+
+@mock.patch("core.people_finder.utils.CHUNK_SIZE", 2)
+@mock.patch("core.people_finder.utils.index_people_finder_results", return_value=0)
+@mock.patch("core.people_finder.utils.get_people_finder_interface")
+def test_ingest_people_finder_chunks(
+    mock_get_people_finder_interface, mock_index_people_finder_results
+):
+    people_finder = mock_get_people_finder_interface.return_value
+    people = [fake_person_detail(f"person-{i}") for i in range(5)]
+    people_finder.get_all.return_value = iter(people)
+
+    ingest_people_finder(limit=4)
+
+    chunks = [people[0:2], people[2:4]]
+    assert [c.args[0] for c in people_finder.warm_cache.call_args_list] == chunks
+    assert [
+        c.args[0] for c in mock_index_people_finder_results.call_args_list
+    ] == chunks
@@ -1,22 +1,33 @@
 import logging
-from typing import Optional
-
-from opensearchpy.exceptions import NotFoundError
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
 
 from core.people_finder import get_people_finder_interface
 from core.people_finder.interfaces import PersonDetail
-from core.utils.staff_index import update_staff_document
+from core.staff_search.models import StaffDirectoryEntry
+from core.utils.staff_index import bulk_update_staff_documents
 
 logger = logging.getLogger(__name__)
 
+CHUNK_SIZE = 100
 
-def index_people_finder_result(people_finder_result: PersonDetail) -> None:
-    sso_user_id = people_finder_result.sso_user_id
+PEOPLE_FINDER_DOCUMENT_FIELDS: List[str] = [
+    "people_finder_photo",
+    "people_finder_photo_small",
+    "people_finder_first_name",
+    "people_finder_last_name",
+    "people_finder_job_title",
+    "people_finder_directorate",
+    "people_finder_phone",
+    "people_finder_grade",
+    "people_finder_email",
+]
 
-    if not sso_user_id:
-        return
 
-    mapped_data = {
+def get_people_finder_staff_document_data(
+    people_finder_result: PersonDetail,
+) -> Dict[str, Any]:
+    return {
         "people_finder_photo": people_finder_result.photo,
         "people_finder_photo_small": people_finder_result.photo_small,
         "people_finder_first_name": people_finder_result.first_name,
@@ -28,31 +39,66 @@ def index_people_finder_result(people_finder_result: PersonDetail) -> None:
         "people_finder_email": people_finder_result.email,
     }
 
-    update_staff_document(id=sso_user_id, staff_document=mapped_data)
+
+def index_people_finder_results(people_finder_results: Iterable[PersonDetail]) -> int:
+    """Index the People Finder data for a batch of people.
+
+    People whose People Finder data matches what is already stored in the
+    staff directory are skipped, the rest are sent in a single bulk request.
+
+    Returns:
+        int: The number of staff documents that were updated.
+    """
+    mapped_data: Dict[str, Dict[str, Any]] = {
+        people_finder_result.sso_user_id: get_people_finder_staff_document_data(
+            people_finder_result
+        )
+        for people_finder_result in people_finder_results
+        if people_finder_result.sso_user_id
+    }
+
+    stored_data = StaffDirectoryEntry.objects.filter(
+        staff_sso_email_user_id__in=mapped_data.keys()
+    ).values("staff_sso_email_user_id", *PEOPLE_FINDER_DOCUMENT_FIELDS)
+    for stored in stored_data:
+        sso_user_id = stored.pop("staff_sso_email_user_id")
+        if mapped_data[sso_user_id] == stored:
+            del mapped_data[sso_user_id]
+
+    bulk_update_staff_documents(mapped_data)
+    return len(mapped_data)
 
 
 def ingest_people_finder(limit: Optional[int] = None) -> None:
     """Ingests staff data from the People Finder API.
 
+    The results are processed in chunks, each chunk is used to warm the
+    `get_details` cache and then indexed.
+
     Args:
         limit: The max number of records to process.
     """
     people_finder = get_people_finder_interface()
-    people_finder_results = people_finder.get_all()
+    people_finder_results = iter(people_finder.get_all())
+    if limit:
+        people_finder_results = islice(people_finder_results, limit)
 
     count = 0
+    updated_count = 0
 
-    for people_finder_result in people_finder_results:
-        if limit and count >= limit:
-            break
+    while chunk := list(islice(people_finder_results, CHUNK_SIZE)):
+        count += len(chunk)
+        people_finder.warm_cache(chunk)
 
         try:
-            index_people_finder_result(people_finder_result=people_finder_result)
-        except NotFoundError:
-            continue
+            updated_count += index_people_finder_results(chunk)
         except Exception:
             logger.exception(
-                "An error occured whilst indexing %s", people_finder_result.sso_user_id
+                "An error occured whilst indexing %s",
+                ", ".join(filter(None, (result.sso_user_id for result in chunk))),
             )
-        finally:
-            count += 1
+
+    logger.info(
+        f"Indexed People Finder data: {updated_count} updated, "
+        f"{count - updated_count} unchanged or skipped"
+    )
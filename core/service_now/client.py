@@ -1,9 +1,12 @@
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, Iterable, Iterator, List, Optional
 from urllib.parse import urlencode, urlparse, urlunparse
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +25,39 @@ class ServiceNowException(Exception):
         return super().__str__() + f" (HTTP {self.status_code} {path_with_query})"
 
 
+_thread_local = threading.local()
+
+# Fetches the next page of results while the current page is being consumed.
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="service_now_prefetch"
+)
+
+
+def get_session() -> requests.Session:
+    """Get a pooled HTTP session for the Service Now API.
+
+    Sessions aren't guaranteed to be thread safe, so each thread gets its own.
+    """
+    session: Optional[requests.Session] = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return session
+
+
 class ServiceNowResults(Iterator):
-    current_index: int = 0
-    items: List[Any] = []
-    current_url: Optional[str] = None
-    next_url: Optional[str] = None
+    """Iterate over the results of a Service Now API table query.
+
+    Results are requested `page_size` at a time, the iteration stops at the
+    first page that isn't full. With `prefetch`, the next page is requested
+    while the current page is being consumed.
+
+    Note: `page_size` must not be larger than the max number of records the
+    Service Now instance returns per request.
+    """
 
     def __init__(
         self,
@@ -34,85 +65,83 @@ class ServiceNowResults(Iterator):
         path: str,
         sysparm_query: Optional[str] = None,
         sysparm_fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: Optional[bool] = None,
     ) -> None:
         super().__init__()
 
         self.url = url
         self.path = path
-        # Initialise the iterator by making the first call to the API.
         self.url_parts = list(urlparse(self.url + self.path))
+        self.page_size: int = page_size or settings.SERVICE_NOW_PAGE_SIZE
+        self.prefetch: bool = (
+            settings.SERVICE_NOW_PREFETCH if prefetch is None else prefetch
+        )
         self.query: Dict[str, Any] = {
-            "sysparm_limit": 100,
+            "sysparm_limit": self.page_size,
             "sysparm_offset": 0,
+            "sysparm_no_count": "true",
         }
         if sysparm_fields:
             self.query["sysparm_fields"] = ",".join(sysparm_fields)
         if sysparm_query:
             self.query["sysparm_query"] = sysparm_query
+        # No requests are made until the first item is requested.
+        self.items: Iterator[Any] = self.get_items()
 
     def __iter__(self):
-        # Build the current URL
-        self.url_parts[4] = urlencode(self.query)
-        self.current_url = urlunparse(self.url_parts)
-        try:
-            self.call_api()
-        except StopIteration:
-            pass
         return self
 
     def __next__(self) -> Any:
-        value = self.get_next_item()
-        self.current_index += 1
-        return value
+        return next(self.items)
 
-    def get_next_item(self):
-        # If there are no items in the object, stop the iteration.
-        if len(self.items) == 0:
-            raise StopIteration
+    def get_items(self) -> Iterator[Any]:
+        offset = 0
+        next_page: Optional[Future] = None
 
-        # Get the next item from the object.
         try:
-            value = self.items[self.current_index]
-        except IndexError:
-            # If the index is out of range, move to the next page.
-            self.next_page()
-            self.call_api()
-            value = self.get_next_item()
-
-        return value
-
-    def next_page(self):
-        if not self.next_url or self.current_url == self.next_url:
-            raise StopIteration
-        self.current_url = self.next_url
-
-    def call_api(self):
-        if not self.current_url:
-            raise StopIteration
-
-        self.current_index = 0
-
-        # Make request
-        response = requests.get(self.current_url)
+            while True:
+                if next_page:
+                    page = next_page.result()
+                    next_page = None
+                else:
+                    page = self.get_page(offset)
+
+                # A short page is the last page.
+                if len(page) < self.page_size:
+                    yield from page
+                    return
+
+                offset += self.page_size
+                if self.prefetch:
+                    next_page = _prefetch_executor.submit(self.get_page, offset)
+
+                yield from page
+        finally:
+            if next_page:
+                next_page.cancel()
+
+    def get_page(self, offset: int) -> List[Any]:
+        query = {**self.query, "sysparm_offset": offset}
+        url_parts = self.url_parts.copy()
+        url_parts[4] = urlencode(query)
+
+        response = get_session().get(
+            urlunparse(url_parts), timeout=settings.SERVICE_NOW_TIMEOUT
+        )
         if response.status_code != 200:
-            # Note: Do not include query_url in the error message, as it
+            # Note: Do not include the URL in the error message, as it
             # contains the username and password.
             service_now_exception = ServiceNowException(
                 "Failed to get results from Service Now API",
                 status_code=response.status_code,
                 path=self.path,
-                query=self.query,
+                query=query,
             )
             logger.exception(service_now_exception)
             raise service_now_exception
 
-        content = response.json()
-        self.items = content.get("result", [])
-
-        # Build the next URL
-        self.query["sysparm_offset"] += 100
-        self.url_parts[4] = urlencode(self.query)
-        self.next_url = urlunparse(self.url_parts)
+        return response.json().get("result", [])
 
 
 class ServiceNowClient:
@@ -135,4 +164,5 @@ class ServiceNowClient:
         )
 
     def post(self, path: str, *args, **kwargs):
-        return requests.post(self.url + path, *args, **kwargs)
+        kwargs.setdefault("timeout", settings.SERVICE_NOW_TIMEOUT)
+        return get_session().post(self.url + path, *args, **kwargs)
@@ -1,8 +1,9 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from itertools import islice
 from random import choice
-from typing import TYPE_CHECKING, Iterable, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from django.conf import settings
 from django.core.cache import cache
@@ -10,6 +11,7 @@ from django.core.cache import cache
 from activity_stream.models import ActivityStreamStaffSSOUser
 from core.service_now import types
 from core.service_now.client import ServiceNowClient
+from core.utils.cache import get_cached_value
 from core.utils.helpers import DATE_FORMAT_STR
 from leavers import types as leavers_types
 
@@ -18,6 +20,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Cache timeouts (in seconds) for the Service Now lookups.
+ASSET_CACHE_TIMEOUT = 60 * 60
+ASSETS_FOR_USER_CACHE_TIMEOUT = 60 * 5
+USERS_CACHE_TIMEOUT = 60 * 60
+DIRECTORATES_CACHE_TIMEOUT = 60 * 60 * 24
+NOT_FOUND_CACHE_TIMEOUT = 60 * 5
+# How long a value can be served for while it is refreshed.
+STALE_CACHE_TIMEOUT = 60 * 60
+
 
 class ServiceNowUserNotFound(Exception):
     pass
@@ -40,6 +51,10 @@ class ServiceNowBase(ABC):
     def get_user(self, email: str) -> types.UserDetails:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_users_by_email(self, emails: Iterable[str]) -> Dict[str, types.UserDetails]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_departments(
         self, sys_id: Optional[str] = None
@@ -108,6 +123,15 @@ class ServiceNowStubbed(ServiceNowBase):
                 return user
         raise ServiceNowUserNotFound()
 
+    def get_users_by_email(self, emails: Iterable[str]) -> Dict[str, types.UserDetails]:
+        logger.debug("Getting users by email")
+        users_by_email: Dict[str, types.UserDetails] = {}
+        for email in emails:
+            for user in self.get_users(email=email):
+                if user["email"] == email:
+                    users_by_email.setdefault(email, user)
+        return users_by_email
+
     def get_departments(
         self, sys_id: Optional[str] = None
     ) -> List[types.DepartmentDetails]:
@@ -164,6 +188,9 @@ class TooManyAssetsReturned(Exception):
 
 
 class ServiceNowInterface(ServiceNowBase):
+    # Keep the `emailIN` query short enough for the URL.
+    USER_EMAIL_CHUNK_SIZE = 50
+
     def __init__(self, *args, **kwargs):
         self.GET_USER_PATH = settings.SERVICE_NOW_GET_USER_PATH
         self.GET_ASSET_PATH = settings.SERVICE_NOW_GET_ASSET_PATH
@@ -172,12 +199,16 @@ class ServiceNowInterface(ServiceNowBase):
         self.client = ServiceNowClient()
 
     def get_asset_by_tag(self, asset_tag: str) -> types.AssetDetails:
-        # Check if there is a cached result
-        cache_key: str = f"asset_{asset_tag}"
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        return get_cached_value(
+            f"service_now_asset_{asset_tag}",
+            lambda: self.fetch_asset_by_tag(asset_tag=asset_tag),
+            timeout=ASSET_CACHE_TIMEOUT,
+            stale_timeout=STALE_CACHE_TIMEOUT,
+            not_found=AssetNotFound,
+            not_found_timeout=NOT_FOUND_CACHE_TIMEOUT,
+        )
 
+    def fetch_asset_by_tag(self, asset_tag: str) -> types.AssetDetails:
         # Get all data from Service Now /PS-IGNORE
         service_now_assets: Iterable[types.ServiceNowAsset] = self.client.get_results(
             path=self.GET_ASSET_PATH,
@@ -205,19 +236,17 @@ class ServiceNowInterface(ServiceNowBase):
         if asset_count != 1:
             raise TooManyAssetsReturned
 
-        asset_detail: types.AssetDetails = asset_details[0]
-
-        # Store the result in the cache
-        cache.set(cache_key, asset_detail)
-        return asset_detail
+        return asset_details[0]
 
     def get_assets_for_user(self, email: str) -> List[types.AssetDetails]:
-        # Check if there is a cached result
-        cache_key: str = f"assets_for_user_{email}"
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        return get_cached_value(
+            f"service_now_assets_for_user_{email}",
+            lambda: self.fetch_assets_for_user(email=email),
+            timeout=ASSETS_FOR_USER_CACHE_TIMEOUT,
+            stale_timeout=STALE_CACHE_TIMEOUT,
+        )
 
+    def fetch_assets_for_user(self, email: str) -> List[types.AssetDetails]:
         # Get all data from Service Now /PS-IGNORE
         service_now_assets: Iterable[types.ServiceNowAsset] = self.client.get_results(
             path=self.GET_ASSET_PATH,
@@ -237,18 +266,17 @@ class ServiceNowInterface(ServiceNowBase):
             }
             for service_now_asset in service_now_assets
         ]
-
-        # Store the result in the cache
-        cache.set(cache_key, asset_details)
         return asset_details
 
     def get_users(self, email: str) -> List[types.UserDetails]:
-        # Check if there is a cached result
-        cache_key: str = f"get_users_{email}"
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        return get_cached_value(
+            f"service_now_users_{email}",
+            lambda: self.fetch_users(email=email),
+            timeout=USERS_CACHE_TIMEOUT,
+            stale_timeout=STALE_CACHE_TIMEOUT,
+        )
 
+    def fetch_users(self, email: str) -> List[types.UserDetails]:
         # Get all data from Service Now /PS-IGNORE
         service_now_users: Iterable[types.ServiceNowUser] = self.client.get_results(
             path=self.GET_USER_PATH,
@@ -272,8 +300,6 @@ class ServiceNowInterface(ServiceNowBase):
             }
             users_details.append(user_details)
 
-        # Store the result in the cache
-        cache.set(cache_key, users_details)
         return users_details
 
     def get_user(self, email: str) -> types.UserDetails:
@@ -283,6 +309,39 @@ class ServiceNowInterface(ServiceNowBase):
                 return user
         raise ServiceNowUserNotFound()
 
+    def get_users_by_email(self, emails: Iterable[str]) -> Dict[str, types.UserDetails]:
+        """Get the Service Now users for many email addresses.
+
+        The emails are looked up with `emailIN` queries, in chunks of
+        `USER_EMAIL_CHUNK_SIZE`, and the results are keyed by email address.
+        Emails without a Service Now user are left out of the result.
+        """
+        users_by_email: Dict[str, types.UserDetails] = {}
+        # Commas separate the values of an IN query.
+        emails_iterator = iter(sorted({email for email in emails if "," not in email}))
+
+        while chunk := list(islice(emails_iterator, self.USER_EMAIL_CHUNK_SIZE)):
+            service_now_users: Iterable[types.ServiceNowUser] = self.client.get_results(
+                path=self.GET_USER_PATH,
+                sysparm_query=f"emailIN{','.join(chunk)}",
+                sysparm_fields=[
+                    "sys_id",
+                    "name",
+                    "email",
+                    "manager",
+                ],
+            )
+            for service_now_user in service_now_users:
+                user_details: types.UserDetails = {
+                    "sys_id": service_now_user["sys_id"],
+                    "name": service_now_user["name"],
+                    "email": str(service_now_user["email"]).lower(),
+                    "manager": service_now_user.get("manager"),
+                }
+                users_by_email.setdefault(user_details["email"], user_details)
+
+        return users_by_email
+
     def get_departments(
         self, sys_id: Optional[str] = None
     ) -> List[types.DepartmentDetails]:
@@ -316,12 +375,16 @@ class ServiceNowInterface(ServiceNowBase):
     def get_directorates(
         self, sys_id: Optional[str] = None, name: Optional[str] = None
     ) -> List[types.DirectorateDetails]:
-        # Check if there is a cached result
-        cache_key: str = f"get_directorates{sys_id}_{name}"
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        return get_cached_value(
+            f"service_now_directorates_{sys_id}_{name}",
+            lambda: self.fetch_directorates(sys_id=sys_id, name=name),
+            timeout=DIRECTORATES_CACHE_TIMEOUT,
+            stale_timeout=STALE_CACHE_TIMEOUT,
+        )
 
+    def fetch_directorates(
+        self, sys_id: Optional[str] = None, name: Optional[str] = None
+    ) -> List[types.DirectorateDetails]:
         query = ""
         if sys_id:
             query = f"sys_id={sys_id}"
@@ -347,9 +410,6 @@ class ServiceNowInterface(ServiceNowBase):
             }
             for service_now_directorate in service_now_directorates
         ]
-
-        # Store the result in the cache
-        cache.set(cache_key, directorate_details)
         return directorate_details
 
     def submit_leaver_request(
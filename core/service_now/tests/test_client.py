@@ -0,0 +1,75 @@
+import pytest
+import responses
+from django.test import TestCase, override_settings
+from responses import matchers
+
+from core.service_now.client import ServiceNowException, ServiceNowResults
+
+SERVICE_NOW_API_URL = "https://fake-service-now.domain"
+USER_PATH = "/api/now/table/sys_user"
+USER_URL = f"{SERVICE_NOW_API_URL}{USER_PATH}"
+
+
+def add_page(offset: int, result):
+    responses.add(
+        responses.GET,
+        USER_URL,
+        match=[
+            matchers.query_param_matcher(
+                {
+                    "sysparm_limit": "2",
+                    "sysparm_offset": str(offset),
+                    "sysparm_no_count": "true",
+                    "sysparm_query": "active=true",
+                }
+            )
+        ],
+        json={"result": result},
+    )
+
+
+@override_settings(SERVICE_NOW_PAGE_SIZE=2)
+class TestServiceNowResults(TestCase):
+    def get_results(self, prefetch: bool):
+        return ServiceNowResults(
+            url=SERVICE_NOW_API_URL,
+            path=USER_PATH,
+            sysparm_query="active=true",
+            prefetch=prefetch,
+        )
+
+    @responses.activate
+    def test_stops_at_short_page(self):
+        add_page(0, [{"sys_id": "1"}, {"sys_id": "2"}])
+        add_page(2, [{"sys_id": "3"}])
+
+        for prefetch in [False, True]:
+            with self.subTest(prefetch=prefetch):
+                responses.calls.reset()
+                results = list(self.get_results(prefetch=prefetch))
+
+                self.assertEqual([r["sys_id"] for r in results], ["1", "2", "3"])
+                self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_stops_at_empty_page(self):
+        add_page(0, [{"sys_id": "1"}, {"sys_id": "2"}])
+        add_page(2, [])
+
+        results = list(self.get_results(prefetch=True))
+
+        self.assertEqual([r["sys_id"] for r in results], ["1", "2"])
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_no_requests_until_iterated(self):
+        self.get_results(prefetch=True)
+
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_error(self):
+        responses.add(responses.GET, USER_URL, status=500)
+
+        with pytest.raises(ServiceNowException):
+            list(self.get_results(prefetch=False))
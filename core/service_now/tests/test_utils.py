@@ -0,0 +1,143 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from activity_stream.factories import (
+    ActivityStreamStaffSSOUserEmailFactory,
+    ActivityStreamStaffSSOUserFactory,
+)
+from activity_stream.models import ActivityStreamStaffSSOUser
+from core.service_now.interfaces import ServiceNowInterface
+from core.service_now.utils import ingest_service_now
+
+
+def fake_service_now_user(sys_id: str, email: str):
+    return {"sys_id": sys_id, "name": sys_id, "email": email, "manager": None}
+
+
+@mock.patch("core.service_now.utils.get_service_now_interface")
+class TestIngestServiceNow(TestCase):
+    def setUp(self):
+        self.sso_user = ActivityStreamStaffSSOUserFactory()
+        self.email = self.sso_user.sso_emails.first().email_address
+
+    def test_resolves_users_in_one_lookup(self, mock_get_service_now_interface):
+        other_sso_user = ActivityStreamStaffSSOUserFactory()
+        service_now_interface = mock_get_service_now_interface.return_value
+        service_now_interface.get_users_by_email.return_value = {
+            self.email: fake_service_now_user("sys-1", self.email),
+        }
+
+        ingest_service_now()
+
+        service_now_interface.get_users_by_email.assert_called_once()
+        self.assertCountEqual(
+            service_now_interface.get_users_by_email.call_args.kwargs["emails"],
+            [self.email, other_sso_user.sso_emails.first().email_address],
+        )
+        self.sso_user.refresh_from_db()
+        self.assertEqual(self.sso_user.service_now_user_id, "sys-1")
+        self.assertEqual(self.sso_user.service_now_email_address, self.email)
+        other_sso_user.refresh_from_db()
+        self.assertIsNone(other_sso_user.service_now_user_id)
+
+    def test_prefers_previous_service_now_email(self, mock_get_service_now_interface):
+        previous_email = "previous@example.com"  # /PS-IGNORE
+        self.sso_user.service_now_email_address = previous_email
+        self.sso_user.save()
+        mock_get_service_now_interface.return_value.get_users_by_email.return_value = {
+            self.email: fake_service_now_user("sys-1", self.email),
+            previous_email: fake_service_now_user("sys-2", previous_email),
+        }
+
+        ingest_service_now()
+
+        self.sso_user.refresh_from_db()
+        self.assertEqual(self.sso_user.service_now_user_id, "sys-2")
+        self.assertEqual(self.sso_user.service_now_email_address, previous_email)
+
+    def test_recently_verified_users_skipped(self, mock_get_service_now_interface):
+        service_now_interface = mock_get_service_now_interface.return_value
+        service_now_interface.get_users_by_email.return_value = {
+            self.email: fake_service_now_user("sys-1", self.email),
+        }
+        ingest_service_now()
+        service_now_interface.get_users_by_email.reset_mock()
+
+        ingest_service_now()
+
+        service_now_interface.get_users_by_email.assert_not_called()
+        self.sso_user.refresh_from_db()
+        self.assertEqual(self.sso_user.service_now_verified_emails, [self.email])
+
+    def test_not_found_users_resolved_again(self, mock_get_service_now_interface):
+        service_now_interface = mock_get_service_now_interface.return_value
+        service_now_interface.get_users_by_email.return_value = {}
+        ingest_service_now()
+        self.sso_user.refresh_from_db()
+        self.assertIsNone(self.sso_user.service_now_verified_at)
+        service_now_interface.get_users_by_email.reset_mock()
+
+        ingest_service_now()
+
+        service_now_interface.get_users_by_email.assert_called_once()
+
+    def test_users_with_changed_emails_resolved(self, mock_get_service_now_interface):
+        service_now_interface = mock_get_service_now_interface.return_value
+        service_now_interface.get_users_by_email.return_value = {
+            self.email: fake_service_now_user("sys-1", self.email),
+        }
+        ingest_service_now()
+        ActivityStreamStaffSSOUserEmailFactory(staff_sso_user=self.sso_user)
+        service_now_interface.get_users_by_email.reset_mock()
+
+        ingest_service_now()
+
+        service_now_interface.get_users_by_email.assert_called_once()
+
+    @override_settings(SERVICE_NOW_VERIFICATION_MAX_AGE_DAYS=7)
+    def test_old_verifications_resolved(self, mock_get_service_now_interface):
+        service_now_interface = mock_get_service_now_interface.return_value
+        service_now_interface.get_users_by_email.return_value = {
+            self.email: fake_service_now_user("sys-1", self.email),
+        }
+        ingest_service_now()
+        ActivityStreamStaffSSOUser.objects.update(
+            service_now_verified_at=timezone.now() - timedelta(days=8)
+        )
+        service_now_interface.get_users_by_email.reset_mock()
+
+        ingest_service_now()
+
+        service_now_interface.get_users_by_email.assert_called_once()
+
+
+@override_settings(SERVICE_NOW_API_URL="https://service-now.example.com")
+@mock.patch("core.service_now.interfaces.ServiceNowClient.get_results")
+def test_get_users_by_email_chunks_emails(mock_get_results):
+    mock_get_results.side_effect = [
+        [
+            {"sys_id": "sys-1", "name": "User 1", "email": "User1@example.com"}
+        ],  # /PS-IGNORE
+        [],
+    ]
+    interface = ServiceNowInterface()
+    interface.USER_EMAIL_CHUNK_SIZE = 2
+
+    users_by_email = interface.get_users_by_email(
+        emails=[
+            "user1@example.com",  # /PS-IGNORE
+            "user2@example.com",  # /PS-IGNORE
+            "user3@example.com",  # /PS-IGNORE
+            "user1@example.com",  # /PS-IGNORE
+        ]
+    )
+
+    assert [c.kwargs["sysparm_query"] for c in mock_get_results.call_args_list] == [
+        "emailINuser1@example.com,user2@example.com",  # /PS-IGNORE
+        "emailINuser3@example.com",  # /PS-IGNORE
+    ]
+    assert list(users_by_email) == ["user1@example.com"]  # /PS-IGNORE
+    assert users_by_email["user1@example.com"]["sys_id"] == "sys-1"  # /PS-IGNORE
@@ -1,12 +1,17 @@
 import json
 import logging
-from typing import TYPE_CHECKING, Optional
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from django.conf import settings
 from django.db.models.query import QuerySet
+from django.utils import timezone
 
 from activity_stream.models import ActivityStreamStaffSSOUser
 from core.service_now import get_service_now_interface
-from core.service_now.interfaces import ServiceNowUserNotFound
+from core.service_now.types import UserDetails
 
 if TYPE_CHECKING:
     from django_stubs_ext import WithAnnotations
@@ -14,54 +19,142 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+CHUNK_SIZE = 100
+
+
+def get_emails_to_try(
+    sso_user: "WithAnnotations[ActivityStreamStaffSSOUser]",
+) -> List[str]:
+    """Get the emails to look up in Service Now, in order of preference."""
+    emails_to_try: List[str] = []
+    for email in [sso_user.service_now_email_address, *sso_user.emails]:
+        if email and email not in emails_to_try:
+            emails_to_try.append(email)
+    return emails_to_try
+
+
+def get_verification_emails(
+    sso_user: "WithAnnotations[ActivityStreamStaffSSOUser]",
+) -> List[str]:
+    return sorted(filter(None, sso_user.emails))
+
+
+def needs_service_now_verification(
+    sso_user: "WithAnnotations[ActivityStreamStaffSSOUser]",
+    *,
+    verified_after: datetime,
+) -> bool:
+    """Check if the user's Service Now mapping needs to be resolved again.
+
+    This is the case for new users, users that weren't found, users whose
+    emails have changed since the last verification and users whose
+    verification is older than `verified_after`.
+    """
+    if not sso_user.service_now_verified_at:
+        return True
+    if sso_user.service_now_verified_at < verified_after:
+        return True
+    return sso_user.service_now_verified_emails != get_verification_emails(sso_user)
+
 
 def ingest_service_now() -> None:
     service_now_interface = get_service_now_interface()
 
     # Only ingest users that are in the SSO, are NOT inactive and are NOT leavers.
     sso_users: QuerySet[WithAnnotations[ActivityStreamStaffSSOUser]] = (
-        ActivityStreamStaffSSOUser.objects.active().not_a_leaver().with_emails().all()
+        ActivityStreamStaffSSOUser.objects.active()
+        .not_a_leaver()
+        .with_emails()
+        .order_by("pk")
     )
 
-    for sso_user in sso_users:
-        service_now_email: Optional[str] = sso_user.service_now_email_address
+    now = timezone.now()
+    verified_after = now - timedelta(
+        days=settings.SERVICE_NOW_VERIFICATION_MAX_AGE_DAYS
+    )
+    counts: Counter[str] = Counter()
 
-        emails_to_try = [service_now_email, *sso_user.emails]
+    def get_unverified_sso_users():
+        for sso_user in sso_users.iterator(chunk_size=CHUNK_SIZE):
+            if needs_service_now_verification(sso_user, verified_after=verified_after):
+                yield sso_user
+            else:
+                counts["skipped"] += 1
 
-        if not emails_to_try:
-            continue
+    unverified_sso_users = get_unverified_sso_users()
 
-        emails_tried: set[str] = set()
-        valid_email = None
+    while chunk := list(islice(unverified_sso_users, CHUNK_SIZE)):
+        emails_to_try: Dict[int, List[str]] = {
+            sso_user.pk: get_emails_to_try(sso_user) for sso_user in chunk
+        }
+        service_now_users: Dict[str, UserDetails] = (
+            service_now_interface.get_users_by_email(
+                emails=[email for emails in emails_to_try.values() for email in emails]
+            )
+        )
 
-        for email in emails_to_try:
-            if not email or email in emails_tried:
-                continue
+        for sso_user in chunk:
+            previous_service_now_email: Optional[str] = (
+                sso_user.service_now_email_address
+            )
+            valid_email = next(
+                (
+                    email
+                    for email in emails_to_try[sso_user.pk]
+                    if email in service_now_users
+                ),
+                None,
+            )
 
-            try:
-                service_now_user = service_now_interface.get_user(email=email)
-            except ServiceNowUserNotFound:
-                pass
+            if valid_email:
+                counts["resolved"] += 1
+                # Only a resolved mapping is verified, users that weren't found
+                # are looked up again on the next run.
+                sso_user.service_now_verified_at = now
+                sso_user.service_now_verified_emails = get_verification_emails(sso_user)
+                service_now_user_id = service_now_users[valid_email]["sys_id"]
+                if (
+                    sso_user.service_now_user_id != service_now_user_id
+                    or sso_user.service_now_email_address != valid_email
+                ):
+                    sso_user.service_now_user_id = service_now_user_id
+                    sso_user.service_now_email_address = valid_email
+                    counts["updated"] += 1
             else:
-                sso_user.service_now_user_id = service_now_user["sys_id"]
-                sso_user.service_now_email_address = email
-                sso_user.save()
-
-                valid_email = email
-
-                break
-            finally:
-                emails_tried.add(email)
-
-        logger.info(
-            json.dumps(
-                {
-                    "sso_user": str(sso_user),
-                    "previous_service_now_email": service_now_email,
-                    "emails": sso_user.emails,
-                    "valid_email": valid_email,
-                    "service_now_user_id": sso_user.service_now_user_id,
-                    "service_now_email_address": sso_user.service_now_email_address,
-                }
+                counts["not_found"] += 1
+
+            logger.info(
+                json.dumps(
+                    {
+                        "sso_user": str(sso_user),
+                        "previous_service_now_email": previous_service_now_email,
+                        "emails": sso_user.emails,
+                        "valid_email": valid_email,
+                        "service_now_user_id": sso_user.service_now_user_id,
+                        "service_now_email_address": (
+                            sso_user.service_now_email_address
+                        ),
+                    }
+                )
             )
+
+        ActivityStreamStaffSSOUser.objects.bulk_update(
+            chunk,
+            [
+                "service_now_user_id",
+                "service_now_email_address",
+                "service_now_verified_at",
+                "service_now_verified_emails",
+            ],
+        )
+
+    logger.info(
+        json.dumps(
+            {
+                "skipped": counts["skipped"],
+                "resolved": counts["resolved"],
+                "not_found": counts["not_found"],
+                "updated": counts["updated"],
+            }
         )
+    )
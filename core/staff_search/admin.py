@@ -0,0 +1,5 @@
+from django.contrib import admin
+
+from core.staff_search.models import StaffIndexReconciliation
+
+admin.site.register(StaffIndexReconciliation)
@@ -0,0 +1,260 @@
+"""Benchmark the staff search against a synthetic Staff index.
+
+See `python manage.py benchmark_staff_search --help`.
+"""
+
+import json
+import random
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, TypedDict
+
+from opensearchpy.helpers import bulk
+
+from core.utils.staff_index import (
+    STAFF_INDEX_BODY,
+    get_search_connection,
+    search_staff_index,
+)
+
+DEFAULT_CORPUS_PATH = Path(__file__).parent / "benchmark_corpus.json"
+
+# fmt: off
+FIRST_NAMES = [
+    "Aisha", "Alex", "Alice", "Amir", "Ana", "Ben", "Carys", "Chloe", "Daniel",
+    "David", "Eleanor", "Emma", "Farah", "George", "Grace", "Hannah", "Harry",
+    "Isla", "Jack", "James", "Joe", "Kofi", "Laura", "Liam", "Lucy", "Mohammed",
+    "Nadia", "Olivia", "Priya", "Rhys", "Ruth", "Sam", "Sarah", "Sean", "Sophie",
+    "Tom", "Yusuf", "Zara",
+]
+LAST_NAMES = [
+    "Ahmed", "Bennett", "Brown", "Campbell", "Clarke", "Davies", "Evans", "Green",
+    "Hall", "Hughes", "Jackson", "Jones", "Kaur", "Khan", "Lewis", "Martin",
+    "Morgan", "Murphy", "Okafor", "Patel", "Roberts", "Robinson", "Scott", "Shah",
+    "Singh", "Taylor", "Thomas", "Thompson", "Walker", "Williams", "Wilson",
+    "Wood", "Wright", "Young",
+]
+# fmt: on
+JOB_TITLES = [
+    "Policy Adviser",
+    "Senior Policy Adviser",
+    "Trade Adviser",
+    "Software Developer",
+    "Delivery Manager",
+    "Finance Business Partner",
+    "HR Business Partner",
+    "Head of Operations",
+]
+
+
+class CorpusPerson(TypedDict):
+    key: str
+    first_name: str
+    last_name: str
+    email_addresses: List[str]
+
+
+class CorpusQuery(TypedDict):
+    kind: str
+    query: str
+    expected: List[str]
+
+
+class Corpus(TypedDict):
+    people: List[CorpusPerson]
+    queries: List[CorpusQuery]
+
+
+@dataclass
+class QueryResult:
+    query: CorpusQuery
+    latency_ms: float
+    recall: float
+
+
+@dataclass
+class BenchmarkRun:
+    clients: int
+    duration_s: float
+    results: List[QueryResult] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Queries per second."""
+        return len(self.results) / self.duration_s
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        return get_percentiles([result.latency_ms for result in self.results])
+
+    def recall_by_kind(self) -> Dict[str, float]:
+        recalls: Dict[str, List[float]] = {}
+        for result in self.results:
+            recalls.setdefault(result.query["kind"], []).append(result.recall)
+        return {kind: statistics.mean(values) for kind, values in recalls.items()}
+
+    @property
+    def recall(self) -> float:
+        return statistics.mean(result.recall for result in self.results)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "clients": self.clients,
+            "queries": len(self.results),
+            "throughput": self.throughput,
+            "latency_ms": self.latency_percentiles(),
+            "recall": self.recall,
+            "recall_by_kind": self.recall_by_kind(),
+        }
+
+
+def load_corpus(path: Path = DEFAULT_CORPUS_PATH) -> Corpus:
+    with open(path) as corpus_file:
+        return json.load(corpus_file)
+
+
+def get_percentiles(values: Sequence[float]) -> Dict[str, float]:
+    """Get the p50, p95 and p99 of the given values."""
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+
+    quantiles = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": quantiles[49], "p95": quantiles[94], "p99": quantiles[98]}
+
+
+def get_recall(*, expected: Sequence[str], returned: Sequence[str]) -> float:
+    """Get the fraction of the expected ids that were returned."""
+    if not expected:
+        return 1.0
+    return len(set(expected) & set(returned)) / len(set(expected))
+
+
+def build_synthetic_staff_document(
+    *,
+    doc_id: str,
+    first_name: str,
+    last_name: str,
+    email_addresses: List[str],
+    job_title: str,
+) -> Dict[str, Any]:
+    return {
+        "uuid": str(uuid.uuid4()),
+        "available_in_staff_sso": True,
+        "staff_sso_activity_stream_id": f"dit:StaffSSO:User:{doc_id}",
+        "staff_sso_email_user_id": doc_id,
+        "staff_sso_legacy_id": str(uuid.uuid4()),
+        "staff_sso_first_name": first_name,
+        "staff_sso_last_name": last_name,
+        "staff_sso_contact_email_address": email_addresses[0],
+        "staff_sso_email_addresses": email_addresses,
+        "people_finder_first_name": first_name,
+        "people_finder_last_name": last_name,
+        "people_finder_job_title": job_title,
+        "people_finder_directorate": "",
+        "people_finder_phone": "",
+        "people_finder_grade": "",
+        "people_finder_email": email_addresses[0],
+        "people_finder_photo": None,
+        "people_finder_photo_small": None,
+    }
+
+
+def generate_synthetic_staff_documents(
+    *, corpus: Corpus, size: int, seed: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """Generate staff documents for the corpus people and random filler staff.
+
+    The corpus people are indexed with their corpus key as the document id so
+    that search results can be checked against the expected keys.
+    """
+    rand = random.Random(seed)
+
+    for person in corpus["people"]:
+        yield build_synthetic_staff_document(
+            doc_id=person["key"],
+            first_name=person["first_name"],
+            last_name=person["last_name"],
+            email_addresses=person["email_addresses"],
+            job_title=rand.choice(JOB_TITLES),
+        )
+
+    for i in range(max(size - len(corpus["people"]), 0)):
+        first_name = rand.choice(FIRST_NAMES)
+        last_name = rand.choice(LAST_NAMES)
+        email_local_part = f"{first_name}.{last_name}{i}".lower()
+        yield build_synthetic_staff_document(
+            doc_id=f"synthetic-{i}",
+            first_name=first_name,
+            last_name=last_name,
+            email_addresses=[f"{email_local_part}@example.com"],
+            job_title=rand.choice(JOB_TITLES),
+        )
+
+
+def load_synthetic_staff_index(
+    *, index_name: str, corpus: Corpus, size: int, seed: int = 0
+) -> None:
+    """(Re)create the benchmark index and fill it with synthetic staff."""
+    search_client = get_search_connection()
+    search_client.indices.delete(index=index_name, ignore=404)
+    search_client.indices.create(index=index_name, body=STAFF_INDEX_BODY)
+
+    bulk(
+        search_client,
+        (
+            {"_index": index_name, "_id": doc["staff_sso_email_user_id"], **doc}
+            for doc in generate_synthetic_staff_documents(
+                corpus=corpus, size=size, seed=seed
+            )
+        ),
+    )
+    search_client.indices.refresh(index=index_name)
+
+
+def delete_synthetic_staff_index(*, index_name: str) -> None:
+    get_search_connection().indices.delete(index=index_name, ignore=404)
+
+
+def run_query(*, query: CorpusQuery, index_name: str) -> QueryResult:
+    start = time.perf_counter()
+    staff_documents = search_staff_index(query=query["query"], index_name=index_name)
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    return QueryResult(
+        query=query,
+        latency_ms=latency_ms,
+        recall=get_recall(
+            expected=query["expected"],
+            returned=[doc.staff_sso_email_user_id for doc in staff_documents],
+        ),
+    )
+
+
+def run_benchmark(
+    *,
+    index_name: str,
+    queries: List[CorpusQuery],
+    clients: int = 1,
+    iterations: int = 1,
+) -> BenchmarkRun:
+    """Replay the queries with the given number of concurrent clients.
+
+    Each client replays every query `iterations` times.
+    """
+    workload = queries * iterations * clients
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        results = list(
+            executor.map(
+                lambda query: run_query(query=query, index_name=index_name),
+                workload,
+            )
+        )
+    duration_s = time.perf_counter() - start
+
+    return BenchmarkRun(clients=clients, duration_s=duration_s, results=results)
@@ -0,0 +1,96 @@
+# Generated by Django 5.1.9 on 2026-10-19 13:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="StaffDirectoryEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.CharField(blank=True, db_index=True, max_length=255)),
+                ("available_in_staff_sso", models.BooleanField(default=False)),
+                (
+                    "staff_sso_activity_stream_id",
+                    models.CharField(blank=True, max_length=255),
+                ),
+                (
+                    "staff_sso_email_user_id",
+                    models.CharField(max_length=255, unique=True),
+                ),
+                ("staff_sso_legacy_id", models.CharField(blank=True, max_length=255)),
+                ("staff_sso_first_name", models.CharField(blank=True, max_length=255)),
+                ("staff_sso_last_name", models.CharField(blank=True, max_length=255)),
+                (
+                    "staff_sso_contact_email_address",
+                    models.CharField(blank=True, max_length=255),
+                ),
+                (
+                    "staff_sso_email_addresses",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        blank=True,
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "people_finder_first_name",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "people_finder_last_name",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "people_finder_job_title",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "people_finder_directorate",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "people_finder_phone",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "people_finder_grade",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "people_finder_email",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("people_finder_photo", models.TextField(blank=True, null=True)),
+                ("people_finder_photo_small", models.TextField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Staff directory entry",
+                "verbose_name_plural": "Staff directory entries",
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["staff_sso_email_addresses"],
+                        name="staff_dir_email_addresses_gin",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.9 on 2026-10-19 13:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("staff_search", "0002_staffindexchange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StaffIndexReconciliation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("dry_run", models.BooleanField(default=False)),
+                ("sso_user_count", models.PositiveIntegerField(default=0)),
+                ("indexed_document_count", models.PositiveIntegerField(default=0)),
+                ("missing_document_count", models.PositiveIntegerField(default=0)),
+                ("stale_document_count", models.PositiveIntegerField(default=0)),
+                ("orphaned_document_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-started_at"],
+            },
+        ),
+    ]
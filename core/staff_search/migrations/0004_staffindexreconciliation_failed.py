@@ -0,0 +1,23 @@
+# Generated by Django 5.1.9 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("staff_search", "0003_staffindexreconciliation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="staffindexreconciliation",
+            name="error",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="staffindexreconciliation",
+            name="failed_document_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
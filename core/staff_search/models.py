@@ -0,0 +1,105 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+
+class StaffDirectoryEntry(models.Model):
+    """
+    A local copy of a document in the Staff index.
+
+    The fields mirror `core.utils.staff_index.StaffDocument` so that exact
+    lookups (by email user id, document uuid or email address) can be served
+    from Postgres, leaving OpenSearch to handle the fuzzy staff search.
+    """
+
+    uuid = models.CharField(max_length=255, blank=True, db_index=True)
+    available_in_staff_sso = models.BooleanField(default=False)
+
+    # Staff SSO
+    staff_sso_activity_stream_id = models.CharField(max_length=255, blank=True)
+    staff_sso_email_user_id = models.CharField(max_length=255, unique=True)
+    staff_sso_legacy_id = models.CharField(max_length=255, blank=True)
+    staff_sso_first_name = models.CharField(max_length=255, blank=True)
+    staff_sso_last_name = models.CharField(max_length=255, blank=True)
+    staff_sso_contact_email_address = models.CharField(max_length=255, blank=True)
+    staff_sso_email_addresses = ArrayField(
+        models.CharField(max_length=255), default=list, blank=True
+    )
+
+    # People Finder
+    people_finder_first_name = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_last_name = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_job_title = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_directorate = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_phone = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_grade = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_email = models.CharField(max_length=255, null=True, blank=True)
+    people_finder_photo = models.TextField(null=True, blank=True)
+    people_finder_photo_small = models.TextField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Staff directory entry"
+        verbose_name_plural = "Staff directory entries"
+        indexes = [
+            GinIndex(
+                fields=["staff_sso_email_addresses"],
+                name="staff_dir_email_addresses_gin",
+            ),
+        ]
+
+    def __str__(self):
+        return self.staff_sso_email_user_id
+
+
+class StaffIndexChange(models.Model):
+    """
+    An outbox of Staff SSO users whose Staff index document needs updating.
+
+    Rows are recorded when the Staff SSO ingest sees a change and are removed
+    once the change has been applied to the index.
+    """
+
+    email_user_id = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.email_user_id
+
+
+class StaffIndexReconciliation(models.Model):
+    """
+    The drift found (and repaired) by a run of `reconcile_staff_index`.
+    """
+
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    dry_run = models.BooleanField(default=False)
+
+    sso_user_count = models.PositiveIntegerField(default=0)
+    indexed_document_count = models.PositiveIntegerField(default=0)
+    # Users without a document in the index.
+    missing_document_count = models.PositiveIntegerField(default=0)
+    # Documents whose Staff SSO data doesn't match the database.
+    stale_document_count = models.PositiveIntegerField(default=0)
+    # Documents without a matching user.
+    orphaned_document_count = models.PositiveIntegerField(default=0)
+    # Drifted documents that the bulk requests failed to repair.
+    failed_document_count = models.PositiveIntegerField(default=0)
+    # The error that stopped the run, if it didn't finish.
+    error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["-started_at"]
+
+    def __str__(self):
+        return f"Staff index reconciliation {self.started_at}"
+
+    @property
+    def drift_count(self) -> int:
+        return (
+            self.missing_document_count
+            + self.stale_document_count
+            + self.orphaned_document_count
+        )
@@ -0,0 +1,73 @@
+from unittest import TestCase, mock
+
+from core.staff_search.benchmark import (
+    generate_synthetic_staff_documents,
+    get_percentiles,
+    get_recall,
+    load_corpus,
+    run_benchmark,
+)
+from core.utils.staff_index import StaffDocument
+
+
+class TestBenchmarkHelpers(TestCase):
+    def test_corpus_queries_reference_corpus_people(self):
+        corpus = load_corpus()
+        keys = {person["key"] for person in corpus["people"]}
+
+        for query in corpus["queries"]:
+            self.assertTrue(set(query["expected"]) <= keys, query["query"])
+
+    def test_generate_synthetic_staff_documents(self):
+        corpus = load_corpus()
+
+        docs = list(generate_synthetic_staff_documents(corpus=corpus, size=50, seed=1))
+
+        self.assertEqual(len(docs), 50)
+        self.assertEqual(
+            [doc["staff_sso_email_user_id"] for doc in docs[: len(corpus["people"])]],
+            [person["key"] for person in corpus["people"]],
+        )
+        # The documents can be loaded as StaffDocuments.
+        StaffDocument.from_dict(docs[-1])
+        # The filler staff are the same for the same seed.
+        self.assertEqual(
+            [doc["staff_sso_last_name"] for doc in docs],
+            [
+                doc["staff_sso_last_name"]
+                for doc in generate_synthetic_staff_documents(
+                    corpus=corpus, size=50, seed=1
+                )
+            ],
+        )
+
+    def test_get_percentiles(self):
+        self.assertEqual(
+            get_percentiles(list(range(1, 102))), {"p50": 51, "p95": 96, "p99": 100}
+        )
+        self.assertEqual(get_percentiles([5.0]), {"p50": 5.0, "p95": 5.0, "p99": 5.0})
+
+    def test_get_recall(self):
+        self.assertEqual(get_recall(expected=["a", "b"], returned=["b", "c"]), 0.5)
+        self.assertEqual(get_recall(expected=[], returned=["a"]), 1.0)
+
+    @mock.patch("core.staff_search.benchmark.search_staff_index")
+    def test_run_benchmark(self, mock_search_staff_index):
+        mock_search_staff_index.return_value = [
+            mock.Mock(staff_sso_email_user_id="joe")
+        ]
+        queries = [
+            {"kind": "name", "query": "Joe", "expected": ["joe"]},
+            {"kind": "typo", "query": "Jeo", "expected": ["joe", "jo"]},
+        ]
+
+        run = run_benchmark(
+            index_name="staff_benchmark", queries=queries, clients=2, iterations=3
+        )
+
+        self.assertEqual(len(run.results), 12)
+        self.assertEqual(run.recall_by_kind(), {"name": 1.0, "typo": 0.5})
+        self.assertEqual(run.to_dict()["clients"], 2)
+        mock_search_staff_index.assert_called_with(
+            query="Jeo", index_name="staff_benchmark"
+        )
@@ -0,0 +1,114 @@
+from unittest import mock
+
+from django.test import TestCase
+from opensearchpy.exceptions import TransportError
+
+from activity_stream.factories import ActivityStreamStaffSSOUserFactory
+from activity_stream.models import ActivityStreamStaffSSOUser
+from core.staff_search.models import StaffIndexReconciliation
+from core.staff_search.utils import get_staff_document_checksum, reconcile_staff_index
+from core.utils.staff_index import get_sso_user_staff_document_data
+
+
+def indexed_hit(sso_user: ActivityStreamStaffSSOUser, **overrides):
+    sso_user = ActivityStreamStaffSSOUser.objects.with_emails().get(pk=sso_user.pk)
+    return {
+        "_id": sso_user.email_user_id,
+        "_source": get_sso_user_staff_document_data(sso_user=sso_user) | overrides,
+    }
+
+
+@mock.patch("core.staff_search.utils.get_search_connection")
+@mock.patch("core.staff_search.utils.apply_staff_index_changes", return_value=set())
+class TestReconcileStaffIndex(TestCase):
+    def setUp(self):
+        self.in_sync = ActivityStreamStaffSSOUserFactory()
+        self.stale = ActivityStreamStaffSSOUserFactory()
+        self.missing = ActivityStreamStaffSSOUserFactory()
+
+    def get_hits(self):
+        return [
+            indexed_hit(self.in_sync),
+            indexed_hit(self.stale, available_in_staff_sso=False),
+            {"_id": "orphan", "_source": {"staff_sso_email_user_id": "orphan"}},
+        ]
+
+    def test_repairs_drift(self, mock_apply_staff_index_changes, mock_connection):
+        with mock.patch("core.staff_search.utils.scan", return_value=self.get_hits()):
+            reconciliation = reconcile_staff_index()
+
+        self.assertEqual(reconciliation.sso_user_count, 3)
+        self.assertEqual(reconciliation.indexed_document_count, 3)
+        self.assertEqual(reconciliation.missing_document_count, 1)
+        self.assertEqual(reconciliation.stale_document_count, 1)
+        self.assertEqual(reconciliation.orphaned_document_count, 1)
+        self.assertEqual(reconciliation.drift_count, 3)
+        self.assertIsNotNone(reconciliation.finished_at)
+
+        mock_apply_staff_index_changes.assert_called_once_with(
+            email_user_ids={
+                self.missing.email_user_id,
+                self.stale.email_user_id,
+                "orphan",
+            }
+        )
+
+    def test_dry_run(self, mock_apply_staff_index_changes, mock_connection):
+        with mock.patch("core.staff_search.utils.scan", return_value=self.get_hits()):
+            reconciliation = reconcile_staff_index(dry_run=True)
+
+        self.assertEqual(reconciliation.drift_count, 3)
+        mock_apply_staff_index_changes.assert_not_called()
+
+    def test_batches(self, mock_apply_staff_index_changes, mock_connection):
+        with mock.patch("core.staff_search.utils.scan", return_value=self.get_hits()):
+            reconcile_staff_index(batch_size=2)
+
+        self.assertEqual(mock_apply_staff_index_changes.call_count, 2)
+
+    def test_failed_repairs(self, mock_apply_staff_index_changes, mock_connection):
+        mock_apply_staff_index_changes.return_value = {"orphan"}
+
+        with mock.patch("core.staff_search.utils.scan", return_value=self.get_hits()):
+            reconciliation = reconcile_staff_index()
+
+        self.assertEqual(reconciliation.drift_count, 3)
+        self.assertEqual(reconciliation.failed_document_count, 1)
+
+    def test_error_is_recorded(self, mock_apply_staff_index_changes, mock_connection):
+        mock_apply_staff_index_changes.side_effect = TransportError(
+            "N/A", "Connection refused"
+        )
+
+        with mock.patch("core.staff_search.utils.scan", return_value=self.get_hits()):
+            with self.assertRaises(TransportError):
+                reconcile_staff_index()
+
+        reconciliation = StaffIndexReconciliation.objects.get()
+        self.assertIsNotNone(reconciliation.finished_at)
+        self.assertEqual(reconciliation.missing_document_count, 1)
+        self.assertIn("TransportError", reconciliation.error)
+
+
+class TestGetStaffDocumentChecksum(TestCase):
+    def test_email_order_is_ignored(self):
+        self.assertEqual(
+            get_staff_document_checksum(
+                {"staff_sso_email_addresses": ["a@example.com", "b@example.com"]}
+            ),
+            get_staff_document_checksum(
+                {"staff_sso_email_addresses": ["b@example.com", "a@example.com"]}
+            ),
+        )
+
+    def test_people_finder_data_is_ignored(self):
+        self.assertEqual(
+            get_staff_document_checksum({"staff_sso_first_name": "Joe"}),
+            get_staff_document_checksum(
+                {"staff_sso_first_name": "Joe", "people_finder_first_name": "Joseph"}
+            ),
+        )
+        self.assertNotEqual(
+            get_staff_document_checksum({"staff_sso_first_name": "Joe"}),
+            get_staff_document_checksum({"staff_sso_first_name": "Joseph"}),
+        )
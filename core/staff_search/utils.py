@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Mapping
+
+from django.utils import timezone
+from opensearchpy.helpers import scan
+
+from activity_stream.models import ActivityStreamStaffSSOUser
+from core.staff_search.models import StaffIndexReconciliation
+from core.utils.staff_index import (
+    STAFF_INDEX_NAME,
+    STAFF_SSO_DOCUMENT_FIELDS,
+    apply_staff_index_changes,
+    get_search_connection,
+    get_sso_user_staff_document_data,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_staff_document_checksum(staff_document: Mapping[str, Any]) -> str:
+    """Get a checksum of the Staff SSO data in a staff document.
+
+    Args:
+        staff_document (Mapping[str, Any]):
+            The staff document, or the Staff SSO data for one.
+
+    Returns:
+        str: The checksum.
+    """
+    staff_sso_data = {
+        field: staff_document.get(field) for field in STAFF_SSO_DOCUMENT_FIELDS
+    }
+    # The order of the email addresses doesn't matter.
+    staff_sso_data["staff_sso_email_addresses"] = sorted(
+        filter(None, staff_sso_data["staff_sso_email_addresses"] or [])
+    )
+    return hashlib.sha1(
+        json.dumps(staff_sso_data, sort_keys=True).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+
+
+def get_indexed_staff_document_checksums() -> Dict[str, str]:
+    """Get the checksum of every document in the staff index, keyed by id."""
+    return {
+        hit["_id"]: get_staff_document_checksum(hit.get("_source", {}))
+        for hit in scan(
+            get_search_connection(),
+            index=STAFF_INDEX_NAME,
+            query={"query": {"match_all": {}}},
+            _source_includes=STAFF_SSO_DOCUMENT_FIELDS,
+        )
+    }
+
+
+def reconcile_staff_index(
+    *, batch_size: int = 500, dry_run: bool = False
+) -> StaffIndexReconciliation:
+    """Find and repair the differences between the staff index and the database.
+
+    Only the Staff SSO data is compared, the documents that differ are
+    rebuilt (or deleted) with bulk requests, so the cost of a run depends on
+    the amount of drift rather than the number of staff.
+
+    The report is saved even if the run fails part way, with the error.
+
+    Args:
+        batch_size (int, optional):
+            The number of documents to repair per bulk request. Defaults to 500.
+        dry_run (bool, optional):
+            Only report the drift, don't repair it. Defaults to False.
+
+    Returns:
+        StaffIndexReconciliation: The drift report.
+    """
+    reconciliation = StaffIndexReconciliation.objects.create(dry_run=dry_run)
+
+    try:
+        indexed_checksums = get_indexed_staff_document_checksums()
+        reconciliation.indexed_document_count = len(indexed_checksums)
+
+        missing_doc_ids: List[str] = []
+        stale_doc_ids: List[str] = []
+        sso_users = (
+            ActivityStreamStaffSSOUser.objects.with_emails()
+            .order_by("email_user_id")
+            .iterator()
+        )
+        for sso_user in sso_users:
+            reconciliation.sso_user_count += 1
+            doc_id = sso_user.email_user_id
+            indexed_checksum = indexed_checksums.pop(doc_id, None)
+            if indexed_checksum is None:
+                missing_doc_ids.append(doc_id)
+            elif indexed_checksum != get_staff_document_checksum(
+                get_sso_user_staff_document_data(sso_user=sso_user)
+            ):
+                stale_doc_ids.append(doc_id)
+        # Anything left over doesn't belong to a user.
+        orphaned_doc_ids = list(indexed_checksums)
+
+        reconciliation.missing_document_count = len(missing_doc_ids)
+        reconciliation.stale_document_count = len(stale_doc_ids)
+        reconciliation.orphaned_document_count = len(orphaned_doc_ids)
+
+        if not dry_run:
+            drifted_doc_ids = missing_doc_ids + stale_doc_ids + orphaned_doc_ids
+            for i in range(0, len(drifted_doc_ids), batch_size):
+                failed_doc_ids = apply_staff_index_changes(
+                    email_user_ids=set(drifted_doc_ids[i : i + batch_size])
+                )
+                reconciliation.failed_document_count += len(failed_doc_ids)
+    except Exception as e:
+        reconciliation.error = f"{e.__class__.__name__}: {e}"
+        raise
+    finally:
+        reconciliation.finished_at = timezone.now()
+        reconciliation.save()
+
+    logger.info(
+        f"Staff index reconciliation: {reconciliation.missing_document_count} missing, "
+        f"{reconciliation.stale_document_count} stale, "
+        f"{reconciliation.orphaned_document_count} orphaned, "
+        f"{reconciliation.failed_document_count} failed to repair "
+        f"({dry_run=})"
+    )
+    return reconciliation
@@ -1,9 +1,9 @@
+import json
+from datetime import datetime
+from typing import List, Optional
+
 from django.conf import settings
-from django.db.models.query import QuerySet
 from django.utils import timezone
-from django_workflow_engine.exceptions import WorkflowNotAuthError
-from django_workflow_engine.executor import WorkflowExecutor
-from django_workflow_engine.models import Flow
 
 from activity_stream.utils import ingest_staff_sso_s3
 from config.celery import celery_app
@@ -13,7 +13,12 @@ from core.people_data.utils import (
 )
 from core.people_finder.utils import ingest_people_finder
 from core.service_now.utils import ingest_service_now
-from core.utils.staff_index import index_sso_users
+from core.staff_search.utils import reconcile_staff_index
+from core.uksbs.org_hierarchy import refresh_stale_org_hierarchies
+from core.utils.staff_index import index_sso_users, process_staff_index_changes
+from leavers.workflow.metrics import delete_old_step_runs
+from leavers.workflow.progress import mark_flows_queued, progress_flows
+from leavers.workflow.schedule import get_due_flows
 
 logger = celery_app.log.get_default_logger()
 
@@ -31,10 +36,42 @@ def progress_workflows(self):
         return None
 
     logger.info("RUNNING progress_workflows")
-    in_progress_flows: QuerySet[Flow] = Flow.objects.filter(finished__isnull=True)
-    for flow in in_progress_flows:
-        progress_workflow.delay(flow_pk=flow.pk)
-    logger.info(f"Triggered {in_progress_flows.count()} workflows")
+    # Only progress the flows that have work due, see leavers.workflow.schedule
+    due_flow_pks = list(get_due_flows().order_by("pk").values_list("pk", flat=True))
+    # Skip the flows that already have a run queued.
+    flow_pks = mark_flows_queued(due_flow_pks)
+    batch_size = settings.WORKFLOW_PROGRESS_BATCH_SIZE
+    queued_at = timezone.now().isoformat()
+    for i in range(0, len(flow_pks), batch_size):
+        progress_workflow_batch.delay(
+            flow_pks=flow_pks[i : i + batch_size], queued_at=queued_at
+        )
+    logger.info(
+        json.dumps(
+            {
+                "due": len(due_flow_pks),
+                "queued": len(flow_pks),
+                "skipped": len(due_flow_pks) - len(flow_pks),
+            }
+        )
+    )
+
+
+@celery_app.task(bind=True)
+def progress_workflow_batch(self, flow_pks: List[int], queued_at: Optional[str] = None):
+    if not settings.RUN_DJANGO_WORKFLOWS:
+        logger.info("RUNNING progress_workflow_batch - disabled")
+        return None
+
+    logger.info(f"RUNNING progress_workflow_batch for {len(flow_pks)} workflows")
+    # The time the batch spent in the Celery queue.
+    queue_lag_s: Optional[float] = None
+    if queued_at:
+        queue_lag_s = (
+            timezone.now() - datetime.fromisoformat(queued_at)
+        ).total_seconds()
+    counts = progress_flows(flow_pks)
+    logger.info(json.dumps({**counts, "queue_lag_s": queue_lag_s}))
 
 
 @celery_app.task(bind=True)
@@ -44,19 +81,13 @@ def progress_workflow(self, flow_pk: str):
         return None
 
     logger.info(f"RUNNING progress_workflow {flow_pk=}")
-    # Get workflow from task
-    flow: Flow = Flow.objects.get(pk=flow_pk)
-    if request := getattr(flow, "leaving_request", None):
-        if request.cancelled:
-            flow.finished = timezone.now()
-            flow.save(update_fields=["finished"])
+    logger.info(json.dumps(progress_flows([flow_pk])))
 
-    if not flow.is_complete:
-        executor = WorkflowExecutor(flow)
-        try:
-            executor.run_flow(user=None)
-        except WorkflowNotAuthError as e:
-            logger.warning(f"{e}")
+
+@celery_app.task(bind=True)
+def delete_old_workflow_step_runs_task(self):
+    logger.info("RUNNING delete_old_workflow_step_runs_task")
+    logger.info(json.dumps({"deleted": delete_old_step_runs()}))
 
 
 @celery_app.task(bind=True)
@@ -71,6 +102,24 @@ def index_sso_users_task(self):
     index_sso_users()
 
 
+@celery_app.task(bind=True)
+def process_staff_index_changes_task(self):
+    logger.info("RUNNING process_staff_index_changes_task")
+    process_staff_index_changes()
+
+
+@celery_app.task(bind=True)
+def reconcile_staff_index_task(self):
+    logger.info("RUNNING reconcile_staff_index_task")
+    reconcile_staff_index()
+
+
+@celery_app.task(bind=True)
+def refresh_org_hierarchies_task(self):
+    logger.info("RUNNING refresh_org_hierarchies_task")
+    refresh_stale_org_hierarchies()
+
+
 @celery_app.task(bind=True)
 def ingest_people_s3_task(self):
     logger.info("RUNNING ingest_people_s3_task")
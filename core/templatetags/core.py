@@ -11,6 +11,13 @@ def possessive(value):
     return make_possessive(value)
 
 
+@register.filter
+def seconds_to_days(value):
+    if value is None:
+        return None
+    return value / (60 * 60 * 24)
+
+
 @register.simple_tag(takes_context=True)
 def get_current_url_with_query_params(context, **kwargs):
     request = context["request"]
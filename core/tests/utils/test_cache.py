@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from core.utils.cache import get_cached_value, set_cached_value
+
+
+class NotFound(Exception):
+    pass
+
+
+class SynchronousExecutor:
+    def submit(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_empty_values_are_cached():
+    fetch = mock.Mock(return_value=[])
+
+    assert get_cached_value("key", fetch, timeout=60) == []
+    assert get_cached_value("key", fetch, timeout=60) == []
+    fetch.assert_called_once()
+
+
+def test_not_found_is_cached():
+    fetch = mock.Mock(side_effect=NotFound)
+
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            get_cached_value("key", fetch, timeout=60, not_found=NotFound)
+    fetch.assert_called_once()
+
+
+def test_not_found_string_is_a_value():
+    fetch = mock.Mock(return_value="not_found")
+
+    assert get_cached_value("key", fetch, timeout=60, not_found=NotFound) == "not_found"
+    assert get_cached_value("key", fetch, timeout=60, not_found=NotFound) == "not_found"
+
+
+def test_other_errors_are_not_cached():
+    fetch = mock.Mock(side_effect=[ValueError, "value"])
+
+    with pytest.raises(ValueError):
+        get_cached_value("key", fetch, timeout=60, not_found=NotFound)
+    assert get_cached_value("key", fetch, timeout=60, not_found=NotFound) == "value"
+
+
+@mock.patch("core.utils.cache._refresh_executor", SynchronousExecutor())
+def test_stale_value_served_while_refreshed():
+    set_cached_value("key", "stale", timeout=0, stale_timeout=60)
+    fetch = mock.Mock(return_value="fresh")
+
+    assert get_cached_value("key", fetch, timeout=60, stale_timeout=60) == "stale"
+    assert get_cached_value("key", fetch, timeout=60, stale_timeout=60) == "fresh"
+    fetch.assert_called_once()
+
+
+@mock.patch("core.utils.cache._refresh_executor", SynchronousExecutor())
+def test_failed_refresh_keeps_stale_value():
+    set_cached_value("key", "stale", timeout=0, stale_timeout=60)
+    fetch = mock.Mock(side_effect=ValueError)
+
+    assert get_cached_value("key", fetch, timeout=60, stale_timeout=60) == "stale"
+    assert get_cached_value("key", fetch, timeout=60, stale_timeout=60) == "stale"
+    assert fetch.call_count == 2
+
+
+@mock.patch("core.utils.cache.time.sleep")
+def test_waits_for_another_fetch(mock_sleep):
+    # Another process holds the lock and caches the value while we wait.
+    cache.add("key:lock", True)
+    mock_sleep.side_effect = lambda _: set_cached_value("key", "value", timeout=60)
+    fetch = mock.Mock()
+
+    assert get_cached_value("key", fetch, timeout=60) == "value"
+    fetch.assert_not_called()
+
+
+def test_lock_released():
+    get_cached_value("key", mock.Mock(return_value="value"), timeout=60)
+
+    assert cache.get("key:lock") is None
+
+
+def test_expired_lock_not_released():
+    def fetch():
+        # The lock expires during the fetch and another process takes it.
+        cache.set("key:lock", "other")
+        return "value"
+
+    assert get_cached_value("key", fetch, timeout=60) == "value"
+    assert cache.get("key:lock") == "other"
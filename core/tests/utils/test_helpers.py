@@ -5,6 +5,7 @@ from django.utils import timezone
 
 from core.utils.helpers import (
     bool_to_yes_no,
+    get_next_work_day_and_time,
     get_next_workday,
     is_work_day_and_time,
     make_possessive,
@@ -85,3 +86,27 @@ class GetNextWorkday(TestCase):
 
     def test_sunday(self):
         self.assertEqual(get_next_workday(date(2022, 11, 27)), date(2022, 11, 28))
+
+
+class GetNextWorkDayAndTime(TestCase):
+    def test_during_working_hours(self):
+        dt = timezone.datetime(2022, 11, 28, 12, 30)
+        self.assertEqual(get_next_work_day_and_time(dt), dt)
+
+    def test_before_working_hours(self):
+        self.assertEqual(
+            get_next_work_day_and_time(timezone.datetime(2022, 11, 28, 8, 30)),
+            timezone.datetime(2022, 11, 28, 9, 0),
+        )
+
+    def test_after_working_hours(self):
+        self.assertEqual(
+            get_next_work_day_and_time(timezone.datetime(2022, 11, 28, 17, 30)),
+            timezone.datetime(2022, 11, 29, 9, 0),
+        )
+
+    def test_weekend(self):
+        self.assertEqual(
+            get_next_work_day_and_time(timezone.datetime(2022, 11, 26, 8, 30)),
+            timezone.datetime(2022, 11, 28, 9, 0),
+        )
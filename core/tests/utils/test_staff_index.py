@@ -1,13 +1,22 @@
 from typing import Any
-from unittest import skip
+from unittest import mock, skip
 
 import pytest
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError
 from opensearchpy.exceptions import NotFoundError
 
+from activity_stream.factories import ActivityStreamStaffSSOUserFactory
+from core.staff_search.models import StaffDirectoryEntry, StaffIndexChange
 from core.utils.staff_index import (
     STAFF_INDEX_NAME,
+    TooManyStaffDocumentsFound,
     delete_staff_document,
+    get_query_shape,
     get_search_connection,
+    get_staff_document_from_staff_index,
+    process_staff_index_changes,
+    record_staff_index_changes,
+    search_staff_index,
     update_staff_document,
 )
 
@@ -71,3 +80,281 @@ def test_scenario_staff_document():
     # then we get an error
     with pytest.raises(NotFoundError):
         get_staff_document(id=id)
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_update_staff_document_updates_staff_directory(mock_get_search_connection):
+    id = "test.id.please.ignore-1234abcd@example.com"  # /PS-IGNORE
+
+    # given no entry
+    # when we update without upsert
+    update_staff_document(id=id, staff_document={"staff_sso_first_name": "Test"})
+    # then no entry is created
+    assert not StaffDirectoryEntry.objects.filter(staff_sso_email_user_id=id).exists()
+
+    # when we update with upsert, ignoring fields that aren't on a StaffDocument
+    update_staff_document(
+        id=id,
+        staff_document={
+            "uuid": "1234",
+            "staff_sso_first_name": "Test",
+            "hair_colour": "blonde",
+        },
+        upsert=True,
+    )
+    # then the entry is created
+    entry = StaffDirectoryEntry.objects.get(staff_sso_email_user_id=id)
+    assert entry.uuid == "1234"
+    assert entry.staff_sso_first_name == "Test"
+
+    # when we extend it
+    update_staff_document(id=id, staff_document={"people_finder_grade": "Grade 7"})
+    # then the entry is extended
+    entry.refresh_from_db()
+    assert entry.staff_sso_first_name == "Test"
+    assert entry.people_finder_grade == "Grade 7"
+
+    # when we delete it
+    delete_staff_document(id=id)
+    # then the entry is removed
+    assert not StaffDirectoryEntry.objects.filter(staff_sso_email_user_id=id).exists()
+    assert mock_get_search_connection.return_value.update.call_count == 3
+    assert mock_get_search_connection.return_value.delete.call_count == 1
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_exact_lookups_served_from_staff_directory(mock_get_search_connection):
+    StaffDirectoryEntry.objects.create(
+        uuid="1234",
+        staff_sso_email_user_id="joe.bloggs-1234abcd@example.com",  # /PS-IGNORE
+        staff_sso_first_name="Joe",
+        staff_sso_last_name="Bloggs",
+        staff_sso_email_addresses=["joe.bloggs@example.com"],  # /PS-IGNORE
+    )
+
+    for lookup in [
+        {"sso_email_user_id": "joe.bloggs-1234abcd@example.com"},  # /PS-IGNORE
+        {"staff_uuid": "1234"},
+        {"sso_email_address": "joe.bloggs@example.com"},  # /PS-IGNORE
+    ]:
+        staff_document = get_staff_document_from_staff_index(**lookup)
+        assert staff_document.uuid == "1234"
+        assert staff_document.staff_sso_first_name == "Joe"
+        assert staff_document.staff_sso_last_name == "Bloggs"
+
+    mock_get_search_connection.assert_not_called()
+
+    StaffDirectoryEntry.objects.create(
+        uuid="5678",
+        staff_sso_email_user_id="joe.bloggs-5678abcd@example.com",  # /PS-IGNORE
+        staff_sso_email_addresses=["joe.bloggs@example.com"],  # /PS-IGNORE
+    )
+    with pytest.raises(TooManyStaffDocumentsFound):
+        get_staff_document_from_staff_index(
+            sso_email_address="joe.bloggs@example.com"  # /PS-IGNORE
+        )
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.Search")
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_exact_lookup_reads_through_to_staff_index(
+    mock_get_search_connection, mock_search
+):
+    hit = mock.MagicMock()
+    hit.to_dict.return_value = {
+        "uuid": "1234",
+        "available_in_staff_sso": True,
+        "staff_sso_email_user_id": "joe.bloggs-1234abcd@example.com",  # /PS-IGNORE
+        "staff_sso_first_name": "Joe",
+        "staff_sso_last_name": "Bloggs",
+        "staff_sso_email_addresses": ["joe.bloggs@example.com"],  # /PS-IGNORE
+    }
+    search_results = mock.MagicMock()
+    search_results.__len__.return_value = 1
+    search_results.hits = [hit]
+    search = mock_search.return_value.using.return_value.update_from_dict.return_value
+    search.execute.return_value = search_results
+
+    staff_document = get_staff_document_from_staff_index(staff_uuid="1234")
+    assert staff_document.staff_sso_first_name == "Joe"
+    assert mock_search.call_count == 1
+
+    # The document has been stored in the staff directory.
+    entry = StaffDirectoryEntry.objects.get(uuid="1234")
+    assert (
+        entry.staff_sso_email_user_id == "joe.bloggs-1234abcd@example.com"
+    )  # /PS-IGNORE
+
+    get_staff_document_from_staff_index(staff_uuid="1234")
+    assert mock_search.call_count == 1
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.bulk", return_value=(0, []))
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_process_staff_index_changes(mock_get_search_connection, mock_bulk):
+    sso_user = ActivityStreamStaffSSOUserFactory(first_name="Joe")
+    StaffDirectoryEntry.objects.create(
+        uuid="1234",
+        staff_sso_email_user_id=sso_user.email_user_id,
+        staff_sso_first_name="Joseph",
+        people_finder_grade="Grade 7",
+    )
+    record_staff_index_changes(
+        email_user_ids=[
+            sso_user.email_user_id,
+            sso_user.email_user_id,
+            "left@example.com",
+        ]
+    )
+
+    assert process_staff_index_changes(batch_size=1) == 2
+    assert not StaffIndexChange.objects.exists()
+    assert mock_bulk.call_count == 2
+
+    actions = [action for call in mock_bulk.call_args_list for action in call.args[1]]
+    assert {(action["_op_type"], action["_id"]) for action in actions} == {
+        ("update", sso_user.email_user_id),
+        ("delete", "left@example.com"),
+    }
+    # The uuid is only set if the document is created.
+    update_action = next(action for action in actions if action["_op_type"] == "update")
+    assert "uuid" not in update_action["doc"]
+    assert update_action["upsert"]["uuid"] == "1234"
+
+    # The existing uuid is kept and the People Finder data is untouched.
+    entry = StaffDirectoryEntry.objects.get(
+        staff_sso_email_user_id=sso_user.email_user_id
+    )
+    assert entry.uuid == "1234"
+    assert entry.staff_sso_first_name == "Joe"
+    assert entry.people_finder_grade == "Grade 7"
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.bulk", return_value=(0, []))
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_process_staff_index_changes_new_entry(mock_get_search_connection, mock_bulk):
+    sso_user = ActivityStreamStaffSSOUserFactory()
+    record_staff_index_changes(email_user_ids=[sso_user.email_user_id])
+
+    assert process_staff_index_changes() == 1
+
+    # An existing document keeps its uuid, a new one gets the new entry's uuid.
+    [action] = mock_bulk.call_args.args[1]
+    assert "uuid" not in action["doc"]
+    entry = StaffDirectoryEntry.objects.get(
+        staff_sso_email_user_id=sso_user.email_user_id
+    )
+    assert entry.uuid
+    assert action["upsert"]["uuid"] == entry.uuid
+
+
+@pytest.mark.django_db
+@mock.patch(
+    "core.utils.staff_index.bulk",
+    side_effect=OpenSearchConnectionError("N/A", "Connection refused"),
+)
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_process_staff_index_changes_connection_error(
+    mock_get_search_connection, mock_bulk
+):
+    sso_user = ActivityStreamStaffSSOUserFactory()
+    record_staff_index_changes(email_user_ids=[sso_user.email_user_id, "other"])
+
+    assert process_staff_index_changes(batch_size=1) == 0
+    # The remaining batches are left for the next run.
+    assert mock_bulk.call_count == 1
+    assert StaffIndexChange.objects.count() == 2
+    assert not StaffDirectoryEntry.objects.exists()
+
+
+@pytest.mark.django_db
+@mock.patch("core.utils.staff_index.bulk")
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_process_staff_index_changes_failed_actions(
+    mock_get_search_connection, mock_bulk
+):
+    failed_sso_user = ActivityStreamStaffSSOUserFactory()
+    sso_user = ActivityStreamStaffSSOUserFactory()
+    record_staff_index_changes(
+        email_user_ids=[failed_sso_user.email_user_id, sso_user.email_user_id]
+    )
+    mock_bulk.return_value = (
+        1,
+        [
+            {
+                "update": {
+                    "_id": failed_sso_user.email_user_id,
+                    "status": 503,
+                    "error": "Unavailable",
+                }
+            }
+        ],
+    )
+
+    assert process_staff_index_changes() == 1
+    assert list(StaffIndexChange.objects.values_list("email_user_id", flat=True)) == [
+        failed_sso_user.email_user_id
+    ]
+    assert list(
+        StaffDirectoryEntry.objects.values_list("staff_sso_email_user_id", flat=True)
+    ) == [sso_user.email_user_id]
+
+
+def test_get_query_shape():
+    assert get_query_shape(
+        {
+            "query": {
+                "bool": {
+                    "should": [
+                        {
+                            "match": {
+                                "staff_sso_last_name": {"query": "Bloggs", "boost": 5.0}
+                            }
+                        },
+                        {
+                            "multi_match": {
+                                "query": "Joe Bloggs",
+                                "analyzer": "standard",
+                            }
+                        },
+                    ],
+                }
+            },
+            "size": 100,
+        }
+    ) == {
+        "query": {
+            "bool": {
+                "should": [
+                    {"match": {"staff_sso_last_name": {"query": "?", "boost": 5.0}}},
+                    {"multi_match": {"query": "?", "analyzer": "standard"}},
+                ],
+            }
+        },
+        "size": 100,
+    }
+
+
+@mock.patch("core.utils.staff_index.zero_result_search_counter")
+@mock.patch("core.utils.staff_index.Search")
+@mock.patch("core.utils.staff_index.get_search_connection")
+def test_search_staff_index_telemetry(
+    mock_get_search_connection, mock_search, mock_zero_result_counter, caplog, settings
+):
+    settings.SEARCH_SLOW_QUERY_THRESHOLD_MS = 0
+    search = mock_search.return_value.using.return_value.update_from_dict.return_value
+    search.execute.return_value.took = 12
+    search.execute.return_value.hits = []
+
+    assert search_staff_index(query="Joe Bloggs") == []
+
+    mock_zero_result_counter.add.assert_called_once_with(1)
+    assert "Slow staff index search" in caplog.text
+    assert '"took": 12' in caplog.text
+    # The search terms are not logged.
+    assert "Bloggs" not in caplog.text
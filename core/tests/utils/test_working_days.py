@@ -0,0 +1,119 @@
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from freezegun import freeze_time
+from govuk_bank_holidays.bank_holidays import BankHolidays
+
+from core.utils import working_days
+from core.utils.working_days import (
+    WorkingDayCalendar,
+    get_bank_holidays,
+    get_working_day_calendar,
+)
+
+# Good Friday and Easter Monday 2023.
+HOLIDAYS = [date(2023, 4, 7), date(2023, 4, 10)]
+
+
+class TestWorkingDayCalendar(TestCase):
+    def setUp(self):
+        self.calendar = WorkingDayCalendar(
+            HOLIDAYS, start=date(2023, 1, 1), end=date(2023, 12, 31)
+        )
+
+    def test_is_work_day(self):
+        self.assertTrue(self.calendar.is_work_day(date(2023, 4, 6)))
+        # Bank holiday
+        self.assertFalse(self.calendar.is_work_day(date(2023, 4, 7)))
+        # Weekend
+        self.assertFalse(self.calendar.is_work_day(date(2023, 4, 8)))
+
+    def test_add_work_days(self):
+        # Thursday before Easter
+        thursday = date(2023, 4, 6)
+        self.assertEqual(self.calendar.add_work_days(thursday, 0), thursday)
+        self.assertEqual(self.calendar.add_work_days(thursday, 1), date(2023, 4, 11))
+        self.assertEqual(self.calendar.add_work_days(thursday, 2), date(2023, 4, 12))
+        self.assertEqual(self.calendar.add_work_days(thursday, -1), date(2023, 4, 5))
+        self.assertEqual(self.calendar.add_work_days(thursday, -4), date(2023, 3, 31))
+
+    def test_add_work_days_from_non_work_day(self):
+        saturday = date(2023, 4, 8)
+        self.assertEqual(self.calendar.add_work_days(saturday, 1), date(2023, 4, 11))
+        self.assertEqual(self.calendar.add_work_days(saturday, -1), date(2023, 4, 6))
+
+    def test_next_and_previous_work_day(self):
+        self.assertEqual(
+            self.calendar.get_next_work_day(date(2023, 4, 6)), date(2023, 4, 11)
+        )
+        self.assertEqual(
+            self.calendar.get_previous_work_day(date(2023, 4, 11)), date(2023, 4, 6)
+        )
+
+    def test_outside_of_calendar(self):
+        # Across the end of the calendar
+        self.assertEqual(
+            self.calendar.add_work_days(date(2023, 12, 29), 1), date(2024, 1, 1)
+        )
+        # Across the start of the calendar
+        self.assertEqual(
+            self.calendar.add_work_days(date(2023, 1, 2), -1), date(2022, 12, 30)
+        )
+        # Outside of the calendar
+        self.assertEqual(
+            self.calendar.add_work_days(date(2030, 1, 4), 1), date(2030, 1, 7)
+        )
+
+    def test_matches_stepping_through_the_days(self):
+        for ordinal in range(
+            date(2023, 3, 20).toordinal(), date(2023, 4, 20).toordinal()
+        ):
+            d = date.fromordinal(ordinal)
+            for days in [-6, -1, 1, 6]:
+                self.assertEqual(
+                    self.calendar.add_work_days(d, days),
+                    self.calendar.step_work_days(d, days),
+                )
+
+
+class TestGetWorkingDayCalendar(TestCase):
+    def setUp(self):
+        cache.delete(working_days.BANK_HOLIDAYS_CACHE_KEY)
+        working_days._calendars.clear()
+
+    def tearDown(self):
+        working_days._calendars.clear()
+
+    def test_bank_holidays(self):
+        england_and_wales = get_bank_holidays(BankHolidays.ENGLAND_AND_WALES)
+        common = get_bank_holidays()
+
+        # Easter Monday isn't a bank holiday in Scotland.
+        self.assertIn(date(2023, 4, 10), england_and_wales)
+        self.assertNotIn(date(2023, 4, 10), common)
+        self.assertIn(date(2023, 12, 25), common)
+
+    @mock.patch(
+        "core.utils.working_days.fetch_bank_holidays",
+        wraps=working_days.fetch_bank_holidays,
+    )
+    def test_cached(self, mock_fetch_bank_holidays):
+        calendar = get_working_day_calendar()
+        get_bank_holidays(BankHolidays.ENGLAND_AND_WALES)
+
+        self.assertIs(get_working_day_calendar(), calendar)
+        mock_fetch_bank_holidays.assert_called_once()
+
+    def test_rebuilt_each_day(self):
+        with freeze_time("2023-01-09 09:00:00"):
+            calendar = get_working_day_calendar()
+            self.assertEqual(calendar.start, date(2013, 1, 1))
+            self.assertEqual(calendar.end, date(2033, 12, 31))
+
+        with freeze_time("2023-01-10 08:00:00"):
+            self.assertIs(get_working_day_calendar(), calendar)
+
+        with freeze_time("2023-01-10 10:00:00"):
+            self.assertIsNot(get_working_day_calendar(), calendar)
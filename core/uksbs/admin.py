@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from core.uksbs.models import OrgHierarchyLookup, OrgRelationship
+
+
+@admin.register(OrgHierarchyLookup)
+class OrgHierarchyLookupAdmin(admin.ModelAdmin):
+    list_display = ["fetched_at", "found"]
+    list_filter = ["found"]
+    exclude = ["person_id"]
+
+
+@admin.register(OrgRelationship)
+class OrgRelationshipAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "fetched_at"]
+    exclude = ["manager_person_id", "report_person_id", "manager", "report"]
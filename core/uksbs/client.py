@@ -1,9 +1,12 @@
 import logging
-from datetime import datetime
+import threading
+import time
 from typing import List, Optional
 
 from django.conf import settings
+from django.core.cache import cache
 from oauthlib.oauth2 import BackendApplicationClient
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
 from core.uksbs.types import AccessToken, LeavingData, PersonHierarchyData
@@ -19,8 +22,13 @@ class UKSBSPersonNotFound(Exception):
     pass
 
 
+# Refresh the access token this many seconds before it expires.
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+_thread_local = threading.local()
+
+
 class UKSBSClient:
-    token: Optional[AccessToken] = None
     scope: List[str] = ["team-hierarchy-DIT-scope", "leaver-submission-scope"]
 
     def __init__(self) -> None:
@@ -36,28 +44,57 @@ class UKSBSClient:
             raise ValueError("UKSBS_CLIENT_SECRET is not set")
         self.client_secret = settings.UKSBS_CLIENT_SECRET
 
-    def get_oauth_session(self) -> OAuth2Session:
-        client = BackendApplicationClient(client_id=self.client_id)
-
-        if self.token:
-            token_expiry_date = datetime.fromtimestamp(self.token["expires_at"])
-            if token_expiry_date > datetime.now():
-                return OAuth2Session(
-                    client=client,
-                    token=self.token,
-                    scope=self.scope,
-                )
-
-        oauth = OAuth2Session(
-            client=client,
-            scope=self.scope,
-        )
-        self.token = oauth.fetch_token(
+    @property
+    def token_cache_key(self) -> str:
+        return f"uksbs_access_token_{self.client_id}"
+
+    def get_token(self) -> AccessToken:
+        """Get an access token, shared by every process through the cache.
+
+        A new token is fetched when the cached one is about to expire.
+        """
+        token: Optional[AccessToken] = cache.get(self.token_cache_key)
+        if token and token["expires_at"] - TOKEN_REFRESH_MARGIN_SECONDS > time.time():
+            return token
+
+        token = self.get_session().fetch_token(
             token_url=self.token_url,
             client_id=self.client_id,
             client_secret=self.client_secret,
         )
-        return self.get_oauth_session()
+        cache.set(
+            self.token_cache_key,
+            token,
+            timeout=max(
+                int(token["expires_at"] - time.time()) - TOKEN_REFRESH_MARGIN_SECONDS,
+                1,
+            ),
+        )
+        return token
+
+    def get_session(self) -> OAuth2Session:
+        """Get a pooled OAuth session for the UK SBS API.
+
+        Sessions aren't guaranteed to be thread safe, so each thread gets its own.
+        """
+        oauth_session: Optional[OAuth2Session] = getattr(
+            _thread_local, "oauth_session", None
+        )
+        if oauth_session is None or oauth_session.client_id != self.client_id:
+            oauth_session = OAuth2Session(
+                client=BackendApplicationClient(client_id=self.client_id),
+                scope=self.scope,
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+            oauth_session.mount("https://", adapter)
+            oauth_session.mount("http://", adapter)
+            _thread_local.oauth_session = oauth_session
+        return oauth_session
+
+    def get_oauth_session(self) -> OAuth2Session:
+        oauth_session = self.get_session()
+        oauth_session.token = self.get_token()
+        return oauth_session
 
     def get_people_hierarchy(self, person_id: str) -> PersonHierarchyData:
         """
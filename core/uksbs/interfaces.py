@@ -1,8 +1,13 @@
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 
-from core.uksbs.client import UKSBSClient
+from django.conf import settings
+from django.core.cache import cache
+
+from core.uksbs.client import UKSBSClient, UKSBSPersonNotFound
 from core.uksbs.types import LeavingData, PersonHierarchyData
+from core.utils.cache import get_cached_value, get_request_cache
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +16,22 @@ class UKSBSUserNotFound(Exception):
     pass
 
 
+def get_user_hierarchy_cache_key(person_id: str) -> str:
+    # The person id is sensitive, so it isn't used in the key as is.
+    hashed_person_id = hashlib.sha256(str(person_id).encode()).hexdigest()
+    return f"uksbs_hierarchy_{hashed_person_id}"
+
+
+def clear_user_hierarchy_cache(person_id: str) -> None:
+    """Remove the cached UK SBS hierarchy for a person, e.g. when their manager
+    changes."""
+    cache_key = get_user_hierarchy_cache_key(person_id)
+    cache.delete(cache_key)
+    request_cache = get_request_cache()
+    if request_cache is not None:
+        request_cache.pop(cache_key, None)
+
+
 class UKSBSBase(ABC):
     @abstractmethod
     def get_user_hierarchy(self, person_id: str) -> PersonHierarchyData:
@@ -102,9 +123,27 @@ class UKSBSInterface(UKSBSBase):
         Get the person hierarchy data for given person_id.
 
         Note: person_id is sensitive data, never expose it to an end user or use it in logs.
-        """
 
-        return self.client.get_people_hierarchy(person_id=person_id)
+        The result is cached for the current request, and for
+        UKSBS_HIERARCHY_CACHE_TIMEOUT seconds.
+        """
+        cache_key = get_user_hierarchy_cache_key(person_id)
+
+        # Check if there is a result cached for this request
+        request_cache = get_request_cache()
+        if request_cache is not None and cache_key in request_cache:
+            return request_cache[cache_key]
+
+        hierarchy: PersonHierarchyData = get_cached_value(
+            cache_key,
+            lambda: self.client.get_people_hierarchy(person_id=person_id),
+            timeout=settings.UKSBS_HIERARCHY_CACHE_TIMEOUT,
+            not_found=UKSBSPersonNotFound,
+        )
+
+        if request_cache is not None:
+            request_cache[cache_key] = hierarchy
+        return hierarchy
 
     def submit_leaver_form(self, data: LeavingData) -> None:
         """
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.9 on 2026-10-19 13:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="OrgHierarchyLookup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("person_id", models.CharField(max_length=255, unique=True)),
+                ("found", models.BooleanField(default=True)),
+                ("fetched_at", models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="OrgRelationship",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("manager_person_id", models.CharField(db_index=True, max_length=255)),
+                ("report_person_id", models.CharField(db_index=True, max_length=255)),
+                ("manager", models.JSONField()),
+                ("report", models.JSONField()),
+                ("fetched_at", models.DateTimeField()),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("manager_person_id", "report_person_id"),
+                        name="unique_org_relationship",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import models
+
+
+class OrgHierarchyLookup(models.Model):
+    """
+    When a person's hierarchy was last fetched from UK SBS.
+
+    NEVER EXPOSE the person_id field.
+    """
+
+    person_id = models.CharField(max_length=255, unique=True)
+    found = models.BooleanField(default=True)
+    fetched_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"Org hierarchy lookup ({self.fetched_at})"
+
+
+class OrgRelationship(models.Model):
+    """
+    A manager/report relationship from a UK SBS hierarchy lookup.
+
+    NEVER EXPOSE the person id fields, or the person ids in the data fields.
+    """
+
+    manager_person_id = models.CharField(max_length=255, db_index=True)
+    report_person_id = models.CharField(max_length=255, db_index=True)
+    # The UK SBS PersonData of the manager and the report.
+    manager = models.JSONField()
+    report = models.JSONField()
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["manager_person_id", "report_person_id"],
+                name="unique_org_relationship",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.manager.get('full_name')} manages {self.report.get('full_name')}"
@@ -0,0 +1,166 @@
+"""
+A local store of the manager/report relationships from UK SBS.
+
+Every hierarchy fetched through this module is stored as `OrgRelationship`
+rows, so questions like "is X a manager of Y" and "who reports to X" can be
+answered with database queries. Hierarchies older than
+UKSBS_ORG_HIERARCHY_MAX_AGE_HOURS are still used, and are refreshed in
+batches by `refresh_stale_org_hierarchies`.
+
+Note: person ids are sensitive data, never expose them to an end user or use
+them in logs.
+"""
+
+import logging
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.uksbs import get_uksbs_interface
+from core.uksbs.client import UKSBSPersonNotFound
+from core.uksbs.models import OrgHierarchyLookup, OrgRelationship
+from core.uksbs.types import PersonData, PersonHierarchyData
+
+logger = logging.getLogger(__name__)
+
+
+def store_org_hierarchy(person_id: str, hierarchy: PersonHierarchyData) -> None:
+    """Replace the stored managers and reports of a person with the hierarchy."""
+    person_id = str(person_id)
+    now = timezone.now()
+    employee: PersonData = hierarchy["employee"][0]
+
+    relationships: List[OrgRelationship] = [
+        OrgRelationship(
+            manager_person_id=str(manager["person_id"]),
+            report_person_id=person_id,
+            manager=manager,
+            report=employee,
+            fetched_at=now,
+        )
+        for manager in hierarchy.get("manager", [])
+        if manager.get("person_id")
+    ] + [
+        OrgRelationship(
+            manager_person_id=person_id,
+            report_person_id=str(report["person_id"]),
+            manager=employee,
+            report=report,
+            fetched_at=now,
+        )
+        for report in hierarchy.get("report", [])
+        if report.get("person_id")
+    ]
+
+    with transaction.atomic():
+        OrgRelationship.objects.filter(
+            Q(manager_person_id=person_id) | Q(report_person_id=person_id)
+        ).delete()
+        OrgRelationship.objects.bulk_create(
+            relationships,
+            update_conflicts=True,
+            unique_fields=["manager_person_id", "report_person_id"],
+            update_fields=["manager", "report", "fetched_at"],
+        )
+        OrgHierarchyLookup.objects.update_or_create(
+            person_id=person_id,
+            defaults={"found": True, "fetched_at": now},
+        )
+
+
+def store_org_hierarchy_not_found(person_id: str) -> None:
+    person_id = str(person_id)
+    with transaction.atomic():
+        OrgRelationship.objects.filter(
+            Q(manager_person_id=person_id) | Q(report_person_id=person_id)
+        ).delete()
+        OrgHierarchyLookup.objects.update_or_create(
+            person_id=person_id,
+            defaults={"found": False, "fetched_at": timezone.now()},
+        )
+
+
+def fetch_org_hierarchy(person_id: str) -> None:
+    """Fetch a person's hierarchy from UK SBS and store it."""
+    uksbs_interface = get_uksbs_interface()
+    try:
+        hierarchy = uksbs_interface.get_user_hierarchy(person_id=person_id)
+    except UKSBSPersonNotFound:
+        store_org_hierarchy_not_found(person_id=person_id)
+    else:
+        store_org_hierarchy(person_id=person_id, hierarchy=hierarchy)
+
+
+def ensure_org_hierarchy(person_id: str) -> None:
+    """Fetch a person's hierarchy, unless it has been fetched before."""
+    if not OrgHierarchyLookup.objects.filter(person_id=str(person_id)).exists():
+        fetch_org_hierarchy(person_id=person_id)
+
+
+def expire_org_hierarchy(person_id: str) -> None:
+    """Forget when a person's hierarchy was fetched, so it is fetched again."""
+    OrgHierarchyLookup.objects.filter(person_id=str(person_id)).delete()
+
+
+def is_manager_of(*, manager_person_id: str, report_person_id: str) -> bool:
+    ensure_org_hierarchy(person_id=report_person_id)
+    return OrgRelationship.objects.filter(
+        manager_person_id=str(manager_person_id),
+        report_person_id=str(report_person_id),
+    ).exists()
+
+
+def get_managers(person_id: str) -> List[PersonData]:
+    ensure_org_hierarchy(person_id=person_id)
+    return list(
+        OrgRelationship.objects.filter(report_person_id=str(person_id))
+        .order_by("pk")
+        .values_list("manager", flat=True)
+    )
+
+
+def get_reports(person_id: str) -> List[PersonData]:
+    ensure_org_hierarchy(person_id=person_id)
+    return list(
+        OrgRelationship.objects.filter(manager_person_id=str(person_id))
+        .order_by("pk")
+        .values_list("report", flat=True)
+    )
+
+
+def refresh_stale_org_hierarchies(*, batch_size: int = 100) -> int:
+    """Fetch the oldest hierarchies that are past their max age again.
+
+    Args:
+        batch_size (int, optional):
+            The max number of hierarchies to fetch. Defaults to 100.
+
+    Returns:
+        int: The number of hierarchies that were fetched.
+    """
+    stale_before = timezone.now() - timedelta(
+        hours=settings.UKSBS_ORG_HIERARCHY_MAX_AGE_HOURS
+    )
+    stale_person_ids = list(
+        OrgHierarchyLookup.objects.filter(fetched_at__lt=stale_before)
+        .order_by("fetched_at")
+        .values_list("person_id", flat=True)[:batch_size]
+    )
+
+    refreshed_count = 0
+    for person_id in stale_person_ids:
+        try:
+            fetch_org_hierarchy(person_id=person_id)
+        except Exception:
+            logger.exception("Failed to refresh an org hierarchy")
+        else:
+            refreshed_count += 1
+
+    logger.info(
+        f"Refreshed {refreshed_count}/{len(stale_person_ids)} stale org hierarchies"
+    )
+    return refreshed_count
@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 import responses
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -44,6 +45,9 @@ FAKE_PERSON_DATA: PersonData = {
     UKSBS_POST_LEAVER_SUBMISSION="/new-leaver",
 )
 class TestUKSBSClient(TestCase):
+    def setUp(self):
+        cache.clear()
+
     def test_init(self):
         UKSBSClient()
 
@@ -73,11 +77,41 @@ class TestUKSBSClient(TestCase):
         )
 
         client = UKSBSClient()
-        client.token = {
-            "access_token": "foo",
-            "expires_at": ONE_WEEK_FROM_NOW.timestamp(),
-        }
-        client.get_oauth_session()
+        cache.set(
+            client.token_cache_key,
+            {
+                "access_token": "foo",
+                "expires_at": ONE_WEEK_FROM_NOW.timestamp(),
+            },
+        )
+        oauth_session = client.get_oauth_session()
+
+        self.assertEqual(oauth_session.access_token, "foo")
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_token_refreshed_before_expiry(self):
+        responses.add(
+            responses.POST,
+            "https://fake-uksbs.domain/getAccessToken",
+            json={
+                "access_token": "bar",
+                "expires_at": ONE_WEEK_FROM_NOW.timestamp(),
+            },
+        )
+
+        client = UKSBSClient()
+        cache.set(
+            client.token_cache_key,
+            {
+                "access_token": "foo",
+                "expires_at": (timezone.now() + timedelta(seconds=30)).timestamp(),
+            },
+        )
+        oauth_session = client.get_oauth_session()
+
+        self.assertEqual(oauth_session.access_token, "bar")
+        self.assertEqual(len(responses.calls), 1)
 
     @responses.activate
     def test_get_people_hierarchy(self):
@@ -105,6 +139,12 @@ class TestUKSBSClient(TestCase):
 
         client = UKSBSClient()
         client.get_people_hierarchy(person_id=666)
+        # The token is shared by new clients.
+        UKSBSClient().get_people_hierarchy(person_id=666)
+
+        self.assertEqual(
+            [call.request.method for call in responses.calls], ["POST", "GET", "GET"]
+        )
 
     @responses.activate
     def test_get_people_hierarchy_no_person(self):
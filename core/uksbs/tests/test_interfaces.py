@@ -0,0 +1,58 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.uksbs.client import UKSBSPersonNotFound
+from core.uksbs.interfaces import UKSBSInterface, clear_user_hierarchy_cache
+from core.utils.cache import request_cache_scope
+
+FAKE_HIERARCHY = {"manager": [], "employee": [{"person_id": "666"}], "report": []}
+
+
+@override_settings(
+    UKSBS_CLIENT_ID="fake_client_id",
+    UKSBS_CLIENT_SECRET="fake_client_secret",  # pragma: allowlist secret
+    UKSBS_TOKEN_URL="https://fake-uksbs.domain/getAccessToken",
+)
+@mock.patch("core.uksbs.interfaces.UKSBSClient.get_people_hierarchy")
+class TestUKSBSInterfaceGetUserHierarchy(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cached(self, mock_get_people_hierarchy):
+        mock_get_people_hierarchy.return_value = FAKE_HIERARCHY
+
+        for _ in range(2):
+            self.assertEqual(
+                UKSBSInterface().get_user_hierarchy(person_id="666"), FAKE_HIERARCHY
+            )
+        mock_get_people_hierarchy.assert_called_once_with(person_id="666")
+
+    def test_cached_for_request(self, mock_get_people_hierarchy):
+        mock_get_people_hierarchy.return_value = FAKE_HIERARCHY
+
+        with request_cache_scope():
+            UKSBSInterface().get_user_hierarchy(person_id="666")
+            cache.clear()
+            UKSBSInterface().get_user_hierarchy(person_id="666")
+
+        mock_get_people_hierarchy.assert_called_once()
+
+    def test_clear_user_hierarchy_cache(self, mock_get_people_hierarchy):
+        mock_get_people_hierarchy.return_value = FAKE_HIERARCHY
+
+        with request_cache_scope():
+            UKSBSInterface().get_user_hierarchy(person_id="666")
+            clear_user_hierarchy_cache(person_id="666")
+            UKSBSInterface().get_user_hierarchy(person_id="666")
+
+        self.assertEqual(mock_get_people_hierarchy.call_count, 2)
+
+    def test_person_not_found_cached(self, mock_get_people_hierarchy):
+        mock_get_people_hierarchy.side_effect = UKSBSPersonNotFound
+
+        for _ in range(2):
+            with self.assertRaises(UKSBSPersonNotFound):
+                UKSBSInterface().get_user_hierarchy(person_id="666")
+        mock_get_people_hierarchy.assert_called_once()
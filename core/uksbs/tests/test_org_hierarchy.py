@@ -0,0 +1,85 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.uksbs.client import UKSBSPersonNotFound
+from core.uksbs.models import OrgHierarchyLookup, OrgRelationship
+from core.uksbs.org_hierarchy import (
+    expire_org_hierarchy,
+    get_managers,
+    get_reports,
+    is_manager_of,
+    refresh_stale_org_hierarchies,
+)
+
+
+def fake_person(person_id: str):
+    return {"person_id": person_id, "full_name": f"Person {person_id}"}
+
+
+def fake_hierarchy(person_id: str, managers=("1",), reports=("3", "4")):
+    return {
+        "manager": [fake_person(manager) for manager in managers],
+        "employee": [fake_person(person_id)],
+        "report": [fake_person(report) for report in reports],
+    }
+
+
+@mock.patch("core.uksbs.org_hierarchy.get_uksbs_interface")
+class TestOrgHierarchy(TestCase):
+    def test_hierarchy_is_stored(self, mock_get_uksbs_interface):
+        get_user_hierarchy = mock_get_uksbs_interface.return_value.get_user_hierarchy
+        get_user_hierarchy.return_value = fake_hierarchy("2")
+
+        self.assertTrue(is_manager_of(manager_person_id="1", report_person_id="2"))
+        self.assertFalse(is_manager_of(manager_person_id="3", report_person_id="2"))
+        self.assertEqual(get_managers(person_id="2"), [fake_person("1")])
+        self.assertEqual(
+            get_reports(person_id="2"), [fake_person("3"), fake_person("4")]
+        )
+
+        get_user_hierarchy.assert_called_once_with(person_id="2")
+
+    def test_hierarchy_is_replaced(self, mock_get_uksbs_interface):
+        get_user_hierarchy = mock_get_uksbs_interface.return_value.get_user_hierarchy
+        get_user_hierarchy.return_value = fake_hierarchy("2")
+        get_reports(person_id="2")
+
+        get_user_hierarchy.return_value = fake_hierarchy("2", managers=["5"])
+        expire_org_hierarchy(person_id="2")
+
+        self.assertFalse(is_manager_of(manager_person_id="1", report_person_id="2"))
+        self.assertTrue(is_manager_of(manager_person_id="5", report_person_id="2"))
+        self.assertEqual(OrgRelationship.objects.count(), 3)
+
+    def test_person_not_found(self, mock_get_uksbs_interface):
+        get_user_hierarchy = mock_get_uksbs_interface.return_value.get_user_hierarchy
+        get_user_hierarchy.side_effect = UKSBSPersonNotFound
+
+        self.assertEqual(get_reports(person_id="2"), [])
+        self.assertEqual(get_managers(person_id="2"), [])
+
+        get_user_hierarchy.assert_called_once()
+        self.assertFalse(OrgHierarchyLookup.objects.get(person_id="2").found)
+
+    @override_settings(UKSBS_ORG_HIERARCHY_MAX_AGE_HOURS=12)
+    def test_refresh_stale_org_hierarchies(self, mock_get_uksbs_interface):
+        get_user_hierarchy = mock_get_uksbs_interface.return_value.get_user_hierarchy
+        get_user_hierarchy.side_effect = lambda person_id: fake_hierarchy(person_id)
+        for person_id in ["2", "3", "4"]:
+            get_reports(person_id=person_id)
+        OrgHierarchyLookup.objects.exclude(person_id="4").update(
+            fetched_at=timezone.now() - timedelta(hours=13)
+        )
+        get_user_hierarchy.reset_mock()
+
+        self.assertEqual(refresh_stale_org_hierarchies(batch_size=1), 1)
+        self.assertEqual(refresh_stale_org_hierarchies(batch_size=10), 1)
+        self.assertEqual(refresh_stale_org_hierarchies(batch_size=10), 0)
+
+        self.assertCountEqual(
+            [c.kwargs["person_id"] for c in get_user_hierarchy.call_args_list],
+            ["2", "3"],
+        )
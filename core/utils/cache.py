@@ -0,0 +1,192 @@
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, Type, TypeVar
+
+from asgiref.local import Local
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Cached in place of a value when the lookup found nothing, namespaced so it
+# can't be mistaken for a real value.
+NOT_FOUND = "core.utils.cache:not_found"
+
+# How often to check for a value that another process is fetching.
+WAIT_INTERVAL_SECONDS = 0.1
+
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="cache_refresh"
+)
+
+
+def set_cached_value(
+    key: str, value: Any, *, timeout: int, stale_timeout: int = 0
+) -> None:
+    """Cache a value for `get_cached_value`.
+
+    The value is fresh for `timeout` seconds, and can be served stale for a
+    further `stale_timeout` seconds while it is refreshed.
+    """
+    entry: Dict[str, Any] = {"value": value, "fresh_until": time.time() + timeout}
+    cache.set(key, entry, timeout=timeout + stale_timeout)
+
+
+@dataclass
+class CachedValue(Generic[T]):
+    """A cached value, see `get_cached_value`."""
+
+    key: str
+    fetch: Callable[[], T]
+    timeout: int
+    stale_timeout: int = 0
+    not_found: Optional[Type[Exception]] = None
+    not_found_timeout: Optional[int] = None
+    lock_timeout: int = 30
+    wait_timeout: float = 5
+    # Identifies this holder of the lock.
+    token: str = field(default_factory=lambda: uuid.uuid4().hex, init=False)
+
+    @property
+    def lock_key(self) -> str:
+        return f"{self.key}:lock"
+
+    def lock(self) -> bool:
+        return cache.add(self.lock_key, self.token, timeout=self.lock_timeout)
+
+    def unlock(self) -> None:
+        # Only release the lock if it hasn't expired and passed to another fetch.
+        if cache.get(self.lock_key) == self.token:
+            cache.delete(self.lock_key)
+
+    def get(self) -> T:
+        entry: Optional[Dict[str, Any]] = cache.get(self.key)
+
+        if entry:
+            # Refresh stale values in the background, unless another process is.
+            if entry["fresh_until"] < time.time() and self.lock():
+                _refresh_executor.submit(self.refresh)
+            return self.get_value(entry["value"])
+
+        if not self.lock():
+            return self.wait_for_value()
+
+        try:
+            return self.get_value(self.fetch_and_cache())
+        finally:
+            self.unlock()
+
+    def get_value(self, value: Any) -> T:
+        if self.not_found and value == NOT_FOUND:
+            raise self.not_found()
+        return value
+
+    def fetch_and_cache(self) -> Any:
+        try:
+            value: Any = self.fetch()
+            timeout = self.timeout
+        except Exception as e:
+            if not self.not_found or not isinstance(e, self.not_found):
+                raise
+            value = NOT_FOUND
+            timeout = self.not_found_timeout or self.timeout
+
+        set_cached_value(
+            self.key, value, timeout=timeout, stale_timeout=self.stale_timeout
+        )
+        return value
+
+    def refresh(self) -> None:
+        try:
+            self.fetch_and_cache()
+        except Exception:
+            logger.exception(f"Failed to refresh the cached value for '{self.key}'")
+        finally:
+            self.unlock()
+
+    def wait_for_value(self) -> T:
+        """Wait for another process to fetch the value."""
+        wait_until = time.monotonic() + self.wait_timeout
+        while time.monotonic() < wait_until:
+            time.sleep(WAIT_INTERVAL_SECONDS)
+            if entry := cache.get(self.key):
+                return self.get_value(entry["value"])
+
+        logger.warning(f"Timed out waiting for the cached value for '{self.key}'")
+        return self.get_value(self.fetch_and_cache())
+
+
+def get_cached_value(
+    key: str,
+    fetch: Callable[[], T],
+    *,
+    timeout: int,
+    stale_timeout: int = 0,
+    not_found: Optional[Type[Exception]] = None,
+    not_found_timeout: Optional[int] = None,
+    lock_timeout: int = 30,
+    wait_timeout: float = 5,
+) -> T:
+    """Get a value from the cache, or fetch and cache it.
+
+    Only one process fetches a missing value, the others wait for it to be
+    cached (for up to `wait_timeout` seconds, before fetching it themselves).
+
+    Stale values are served while one process refreshes the value in the
+    background. If the refresh fails, the stale value stays in the cache.
+
+    Args:
+        key (str): The cache key.
+        fetch (Callable[[], T]): Fetches the value when it isn't cached.
+        timeout (int): Seconds the value is fresh for.
+        stale_timeout (int, optional):
+            Seconds the value can be served stale for. Defaults to 0.
+        not_found (Optional[Type[Exception]], optional):
+            The exception `fetch` raises when there is no value. It is cached,
+            and raised again on a cache hit. Defaults to None.
+        not_found_timeout (Optional[int], optional):
+            Seconds to cache `not_found` for. Defaults to `timeout`.
+        lock_timeout (int, optional):
+            Seconds a fetch can hold the lock for. Defaults to 30.
+        wait_timeout (float, optional):
+            Seconds to wait for another process to fetch the value. Defaults to 5.
+
+    Returns:
+        T: The value.
+    """
+    return CachedValue(
+        key=key,
+        fetch=fetch,
+        timeout=timeout,
+        stale_timeout=stale_timeout,
+        not_found=not_found,
+        not_found_timeout=not_found_timeout,
+        lock_timeout=lock_timeout,
+        wait_timeout=wait_timeout,
+    ).get()
+
+
+_request_local = Local()
+
+
+@contextmanager
+def request_cache_scope() -> Iterator[None]:
+    """Start a request cache, that is cleared when the context exits."""
+    _request_local.cache = {}
+    try:
+        yield
+    finally:
+        del _request_local.cache
+
+
+def get_request_cache() -> Optional[Dict[str, Any]]:
+    """Get the cache for the current request, if there is one.
+
+    See `RequestCacheMiddleware`.
+    """
+    return getattr(_request_local, "cache", None)
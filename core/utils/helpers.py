@@ -1,8 +1,8 @@
-from datetime import date, datetime
+from datetime import date, datetime, time
 from enum import Enum
 from typing import Literal, Optional
 
-from govuk_bank_holidays.bank_holidays import BankHolidays
+from core.utils.working_days import get_working_day_calendar
 
 # 1 January 2022
 DATE_FORMAT_STR = "%d %B %Y"
@@ -45,10 +45,7 @@ def make_possessive(word: Optional[str]) -> str:
 def is_work_day_and_time(dt: datetime) -> bool:
     """Returns True if it is a work day and during working hours."""
 
-    bank_holidays = BankHolidays()
-
-    d = dt.date()
-    if not bank_holidays.is_work_day(date=d):
+    if not get_working_day_calendar().is_work_day(dt.date()):
         return False
 
     # Check to see if the time is between 9-5.
@@ -57,8 +54,21 @@ def is_work_day_and_time(dt: datetime) -> bool:
     return False
 
 
+def get_next_work_day_and_time(dt: datetime) -> datetime:
+    """Returns `dt` if it is during working hours, otherwise the start of the next."""
+
+    if is_work_day_and_time(dt):
+        return dt
+
+    calendar = get_working_day_calendar()
+
+    d = dt.date()
+    if not calendar.is_work_day(d) or dt.hour >= 9:
+        d = calendar.get_next_work_day(d)
+    return datetime.combine(d, time(hour=9), tzinfo=dt.tzinfo)
+
+
 def get_next_workday(d: date) -> date:
     """Returns the next work day."""
 
-    bank_holidays = BankHolidays()
-    return bank_holidays.get_next_work_day(date=d)
+    return get_working_day_calendar().get_next_work_day(d)
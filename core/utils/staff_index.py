@@ -1,20 +1,53 @@
+import json
 import logging
+import time
 import uuid
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from functools import partial, wraps
-from typing import Any, Dict, List, Mapping, Optional, TypedDict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypedDict,
+)
 
 from dataclasses_json import DataClassJsonMixin
 from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.utils import timezone
 from opensearch_dsl import Search
 from opensearch_dsl.response import Hit
 from opensearchpy import OpenSearch
-from opensearchpy.exceptions import NotFoundError
+from opensearchpy.exceptions import NotFoundError, TransportError
+from opensearchpy.helpers import bulk
+from opentelemetry import metrics
 
 from activity_stream.models import ActivityStreamStaffSSOUser
+from core.staff_search.models import StaffDirectoryEntry, StaffIndexChange
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+operation_duration_histogram = meter.create_histogram(
+    "staff_index.operation.duration",
+    unit="ms",
+    description="Time taken by Staff index operations, split by operation.",
+)
+search_took_histogram = meter.create_histogram(
+    "staff_index.search.took",
+    unit="ms",
+    description="Time taken by OpenSearch to execute Staff index searches.",
+)
+zero_result_search_counter = meter.create_counter(
+    "staff_index.search.zero_results",
+    description="Number of Staff index searches that returned no results.",
+)
 
 
 MAX_RESULTS = 100
@@ -70,6 +103,15 @@ class StaffDocument(DataClassJsonMixin):
     people_finder_photo_small: Optional[str]
 
 
+STAFF_DOCUMENT_FIELDS: List[str] = [field.name for field in fields(StaffDocument)]
+# The StaffDocument fields that are populated from Staff SSO.
+STAFF_SSO_DOCUMENT_FIELDS: List[str] = [
+    field
+    for field in STAFF_DOCUMENT_FIELDS
+    if field == "available_in_staff_sso" or field.startswith("staff_sso_")
+]
+
+
 class ConsolidatedStaffDocument(TypedDict):
     uuid: str
     available_in_staff_sso: bool
@@ -87,6 +129,61 @@ class ConsolidatedStaffDocument(TypedDict):
     photo_small: str
 
 
+def get_query_shape(query: Any) -> Any:
+    """Get the shape of an OpenSearch query with the search terms removed.
+
+    This allows queries to be logged without including any personal data.
+    """
+    if isinstance(query, dict):
+        return {
+            key: (
+                "?"
+                if key == "query" and isinstance(value, str)
+                else get_query_shape(value)
+            )
+            for key, value in query.items()
+        }
+    if isinstance(query, list):
+        return [get_query_shape(value) for value in query]
+    return query
+
+
+@contextmanager
+def staff_index_operation(
+    operation: str, query: Optional[Mapping[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Record the duration of a Staff index operation.
+
+    Operations that are slower than `SEARCH_SLOW_QUERY_THRESHOLD_MS` are
+    logged, along with the shape of the query and any details added to the
+    yielded dict.
+
+    Args:
+        operation (str):
+            The name of the operation, e.g. "search" or "update".
+        query (Optional[Mapping[str, Any]], optional):
+            The query sent to OpenSearch. Defaults to None.
+
+    Yields:
+        Dict[str, Any]: Details about the operation to include in the slow log.
+    """
+    details: Dict[str, Any] = {}
+    start = time.perf_counter()
+    try:
+        yield details
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        operation_duration_histogram.record(duration_ms, {"operation": operation})
+
+        if duration_ms >= settings.SEARCH_SLOW_QUERY_THRESHOLD_MS:
+            if query is not None:
+                details["query"] = get_query_shape(query)
+            logger.warning(
+                f"Slow staff index {operation} took {duration_ms:.0f}ms: "
+                f"{json.dumps(details, default=str)}"
+            )
+
+
 def get_search_connection() -> OpenSearch:
     """Get the OpenSearch connection.
 
@@ -112,6 +209,8 @@ def delete_staff_index():
     search_client = get_search_connection()
     search_client.indices.delete(index=STAFF_INDEX_NAME)
 
+    StaffDirectoryEntry.objects.all().delete()
+
 
 def clear_staff_index():
     """Delete all documents from the index."""
@@ -122,6 +221,8 @@ def clear_staff_index():
         ignore=400,
     )
 
+    StaffDirectoryEntry.objects.all().delete()
+
 
 class StaffIndexNotFound(Exception):
     pass
@@ -151,6 +252,7 @@ def search_staff_index(
     query: str,
     exclude_staff_ids: Optional[List[str]] = None,
     present_in_sso: bool = True,
+    index_name: str = STAFF_INDEX_NAME,
 ) -> List[StaffDocument]:
     """Search the Staff index.
 
@@ -163,6 +265,9 @@ def search_staff_index(
         present_in_sso (bool, optional):
             Whether to only return results that are present in Staff SSO.
             Defaults to True.
+        index_name (str, optional):
+            The index to search, used when benchmarking.
+            Defaults to STAFF_INDEX_NAME.
 
     Returns:
         List[StaffDocument]
@@ -224,12 +329,14 @@ def search_staff_index(
         "min_score": MIN_SCORE,
     }
 
-    search = (
-        Search(index=STAFF_INDEX_NAME)
-        .using(search_client)
-        .update_from_dict(search_dict)
-    )
-    search_results = search.execute()
+    search = Search(index=index_name).using(search_client).update_from_dict(search_dict)
+    with staff_index_operation("search", search_dict) as details:
+        search_results = search.execute()
+        details.update(took=search_results.took, hits=len(search_results.hits))
+
+    search_took_histogram.record(search_results.took)
+    if not search_results.hits:
+        zero_result_search_counter.add(1)
 
     staff_documents = []
     for hit in search_results.hits:
@@ -257,6 +364,9 @@ def get_staff_document_from_staff_index(
 ) -> StaffDocument:
     """Get a Staff document from the Staff index.
 
+    The local staff directory is checked first, OpenSearch is only queried
+    (and the result stored in the directory) when there is no matching entry.
+
     Args:
         sso_email_user_id (Optional[str], optional):
             The email user id to search for. Defaults to None.
@@ -290,6 +400,37 @@ def get_staff_document_from_staff_index(
             "not multiple/all."
         )
 
+    try:
+        return get_staff_document_from_staff_directory(
+            sso_email_user_id=sso_email_user_id,
+            staff_uuid=staff_uuid,
+            sso_email_address=sso_email_address,
+        )
+    except StaffDocumentNotFound:
+        pass
+
+    staff_document = _get_staff_document_from_opensearch(
+        sso_email_user_id=sso_email_user_id,
+        staff_uuid=staff_uuid,
+        sso_email_address=sso_email_address,
+    )
+    # Store the document locally so the next exact lookup doesn't need OpenSearch.
+    if staff_document.staff_sso_email_user_id:
+        update_staff_directory_entry(
+            staff_document.staff_sso_email_user_id,
+            staff_document.to_dict(),
+            upsert=True,
+        )
+
+    return staff_document
+
+
+def _get_staff_document_from_opensearch(
+    *,
+    sso_email_user_id: Optional[str] = None,
+    staff_uuid: Optional[str] = None,
+    sso_email_address: Optional[str] = None,
+) -> StaffDocument:
     search_dict = {}
     if sso_email_user_id:
         search_dict = {
@@ -329,7 +470,9 @@ def get_staff_document_from_staff_index(
         .using(search_client)
         .update_from_dict(search_dict)
     )
-    search_results = search.execute()
+    with staff_index_operation("exact_lookup", search_dict) as details:
+        search_results = search.execute()
+        details.update(took=search_results.took, hits=len(search_results.hits))
 
     if len(search_results) == 0:
         raise StaffDocumentNotFound()
@@ -341,6 +484,56 @@ def get_staff_document_from_staff_index(
     return StaffDocument.from_dict(hit.to_dict(), infer_missing=True)
 
 
+def get_staff_document_from_staff_directory(
+    *,
+    sso_email_user_id: Optional[str] = None,
+    staff_uuid: Optional[str] = None,
+    sso_email_address: Optional[str] = None,
+) -> StaffDocument:
+    """Get a Staff document from the local staff directory.
+
+    Args:
+        sso_email_user_id (Optional[str], optional):
+            The email user id to look up. Defaults to None.
+        staff_uuid (Optional[str], optional):
+            The staff UUID to look up. Defaults to None.
+        sso_email_address (Optional[str], optional):
+            The SSO email address to look up. Defaults to None.
+
+    Raises:
+        StaffDocumentNotFound:
+            If no entry is found.
+        TooManyStaffDocumentsFound:
+            If more than one entry is found.
+
+    Returns:
+        StaffDocument
+    """
+    entries = StaffDirectoryEntry.objects.all()
+    if sso_email_user_id:
+        entries = entries.filter(staff_sso_email_user_id=sso_email_user_id)
+    elif staff_uuid:
+        entries = entries.filter(uuid=str(staff_uuid))
+    elif sso_email_address:
+        entries = entries.filter(
+            staff_sso_email_addresses__contains=[sso_email_address]
+        )
+    else:
+        raise StaffDocumentNotFound()
+
+    matching_entries = list(entries[:2])
+    if len(matching_entries) == 0:
+        raise StaffDocumentNotFound()
+    if len(matching_entries) > 1:
+        raise TooManyStaffDocumentsFound()
+
+    entry = matching_entries[0]
+    return StaffDocument.from_dict(
+        {field: getattr(entry, field) for field in STAFF_DOCUMENT_FIELDS},
+        infer_missing=True,
+    )
+
+
 def consolidate_staff_documents(
     *, staff_documents: List[StaffDocument]
 ) -> List[ConsolidatedStaffDocument]:
@@ -414,9 +607,7 @@ def get_people_finder_data(
             sso_legacy_user_id=staff_sso_user.user_id,
         )
     except PeopleFinderPersonNotFound:
-        logger.exception(
-            f"Could not find '{staff_sso_user}' in People Finder", exc_info=True
-        )
+        logger.warning(f"Could not find '{staff_sso_user}' in People Finder")
 
     if people_finder_result:
         people_finder_data["people_finder_email"] = people_finder_result.email
@@ -522,7 +713,10 @@ def get_sso_user_by_staff_document_uuid(uuid: str) -> ActivityStreamStaffSSOUser
 def delete_staff_document(id: str) -> None:
     """Delete the related staff document in the staff search index."""
     search_client = get_search_connection()
-    search_client.delete(index=STAFF_INDEX_NAME, id=id)
+    with staff_index_operation("delete"):
+        search_client.delete(index=STAFF_INDEX_NAME, id=id)
+
+    StaffDirectoryEntry.objects.filter(staff_sso_email_user_id=id).delete()
 
 
 def update_staff_document(
@@ -537,11 +731,44 @@ def update_staff_document(
         body |= {"upsert": staff_document}
 
     # https://opensearch.org/docs/latest/opensearch/index-data/#update-data
-    search_client.update(
-        index=STAFF_INDEX_NAME,
-        body=body,
-        id=id,
-    )
+    with staff_index_operation("update"):
+        search_client.update(
+            index=STAFF_INDEX_NAME,
+            body=body,
+            id=id,
+        )
+
+    update_staff_directory_entry(id, staff_document, upsert=upsert)
+
+
+def update_staff_directory_entry(
+    id: str, staff_document: dict[str, Any], upsert: bool = False
+) -> None:
+    """Update the related entry in the local staff directory.
+
+    Only the fields of a StaffDocument are stored, anything else in the
+    document is ignored.
+    """
+    entry_values: Dict[str, Any] = {}
+    for field_name, value in staff_document.items():
+        if field_name not in STAFF_DOCUMENT_FIELDS:
+            continue
+        if field_name == "staff_sso_email_user_id":
+            continue
+        if value is None and not StaffDirectoryEntry._meta.get_field(field_name).null:
+            continue
+        entry_values[field_name] = value
+
+    if upsert:
+        StaffDirectoryEntry.objects.update_or_create(
+            staff_sso_email_user_id=id,
+            defaults=entry_values,
+        )
+    else:
+        StaffDirectoryEntry.objects.filter(staff_sso_email_user_id=id).update(
+            updated_at=timezone.now(),
+            **entry_values,
+        )
 
 
 def staff_document_updater(func, upsert=False):
@@ -584,15 +811,229 @@ def index_sso_users():
         doc_id = sso_user.email_user_id
         doc: Dict[str, Any] = {
             "uuid": str(uuid.uuid4()),
-            "available_in_staff_sso": sso_user.available,
-            "staff_sso_activity_stream_id": sso_user.identifier,
-            "staff_sso_email_user_id": sso_user.email_user_id,
-            "staff_sso_legacy_id": sso_user.user_id,
-            "staff_sso_first_name": sso_user.first_name,
-            "staff_sso_last_name": sso_user.last_name,
-            "staff_sso_contact_email_address": sso_user.contact_email_address or "",
-            # `emails` come from the annotate in the queryset.
-            "staff_sso_email_addresses": sso_user.emails,
+            **get_sso_user_staff_document_data(sso_user=sso_user),
         }
 
         yield doc_id, doc
+
+
+def get_sso_user_staff_document_data(
+    *, sso_user: ActivityStreamStaffSSOUser
+) -> Dict[str, Any]:
+    """Get the Staff SSO fields of a StaffDocument for the given user.
+
+    The user must be annotated with `emails`, see
+    `ActivityStreamStaffSSOUserQuerySet.with_emails`.
+    """
+    return {
+        "available_in_staff_sso": sso_user.available,
+        "staff_sso_activity_stream_id": sso_user.identifier,
+        "staff_sso_email_user_id": sso_user.email_user_id,
+        "staff_sso_legacy_id": sso_user.user_id,
+        "staff_sso_first_name": sso_user.first_name,
+        "staff_sso_last_name": sso_user.last_name,
+        "staff_sso_contact_email_address": sso_user.contact_email_address or "",
+        # `emails` come from the annotate in the queryset.
+        "staff_sso_email_addresses": sso_user.emails,
+    }
+
+
+def record_staff_index_changes(*, email_user_ids: Iterable[str]) -> None:
+    """Record Staff SSO users whose Staff index document is out of date.
+
+    The changes are applied by `process_staff_index_changes`.
+    """
+    StaffIndexChange.objects.bulk_create(
+        [
+            StaffIndexChange(email_user_id=email_user_id)
+            for email_user_id in set(email_user_ids)
+        ]
+    )
+
+
+def process_staff_index_changes(*, batch_size: int = 500) -> int:
+    """Apply the recorded Staff SSO changes to the staff search index.
+
+    Changes are processed in batches, each batch is sent to OpenSearch as a
+    single bulk request and written to the staff directory in one query.
+
+    Changes that OpenSearch failed to apply are kept, to be retried on the
+    next run. If OpenSearch can't be reached, the remaining batches are left
+    for the next run.
+
+    Args:
+        batch_size (int, optional):
+            The number of changes to process per batch. Defaults to 500.
+
+    Returns:
+        int: The number of changes processed.
+    """
+    processed = 0
+    last_pk = 0
+    while changes := list(
+        StaffIndexChange.objects.filter(pk__gt=last_pk)
+        .order_by("pk")
+        .values_list("pk", "email_user_id")[:batch_size]
+    ):
+        last_pk = changes[-1][0]
+        email_user_ids = {email_user_id for _, email_user_id in changes}
+
+        try:
+            failed_doc_ids = apply_staff_index_changes(email_user_ids=email_user_ids)
+        except TransportError:
+            logger.exception("Failed to send staff index changes, will retry")
+            break
+
+        applied_change_pks = [
+            change_pk
+            for change_pk, email_user_id in changes
+            if email_user_id not in failed_doc_ids
+        ]
+        StaffIndexChange.objects.filter(pk__in=applied_change_pks).delete()
+        processed += len(applied_change_pks)
+
+    logger.info(f"Processed {processed} staff index changes")
+    return processed
+
+
+def run_staff_index_bulk_actions(actions: List[Dict[str, Any]]) -> Set[str]:
+    """Send the actions to the staff search index in a single bulk request.
+
+    Actions on documents that aren't in the index are skipped, any other
+    errors are logged.
+
+    Raises:
+        TransportError: If the bulk request itself fails.
+
+    Returns:
+        Set[str]: The ids of the documents whose actions failed.
+    """
+    if not actions:
+        return set()
+
+    with staff_index_operation("bulk") as details:
+        _, errors = bulk(
+            get_search_connection(),
+            actions,
+            raise_on_error=False,
+        )
+        details.update(actions=len(actions), errors=len(errors))
+
+    failed_doc_ids: Set[str] = set()
+    for error in errors:
+        for result in error.values():
+            if result.get("status") == 404:
+                continue
+            failed_doc_ids.add(result["_id"])
+            logger.error(f"Failed to apply staff index change: {error}")
+    return failed_doc_ids
+
+
+def bulk_update_staff_documents(
+    staff_documents: Mapping[str, Dict[str, Any]], upsert: bool = False
+) -> None:
+    """Update many staff documents in the staff search index at once.
+
+    Only the documents that were updated in the index are updated in the
+    staff directory, so the others are updated again next time.
+
+    Args:
+        staff_documents (Mapping[str, Dict[str, Any]]):
+            The (partial) documents to update, keyed by document id.
+        upsert (bool, optional):
+            Whether to create the documents that don't exist. Defaults to False.
+
+    Raises:
+        TransportError: If the bulk request fails.
+    """
+    failed_doc_ids = run_staff_index_bulk_actions(
+        [
+            {
+                "_op_type": "update",
+                "_index": STAFF_INDEX_NAME,
+                "_id": doc_id,
+                "doc": doc,
+                "doc_as_upsert": upsert,
+            }
+            for doc_id, doc in staff_documents.items()
+        ]
+    )
+
+    for doc_id, doc in staff_documents.items():
+        if doc_id in failed_doc_ids:
+            continue
+        update_staff_directory_entry(doc_id, doc, upsert=upsert)
+
+
+def apply_staff_index_changes(*, email_user_ids: Set[str]) -> Set[str]:
+    """Bring the Staff SSO data in the index in line with the database.
+
+    Documents are upserted for the users that exist and deleted for the ids
+    that no longer match a user. The staff directory is only changed for the
+    documents that were changed in the index.
+
+    Raises:
+        TransportError: If the bulk request fails.
+
+    Returns:
+        Set[str]: The ids of the documents that failed to change.
+    """
+    existing_uuids: Dict[str, str] = dict(
+        StaffDirectoryEntry.objects.filter(
+            staff_sso_email_user_id__in=email_user_ids
+        ).values_list("staff_sso_email_user_id", "uuid")
+    )
+
+    staff_documents: Dict[str, Dict[str, Any]] = {}
+    # The uuid for each document, if it is created.
+    doc_uuids: Dict[str, str] = {}
+    for sso_user in ActivityStreamStaffSSOUser.objects.filter(
+        email_user_id__in=email_user_ids
+    ).with_emails():
+        doc_id = sso_user.email_user_id
+        staff_documents[doc_id] = get_sso_user_staff_document_data(sso_user=sso_user)
+        doc_uuids[doc_id] = existing_uuids.get(doc_id) or str(uuid.uuid4())
+    deleted_doc_ids = email_user_ids - staff_documents.keys()
+
+    # The uuid is only set when the document is created, so the uuid of a
+    # document that is already in the index (and links to this person) is
+    # kept, even if it isn't in the staff directory.
+    actions: List[Dict[str, Any]] = [
+        {
+            "_op_type": "update",
+            "_index": STAFF_INDEX_NAME,
+            "_id": doc_id,
+            "doc": doc,
+            "upsert": {"uuid": doc_uuids[doc_id], **doc},
+        }
+        for doc_id, doc in staff_documents.items()
+    ]
+    actions += [
+        {"_op_type": "delete", "_index": STAFF_INDEX_NAME, "_id": doc_id}
+        for doc_id in deleted_doc_ids
+    ]
+    failed_doc_ids = run_staff_index_bulk_actions(actions)
+
+    # Likewise, the uuid of an existing staff directory entry isn't changed.
+    StaffDirectoryEntry.objects.bulk_create(
+        [
+            StaffDirectoryEntry(uuid=doc_uuids[doc_id], **doc)
+            for doc_id, doc in staff_documents.items()
+            if doc_id not in failed_doc_ids
+        ],
+        update_conflicts=True,
+        unique_fields=["staff_sso_email_user_id"],
+        update_fields=[
+            *[
+                field
+                for field in STAFF_SSO_DOCUMENT_FIELDS
+                if field != "staff_sso_email_user_id"
+            ],
+            "updated_at",
+        ],
+    )
+    StaffDirectoryEntry.objects.filter(
+        staff_sso_email_user_id__in=deleted_doc_ids - failed_doc_ids
+    ).delete()
+
+    return failed_doc_ids
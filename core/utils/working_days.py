@@ -0,0 +1,143 @@
+"""
+Working day date arithmetic, skipping weekends and bank holidays.
+
+`govuk_bank_holidays.BankHolidays` downloads the bank holidays from GOV.UK
+each time it is created, and steps through the days one at a time. Instead,
+the bank holidays are cached for a day (see `get_bank_holidays`) and each
+process builds a `WorkingDayCalendar` from them, covering the years either
+side of the current one (see `get_working_day_calendar`).
+"""
+
+import time
+from array import array
+from datetime import date, timedelta
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from govuk_bank_holidays.bank_holidays import BankHolidays
+
+from core.utils.cache import get_cached_value
+
+BANK_HOLIDAYS_CACHE_KEY = "bank_holidays"
+# Download the bank holidays once a day, keeping the last download for a week
+# in case GOV.UK is unavailable.
+BANK_HOLIDAYS_TIMEOUT = 60 * 60 * 24
+BANK_HOLIDAYS_STALE_TIMEOUT = 60 * 60 * 24 * 7
+# The number of years either side of the current year in the calendar.
+CALENDAR_YEARS = 10
+WEEKEND = frozenset((5, 6))
+
+
+class WorkingDayCalendar:
+    """The working days from `start` to `end`.
+
+    `working_days` holds the ordinals of the working days in order, and
+    `working_day_index` holds the number of working days up to and including
+    each day from `start`. Between them, moving by a number of working days is
+    two lookups rather than a walk through the days.
+
+    Dates outside of the calendar step through the days.
+    """
+
+    def __init__(self, holidays: Iterable[date], *, start: date, end: date):
+        self.holidays: FrozenSet[date] = frozenset(holidays)
+        self.start = start
+        self.end = end
+        self.built_at = time.time()
+
+        self.working_days = array("l")
+        self.working_day_index = array("l")
+        for ordinal in range(start.toordinal(), end.toordinal() + 1):
+            if self.is_work_day(date.fromordinal(ordinal)):
+                self.working_days.append(ordinal)
+            self.working_day_index.append(len(self.working_days))
+
+    def is_work_day(self, d: date) -> bool:
+        return d.weekday() not in WEEKEND and d not in self.holidays
+
+    def add_work_days(self, d: date, days: int) -> date:
+        """Get the date `days` working days after `d`, or before if negative.
+
+        `d` doesn't need to be a working day.
+        """
+        if days == 0:
+            return d
+
+        if self.start <= d <= self.end:
+            # The number of working days up to and including `d`.
+            worked = self.working_day_index[d.toordinal() - self.start.toordinal()]
+            if days > 0:
+                i = worked + days - 1
+            else:
+                if self.is_work_day(d):
+                    worked -= 1
+                i = worked + days
+            if 0 <= i < len(self.working_days):
+                return date.fromordinal(self.working_days[i])
+
+        return self.step_work_days(d, days)
+
+    def step_work_days(self, d: date, days: int) -> date:
+        step = timedelta(days=1 if days > 0 else -1)
+        remaining = abs(days)
+        while remaining:
+            d += step
+            if self.is_work_day(d):
+                remaining -= 1
+        return d
+
+    def get_next_work_day(self, d: date) -> date:
+        return self.add_work_days(d, 1)
+
+    def get_previous_work_day(self, d: date) -> date:
+        return self.add_work_days(d, -1)
+
+
+def fetch_bank_holidays() -> Dict[str, List[int]]:
+    """Download the bank holidays for each division, as date ordinals."""
+    bank_holidays = BankHolidays()
+    return {
+        division: [
+            holiday["date"].toordinal()
+            for holiday in bank_holidays.get_holidays(division=division)
+        ]
+        for division in BankHolidays.ALL_DIVISIONS
+    }
+
+
+def get_bank_holidays(division: Optional[str] = None) -> List[date]:
+    """Get the bank holidays for a division.
+
+    If no division is given, only the bank holidays common to all divisions
+    are returned (the same as `BankHolidays`).
+    """
+    bank_holidays = get_cached_value(
+        BANK_HOLIDAYS_CACHE_KEY,
+        fetch_bank_holidays,
+        timeout=BANK_HOLIDAYS_TIMEOUT,
+        stale_timeout=BANK_HOLIDAYS_STALE_TIMEOUT,
+    )
+    if division:
+        ordinals = set(bank_holidays[division])
+    else:
+        ordinals = set.intersection(*map(set, bank_holidays.values()))
+    return [date.fromordinal(ordinal) for ordinal in sorted(ordinals)]
+
+
+_calendars: Dict[Optional[str], WorkingDayCalendar] = {}
+
+
+def get_working_day_calendar(division: Optional[str] = None) -> WorkingDayCalendar:
+    """Get the working day calendar for a division.
+
+    The calendar is rebuilt once a day, to pick up changes to the bank holidays.
+    """
+    calendar = _calendars.get(division)
+    if not calendar or calendar.built_at + BANK_HOLIDAYS_TIMEOUT < time.time():
+        year = date.today().year
+        calendar = WorkingDayCalendar(
+            get_bank_holidays(division),
+            start=date(year - CALENDAR_YEARS, 1, 1),
+            end=date(year + CALENDAR_YEARS, 12, 31),
+        )
+        _calendars[division] = calendar
+    return calendar
@@ -1,8 +1,17 @@
 from django.contrib import admin
 
-from leavers.models import LeaverInformation, LeavingRequest, SlackMessage, TaskLog
+from leavers.models import (
+    EmailSendRecord,
+    LeaverInformation,
+    LeavingRequest,
+    SlackMessage,
+    TaskLog,
+    WorkflowStepRun,
+)
 
 admin.site.register(LeavingRequest)
 admin.site.register(LeaverInformation)
 admin.site.register(TaskLog)
 admin.site.register(SlackMessage)
+admin.site.register(EmailSendRecord)
+admin.site.register(WorkflowStepRun)
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.9 on 2026-10-19 13:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_workflow_engine", "0012_alter_target_unique_together"),
+        ("leavers", "0095_leavingrequest_cancelled"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlowSchedule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("next_due_at", models.DateTimeField(db_index=True)),
+                ("scheduled_at", models.DateTimeField()),
+                (
+                    "flow",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="schedule",
+                        to="django_workflow_engine.flow",
+                    ),
+                ),
+            ],
+        ),
+    ]
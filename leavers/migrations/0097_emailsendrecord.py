@@ -0,0 +1,57 @@
+# Generated by Django 5.1.9 on 2026-10-19 13:58
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leavers", "0096_flowschedule"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmailSendRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("email_id", models.CharField(max_length=255)),
+                ("sent_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "leaving_request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="email_send_records",
+                        to="leavers.leavingrequest",
+                    ),
+                ),
+                (
+                    "task_log",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="email_send_record",
+                        to="leavers.tasklog",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["leaving_request", "email_id", "-sent_at"],
+                        name="email_send_record_latest",
+                    )
+                ],
+            },
+        ),
+    ]
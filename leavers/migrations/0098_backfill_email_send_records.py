@@ -0,0 +1,62 @@
+from django.db import migrations
+
+SENDING_EMAIL_PREFIX = "Sending email "
+BATCH_SIZE = 1000
+
+
+def backfill_email_send_records(apps, schema_editor):
+    """
+    Create an EmailSendRecord for every email TaskLog.
+    """
+
+    LeavingRequest = apps.get_model("leavers", "LeavingRequest")
+    EmailSendRecord = apps.get_model("leavers", "EmailSendRecord")
+    EmailTaskLog = LeavingRequest.email_task_logs.through
+
+    email_task_logs = (
+        EmailTaskLog.objects.filter(
+            tasklog__task_name__startswith=SENDING_EMAIL_PREFIX,
+            tasklog__email_send_record__isnull=True,
+        )
+        .order_by("pk")
+        .values_list(
+            "leavingrequest_id",
+            "tasklog_id",
+            "tasklog__task_name",
+            "tasklog__created_at",
+        )
+    )
+
+    email_send_records = []
+    for (
+        leaving_request_id,
+        task_log_id,
+        task_name,
+        created_at,
+    ) in email_task_logs.iterator(chunk_size=BATCH_SIZE):
+        email_send_records.append(
+            EmailSendRecord(
+                leaving_request_id=leaving_request_id,
+                email_id=task_name.removeprefix(SENDING_EMAIL_PREFIX),
+                sent_at=created_at,
+                task_log_id=task_log_id,
+            )
+        )
+        if len(email_send_records) >= BATCH_SIZE:
+            EmailSendRecord.objects.bulk_create(email_send_records)
+            email_send_records = []
+
+    EmailSendRecord.objects.bulk_create(email_send_records)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leavers", "0097_emailsendrecord"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_email_send_records, reverse_code=migrations.RunPython.noop
+        ),
+    ]
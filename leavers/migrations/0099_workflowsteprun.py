@@ -0,0 +1,67 @@
+# Generated by Django 5.1.9 on 2026-10-19 14:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_workflow_engine", "0012_alter_target_unique_together"),
+        ("leavers", "0098_backfill_email_send_records"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkflowStepRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("step_id", models.CharField(max_length=255)),
+                ("task_name", models.CharField(max_length=255)),
+                (
+                    "outcome",
+                    models.CharField(
+                        choices=[
+                            ("progressed", "Progressed"),
+                            ("waiting", "Waiting"),
+                            ("skipped", "Skipped"),
+                            ("error", "Error"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                ("duration_ms", models.PositiveIntegerField()),
+                ("queue_lag_ms", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "flow",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="step_runs",
+                        to="django_workflow_engine.flow",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["step_id", "-started_at"], name="workflow_step_run_step"
+                    )
+                ],
+            },
+        ),
+    ]
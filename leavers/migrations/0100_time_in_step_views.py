@@ -0,0 +1,185 @@
+# Generated by Django 5.1.9 on 2026-10-19 14:37
+
+from django.db import migrations, models
+
+CREATE_LEAVING_STAGE_TIME_VIEW = """
+CREATE MATERIALIZED VIEW leavers_leavingstagetime AS
+WITH leaving_requests AS (
+    SELECT
+        lr.requested_at,
+        lr.leaver_complete,
+        lr.line_manager_complete,
+        lr.sre_complete,
+        lr.security_team_building_pass_complete,
+        lr.security_team_rosa_kit_complete,
+        lr.is_rosa_user,
+        flow.finished,
+        offboarded.created_at AS uksbs_manually_offboarded_at
+    FROM leavers_leavingrequest lr
+    LEFT JOIN django_workflow_engine_flow flow ON flow.id = lr.flow_id
+    LEFT JOIN leavers_tasklog offboarded
+        ON offboarded.id = lr.manually_offboarded_from_uksbs_id
+    WHERE lr.cancelled IS NULL
+),
+stages AS (
+    SELECT 'leaver' AS stage, requested_at AS started_at,
+        leaver_complete AS completed_at
+    FROM leaving_requests
+    UNION ALL
+    SELECT 'line_manager', leaver_complete, line_manager_complete
+    FROM leaving_requests WHERE leaver_complete IS NOT NULL
+    UNION ALL
+    SELECT 'sre', line_manager_complete, sre_complete
+    FROM leaving_requests WHERE line_manager_complete IS NOT NULL
+    UNION ALL
+    SELECT 'security_building_pass', line_manager_complete,
+        security_team_building_pass_complete
+    FROM leaving_requests WHERE line_manager_complete IS NOT NULL
+    UNION ALL
+    SELECT 'security_rosa_kit', line_manager_complete,
+        security_team_rosa_kit_complete
+    FROM leaving_requests
+    WHERE line_manager_complete IS NOT NULL AND is_rosa_user
+    UNION ALL
+    SELECT 'uksbs_manual_offboarding', line_manager_complete,
+        uksbs_manually_offboarded_at
+    FROM leaving_requests
+    WHERE line_manager_complete IS NOT NULL
+        AND uksbs_manually_offboarded_at IS NOT NULL
+    UNION ALL
+    SELECT 'cycle', requested_at, finished
+    FROM leaving_requests WHERE leaver_complete IS NOT NULL
+),
+stage_times AS (
+    SELECT
+        stage,
+        completed_at,
+        EXTRACT(EPOCH FROM completed_at - started_at)::float AS seconds,
+        EXTRACT(EPOCH FROM now() - started_at)::float AS waiting_seconds
+    FROM stages
+)
+SELECT
+    stage,
+    COUNT(completed_at) AS completed,
+    COUNT(*) - COUNT(completed_at) AS waiting,
+    AVG(seconds) AS avg_seconds,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY seconds) AS median_seconds,
+    percentile_cont(0.9) WITHIN GROUP (ORDER BY seconds) AS p90_seconds,
+    MAX(seconds) AS max_seconds,
+    MAX(waiting_seconds) FILTER (WHERE completed_at IS NULL)
+        AS longest_waiting_seconds,
+    now() AS refreshed_at
+FROM stage_times
+GROUP BY stage;
+
+CREATE UNIQUE INDEX leavers_leavingstagetime_stage
+    ON leavers_leavingstagetime (stage);
+"""
+
+CREATE_WORKFLOW_STEP_TIME_VIEW = """
+CREATE MATERIALIZED VIEW leavers_workflowsteptime AS
+WITH step_times AS (
+    SELECT
+        task.step_id,
+        task.done,
+        flow.finished,
+        EXTRACT(EPOCH FROM task.executed_at - task.started_at)::float AS seconds,
+        EXTRACT(EPOCH FROM now() - task.started_at)::float
+            AS waiting_seconds
+    FROM django_workflow_engine_taskstatus task
+    JOIN django_workflow_engine_flow flow ON flow.id = task.flow_id
+    JOIN leavers_leavingrequest lr ON lr.flow_id = flow.id
+    WHERE lr.cancelled IS NULL
+)
+SELECT
+    step_id,
+    COUNT(*) FILTER (WHERE done) AS done,
+    COUNT(*) FILTER (WHERE NOT done AND finished IS NULL) AS waiting,
+    AVG(seconds) FILTER (WHERE done) AS avg_seconds,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY seconds) FILTER (WHERE done)
+        AS median_seconds,
+    percentile_cont(0.9) WITHIN GROUP (ORDER BY seconds) FILTER (WHERE done)
+        AS p90_seconds,
+    MAX(seconds) FILTER (WHERE done) AS max_seconds,
+    MAX(waiting_seconds) FILTER (WHERE NOT done AND finished IS NULL)
+        AS longest_waiting_seconds,
+    now() AS refreshed_at
+FROM step_times
+GROUP BY step_id;
+
+CREATE UNIQUE INDEX leavers_workflowsteptime_step_id
+    ON leavers_workflowsteptime (step_id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leavers", "0099_workflowsteprun"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeavingStageTime",
+            fields=[
+                (
+                    "stage",
+                    models.CharField(
+                        choices=[
+                            ("leaver", "Leaver"),
+                            ("line_manager", "Line manager"),
+                            ("sre", "SRE team"),
+                            ("security_building_pass", "Security team (building pass)"),
+                            ("security_rosa_kit", "Security team (ROSA kit)"),
+                            ("uksbs_manual_offboarding", "Manual UK SBS offboarding"),
+                            ("cycle", "Whole request"),
+                        ],
+                        max_length=255,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("completed", models.PositiveIntegerField()),
+                ("waiting", models.PositiveIntegerField()),
+                ("avg_seconds", models.FloatField(null=True)),
+                ("median_seconds", models.FloatField(null=True)),
+                ("p90_seconds", models.FloatField(null=True)),
+                ("max_seconds", models.FloatField(null=True)),
+                ("longest_waiting_seconds", models.FloatField(null=True)),
+                ("refreshed_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "leavers_leavingstagetime",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="WorkflowStepTime",
+            fields=[
+                (
+                    "step_id",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("done", models.PositiveIntegerField()),
+                ("waiting", models.PositiveIntegerField()),
+                ("avg_seconds", models.FloatField(null=True)),
+                ("median_seconds", models.FloatField(null=True)),
+                ("p90_seconds", models.FloatField(null=True)),
+                ("max_seconds", models.FloatField(null=True)),
+                ("longest_waiting_seconds", models.FloatField(null=True)),
+                ("refreshed_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "leavers_workflowsteptime",
+                "managed": False,
+            },
+        ),
+        migrations.RunSQL(
+            CREATE_LEAVING_STAGE_TIME_VIEW,
+            reverse_sql="DROP MATERIALIZED VIEW leavers_leavingstagetime;",
+        ),
+        migrations.RunSQL(
+            CREATE_WORKFLOW_STEP_TIME_VIEW,
+            reverse_sql="DROP MATERIALIZED VIEW leavers_workflowsteptime;",
+        ),
+    ]
@@ -0,0 +1,158 @@
+# Generated by Django 5.1.9 on 2026-10-19 16:02
+
+from importlib import import_module
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CREATE_LEAVING_REQUEST_STAGE_TIME_VIEW = """
+CREATE MATERIALIZED VIEW leavers_leavingrequeststagetime AS
+WITH leaving_requests AS (
+    SELECT
+        lr.id AS leaving_request_id,
+        lr.requested_at,
+        lr.leaver_complete,
+        lr.line_manager_complete,
+        lr.sre_complete,
+        lr.security_team_building_pass_complete,
+        lr.security_team_rosa_kit_complete,
+        lr.is_rosa_user,
+        flow.finished,
+        offboarded.created_at AS uksbs_manually_offboarded_at
+    FROM leavers_leavingrequest lr
+    LEFT JOIN django_workflow_engine_flow flow ON flow.id = lr.flow_id
+    LEFT JOIN leavers_tasklog offboarded
+        ON offboarded.id = lr.manually_offboarded_from_uksbs_id
+    WHERE lr.cancelled IS NULL
+),
+stages AS (
+    SELECT leaving_request_id, 'leaver' AS stage, requested_at AS started_at,
+        leaver_complete AS completed_at
+    FROM leaving_requests
+    UNION ALL
+    SELECT leaving_request_id, 'line_manager', leaver_complete,
+        line_manager_complete
+    FROM leaving_requests WHERE leaver_complete IS NOT NULL
+    UNION ALL
+    SELECT leaving_request_id, 'sre', line_manager_complete, sre_complete
+    FROM leaving_requests WHERE line_manager_complete IS NOT NULL
+    UNION ALL
+    SELECT leaving_request_id, 'security_building_pass', line_manager_complete,
+        security_team_building_pass_complete
+    FROM leaving_requests WHERE line_manager_complete IS NOT NULL
+    UNION ALL
+    SELECT leaving_request_id, 'security_rosa_kit', line_manager_complete,
+        security_team_rosa_kit_complete
+    FROM leaving_requests
+    WHERE line_manager_complete IS NOT NULL AND is_rosa_user
+    UNION ALL
+    SELECT leaving_request_id, 'uksbs_manual_offboarding', line_manager_complete,
+        uksbs_manually_offboarded_at
+    FROM leaving_requests
+    WHERE line_manager_complete IS NOT NULL
+        AND uksbs_manually_offboarded_at IS NOT NULL
+    UNION ALL
+    SELECT leaving_request_id, 'cycle', requested_at, finished
+    FROM leaving_requests WHERE leaver_complete IS NOT NULL
+)
+SELECT
+    leaving_request_id || ':' || stage AS id,
+    leaving_request_id,
+    stage,
+    started_at,
+    completed_at,
+    EXTRACT(EPOCH FROM completed_at - started_at)::float AS seconds
+FROM stages;
+
+CREATE UNIQUE INDEX leavers_leavingrequeststagetime_id
+    ON leavers_leavingrequeststagetime (id);
+CREATE INDEX leavers_leavingrequeststagetime_waiting
+    ON leavers_leavingrequeststagetime (started_at)
+    WHERE completed_at IS NULL;
+"""
+
+CREATE_LEAVING_STAGE_TIME_VIEW = """
+CREATE MATERIALIZED VIEW leavers_leavingstagetime AS
+SELECT
+    stage,
+    COUNT(completed_at) AS completed,
+    COUNT(*) - COUNT(completed_at) AS waiting,
+    AVG(seconds) AS avg_seconds,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY seconds) AS median_seconds,
+    percentile_cont(0.9) WITHIN GROUP (ORDER BY seconds) AS p90_seconds,
+    MAX(seconds) AS max_seconds,
+    MAX(EXTRACT(EPOCH FROM now() - started_at)::float)
+        FILTER (WHERE completed_at IS NULL) AS longest_waiting_seconds,
+    now() AS refreshed_at
+FROM leavers_leavingrequeststagetime
+GROUP BY stage;
+
+CREATE UNIQUE INDEX leavers_leavingstagetime_stage
+    ON leavers_leavingstagetime (stage);
+"""
+
+# The stage times before they were aggregated from the per request view.
+PREVIOUS_CREATE_LEAVING_STAGE_TIME_VIEW = import_module(
+    "leavers.migrations.0100_time_in_step_views"
+).CREATE_LEAVING_STAGE_TIME_VIEW
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leavers", "0100_time_in_step_views"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeavingRequestStageTime",
+            fields=[
+                (
+                    "id",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                (
+                    "stage",
+                    models.CharField(
+                        choices=[
+                            ("leaver", "Leaver"),
+                            ("line_manager", "Line manager"),
+                            ("sre", "SRE team"),
+                            ("security_building_pass", "Security team (building pass)"),
+                            ("security_rosa_kit", "Security team (ROSA kit)"),
+                            ("uksbs_manual_offboarding", "Manual UK SBS offboarding"),
+                            ("cycle", "Whole request"),
+                        ],
+                        max_length=255,
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                ("completed_at", models.DateTimeField(null=True)),
+                ("seconds", models.FloatField(null=True)),
+                (
+                    "leaving_request",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="stage_times",
+                        to="leavers.leavingrequest",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "leavers_leavingrequeststagetime",
+                "managed": False,
+            },
+        ),
+        migrations.RunSQL(
+            CREATE_LEAVING_REQUEST_STAGE_TIME_VIEW,
+            reverse_sql="DROP MATERIALIZED VIEW leavers_leavingrequeststagetime;",
+        ),
+        # Aggregate the stage times from the per request view.
+        migrations.RunSQL(
+            "DROP MATERIALIZED VIEW leavers_leavingstagetime;"
+            + CREATE_LEAVING_STAGE_TIME_VIEW,
+            reverse_sql="DROP MATERIALIZED VIEW leavers_leavingstagetime;"
+            + PREVIOUS_CREATE_LEAVING_STAGE_TIME_VIEW,
+        ),
+    ]
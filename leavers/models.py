@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Tuple
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.db.models.query import QuerySet
+from django.utils import timezone
 from django_workflow_engine.models import Flow, TaskStatus
 
 from activity_stream.models import ActivityStreamStaffSSOUser
@@ -19,10 +20,12 @@ from leavers.forms.line_manager import (
 from leavers.forms.sre import ServiceAndToolActions
 from leavers.types import (
     LeavingReason,
+    LeavingStage,
     ReturnOptions,
     SecurityClearance,
     StaffType,
     TaskNote,
+    WorkflowStepOutcome,
 )
 
 
@@ -379,6 +382,14 @@ class LeavingRequest(models.Model):
     Methods
     """
 
+    def save(self, *args, **kwargs) -> None:
+        # Always bump `last_modified`, the workflow schedule uses it to find the
+        # leaving requests that have changed (see `leavers.workflow.schedule`).
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "last_modified" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "last_modified"]
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """
         Returns a string representation of the LeavingRequest
@@ -393,6 +404,19 @@ class LeavingRequest(models.Model):
             str_rep = f"{str_rep} (CANCELLED)"
         return str_rep
 
+    def get_leaver_information(self) -> Optional["LeaverInformation"]:
+        """
+        Get the first LeaverInformation, without a query if it has been
+        prefetched (see `leavers.workflow.progress`).
+        """
+        if "leaver_information" in getattr(self, "_prefetched_objects_cache", {}):
+            return min(
+                self.leaver_information.all(),
+                key=lambda leaver_information: leaver_information.pk,
+                default=None,
+            )
+        return self.leaver_information.first()
+
     def get_leaving_date(self) -> Optional[datetime]:
         leaving_date: Optional[datetime] = None
 
@@ -400,7 +424,7 @@ class LeavingRequest(models.Model):
             leaving_date = self.leaving_date
         else:
             leaver_information: Optional["LeaverInformation"] = (
-                self.leaver_information.first()
+                self.get_leaver_information()
             )
             if leaver_information and leaver_information.leaving_date:
                 leaving_date = leaver_information.leaving_date
@@ -421,7 +445,7 @@ class LeavingRequest(models.Model):
             last_day = self.last_day
         else:
             leaver_information: Optional["LeaverInformation"] = (
-                self.leaver_information.first()
+                self.get_leaver_information()
             )
             if leaver_information and leaver_information.last_day:
                 last_day = leaver_information.last_day
@@ -444,7 +468,7 @@ class LeavingRequest(models.Model):
         - From the Leaver Activity Stream
         """
         leaver_information: Optional["LeaverInformation"] = (
-            self.leaver_information.first()
+            self.get_leaver_information()
         )
         if leaver_information:
             leaver_info_first_name = leaver_information.leaver_first_name
@@ -668,6 +692,161 @@ class SlackMessage(models.Model):
     )
 
 
+class EmailSendRecord(models.Model):
+    """
+    An email that was sent for a leaving request.
+
+    Used to check when an email was last sent, e.g. for reminders.
+    """
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["leaving_request", "email_id", "-sent_at"],
+                name="email_send_record_latest",
+            ),
+        ]
+
+    leaving_request = models.ForeignKey(
+        LeavingRequest,
+        on_delete=models.CASCADE,
+        related_name="email_send_records",
+    )
+    # The value of a `leavers.workflow.tasks.EmailIds`.
+    email_id = models.CharField(max_length=255)
+    sent_at = models.DateTimeField(default=timezone.now)
+    task_log = models.OneToOneField(
+        TaskLog,
+        on_delete=models.SET_NULL,
+        related_name="email_send_record",
+        null=True,
+        blank=True,
+    )
+
+
+class FlowSchedule(models.Model):
+    """
+    When a workflow next has work due.
+
+    See `leavers.workflow.schedule` and `core.tasks.progress_workflows`.
+    """
+
+    flow = models.OneToOneField(
+        "django_workflow_engine.Flow",
+        models.CASCADE,
+        related_name="schedule",
+    )
+    next_due_at = models.DateTimeField(db_index=True)
+    scheduled_at = models.DateTimeField()
+
+
+class WorkflowStepRun(models.Model):
+    """
+    A run of a workflow step's task, with how long it took and how long after
+    the workflow became due it ran.
+
+    See `leavers.workflow.metrics`.
+    """
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["step_id", "-started_at"],
+                name="workflow_step_run_step",
+            ),
+        ]
+
+    flow = models.ForeignKey(
+        "django_workflow_engine.Flow",
+        models.CASCADE,
+        related_name="step_runs",
+    )
+    step_id = models.CharField(max_length=255)
+    task_name = models.CharField(max_length=255)
+    outcome = models.CharField(max_length=20, choices=WorkflowStepOutcome.choices)
+    started_at = models.DateTimeField(default=timezone.now, db_index=True)
+    duration_ms = models.PositiveIntegerField()
+    # Null when the workflow hadn't been scheduled before the run.
+    queue_lag_ms = models.PositiveIntegerField(null=True, blank=True)
+
+
+class LeavingRequestStageTime(models.Model):
+    """
+    How long a leaving request spent, or has been waiting, in a stage.
+
+    Read from a materialized view, see `leavers.utils.time_in_step`.
+    """
+
+    class Meta:
+        managed = False
+        db_table = "leavers_leavingrequeststagetime"
+
+    # The leaving request id and the stage, e.g. "1:line_manager".
+    id = models.CharField(max_length=255, primary_key=True)
+    leaving_request = models.ForeignKey(
+        LeavingRequest,
+        on_delete=models.DO_NOTHING,
+        related_name="stage_times",
+        db_constraint=False,
+    )
+    stage = models.CharField(max_length=255, choices=LeavingStage.choices)
+    started_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True)
+    # The time the stage took, in seconds, if it is complete.
+    seconds = models.FloatField(null=True)
+
+
+class LeavingStageTime(models.Model):
+    """
+    How long the leaving requests spend in each stage.
+
+    Read from a materialized view, see `leavers.utils.time_in_step`.
+    """
+
+    class Meta:
+        managed = False
+        db_table = "leavers_leavingstagetime"
+
+    stage = models.CharField(
+        max_length=255, choices=LeavingStage.choices, primary_key=True
+    )
+    completed = models.PositiveIntegerField()
+    waiting = models.PositiveIntegerField()
+    # The times that completed requests took, in seconds.
+    avg_seconds = models.FloatField(null=True)
+    median_seconds = models.FloatField(null=True)
+    p90_seconds = models.FloatField(null=True)
+    max_seconds = models.FloatField(null=True)
+    # The longest time that a waiting request has been waiting, in seconds.
+    longest_waiting_seconds = models.FloatField(null=True)
+    refreshed_at = models.DateTimeField()
+
+
+class WorkflowStepTime(models.Model):
+    """
+    How long the leaving workflows spend in each step, from when the step was
+    reached to when it was done.
+
+    Read from a materialized view, see `leavers.utils.time_in_step`.
+    """
+
+    class Meta:
+        managed = False
+        db_table = "leavers_workflowsteptime"
+
+    step_id = models.CharField(max_length=100, primary_key=True)
+    done = models.PositiveIntegerField()
+    waiting = models.PositiveIntegerField()
+    # The times that done steps took, in seconds.
+    avg_seconds = models.FloatField(null=True)
+    median_seconds = models.FloatField(null=True)
+    p90_seconds = models.FloatField(null=True)
+    max_seconds = models.FloatField(null=True)
+    # The longest time that a waiting step has been waiting, in seconds.
+    longest_waiting_seconds = models.FloatField(null=True)
+    refreshed_at = models.DateTimeField()
+
+
 class LeaverInformation(models.Model):
     # TODO: Change to a OneToOne relationship.
     leaving_request = models.ForeignKey(
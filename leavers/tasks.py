@@ -7,6 +7,7 @@ from leavers.utils.emails import (
     send_leaver_list_pay_cut_off_reminder,
     send_workforce_planning_leavers_email,
 )
+from leavers.utils.time_in_step import refresh_time_in_step_views
 from leavers.utils.workday_calculation import is_date_within_payroll_cut_off_interval
 
 logger = celery_app.log.get_default_logger()
@@ -61,3 +62,9 @@ def weekly_leavers_email(self) -> None:
         leaving_requests=leavers_last_week,
         week_ending=past_sunday.strftime("%d/%m/%Y"),
     )
+
+
+@celery_app.task(bind=True)
+def refresh_time_in_step_reports(self) -> None:
+    logger.info("RUNNING refresh_time_in_step_reports")
+    refresh_time_in_step_views()
@@ -0,0 +1,218 @@
+from datetime import datetime, timedelta
+from typing import cast
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import make_aware
+from django_workflow_engine.models import Flow, TaskStatus
+
+from leavers.factories import LeavingRequestFactory, TaskLogFactory
+from leavers.models import LeavingRequest, LeavingRequestStageTime, TaskLog
+from leavers.types import LeavingStage
+from leavers.utils.time_in_step import (
+    get_leaving_stage_times,
+    get_longest_waiting_leaving_requests,
+    get_workflow_step_times,
+    refresh_time_in_step_views,
+)
+from leavers.workflow.tests.factories import FlowFactory, TaskStatusFactory
+from user.test.factories import UserFactory
+
+DAY = 60 * 60 * 24
+
+
+class TestTimeInStep(TestCase):
+    def setUp(self):
+        self.requested_at = make_aware(datetime(2022, 11, 1))
+
+        # Completed by everyone, the workflow finished after 10 days.
+        self.complete_request = self.create_leaving_request(
+            leaver_complete=self.requested_at + timedelta(days=1),
+            line_manager_complete=self.requested_at + timedelta(days=3),
+            sre_complete=self.requested_at + timedelta(days=9),
+            security_team_building_pass_complete=self.requested_at + timedelta(days=5),
+            is_rosa_user=False,
+            finished=self.requested_at + timedelta(days=10),
+        )
+        # Waiting for the line manager.
+        self.waiting_request = self.create_leaving_request(
+            leaver_complete=self.requested_at + timedelta(days=3),
+        )
+        # Cancelled requests aren't included.
+        self.create_leaving_request(
+            leaver_complete=self.requested_at,
+            cancelled=self.requested_at + timedelta(days=1),
+        )
+
+    def create_leaving_request(self, *, finished=None, **kwargs) -> LeavingRequest:
+        flow = cast(Flow, FlowFactory(finished=finished))
+        leaving_request = cast(
+            LeavingRequest, LeavingRequestFactory(flow=flow, **kwargs)
+        )
+        # requested_at is set when the request is created.
+        LeavingRequest.objects.filter(pk=leaving_request.pk).update(
+            requested_at=self.requested_at
+        )
+        return leaving_request
+
+    def create_task_status(self, leaving_request, *, step_id, days, done) -> TaskStatus:
+        task_status = cast(
+            TaskStatus,
+            TaskStatusFactory(flow=leaving_request.flow, step_id=step_id, done=done),
+        )
+        TaskStatus.objects.filter(pk=task_status.pk).update(
+            started_at=self.requested_at,
+            executed_at=self.requested_at + timedelta(days=days) if done else None,
+        )
+        return task_status
+
+    def test_leaving_stage_times(self):
+        refresh_time_in_step_views()
+
+        stage_times = {
+            stage_time.stage: stage_time for stage_time in get_leaving_stage_times()
+        }
+
+        self.assertNotIn(LeavingStage.SECURITY_ROSA_KIT, stage_times)
+        self.assertNotIn(LeavingStage.UKSBS_MANUAL_OFFBOARDING, stage_times)
+
+        leaver = stage_times[LeavingStage.LEAVER]
+        self.assertEqual(leaver.completed, 2)
+        self.assertEqual(leaver.waiting, 0)
+        self.assertEqual(leaver.median_seconds, 2 * DAY)
+        self.assertEqual(leaver.max_seconds, 3 * DAY)
+
+        line_manager = stage_times[LeavingStage.LINE_MANAGER]
+        self.assertEqual(line_manager.completed, 1)
+        self.assertEqual(line_manager.waiting, 1)
+        self.assertEqual(line_manager.median_seconds, 2 * DAY)
+        # Waiting since the leaver submitted.
+        self.assertAlmostEqual(
+            line_manager.longest_waiting_seconds,
+            (timezone.now() - self.waiting_request.leaver_complete).total_seconds(),
+            delta=60,
+        )
+
+        self.assertEqual(stage_times[LeavingStage.SRE].median_seconds, 6 * DAY)
+        self.assertEqual(
+            stage_times[LeavingStage.SECURITY_BUILDING_PASS].median_seconds, 2 * DAY
+        )
+
+        cycle = stage_times[LeavingStage.CYCLE]
+        self.assertEqual(cycle.completed, 1)
+        self.assertEqual(cycle.waiting, 1)
+        self.assertEqual(cycle.median_seconds, 10 * DAY)
+
+    def test_leaving_request_stage_times(self):
+        refresh_time_in_step_views()
+
+        stage_times = {
+            stage_time.stage: stage_time
+            for stage_time in LeavingRequestStageTime.objects.filter(
+                leaving_request=self.complete_request
+            )
+        }
+        self.assertEqual(
+            set(stage_times),
+            {
+                LeavingStage.LEAVER,
+                LeavingStage.LINE_MANAGER,
+                LeavingStage.SRE,
+                LeavingStage.SECURITY_BUILDING_PASS,
+                LeavingStage.CYCLE,
+            },
+        )
+        line_manager = stage_times[LeavingStage.LINE_MANAGER]
+        self.assertEqual(line_manager.started_at, self.complete_request.leaver_complete)
+        self.assertEqual(
+            line_manager.completed_at, self.complete_request.line_manager_complete
+        )
+        self.assertEqual(line_manager.seconds, 2 * DAY)
+        self.assertEqual(stage_times[LeavingStage.CYCLE].seconds, 10 * DAY)
+
+    def test_longest_waiting_leaving_requests(self):
+        refresh_time_in_step_views()
+
+        waiting = get_longest_waiting_leaving_requests()
+
+        self.assertEqual(len(waiting), 1)
+        self.assertEqual(waiting[0].leaving_request, self.waiting_request)
+        self.assertEqual(waiting[0].stage, LeavingStage.LINE_MANAGER)
+        self.assertIsNone(waiting[0].seconds)
+
+    def test_leaving_stage_times_in_stage_order(self):
+        refresh_time_in_step_views()
+
+        self.assertEqual(
+            [stage_time.stage for stage_time in get_leaving_stage_times()],
+            [
+                LeavingStage.LEAVER,
+                LeavingStage.LINE_MANAGER,
+                LeavingStage.SRE,
+                LeavingStage.SECURITY_BUILDING_PASS,
+                LeavingStage.CYCLE,
+            ],
+        )
+
+    def test_leaving_stage_times_task_log(self):
+        self.complete_request.manually_offboarded_from_uksbs = TaskLogFactory()
+        self.complete_request.save()
+        TaskLog.objects.filter(
+            pk=self.complete_request.manually_offboarded_from_uksbs.pk
+        ).update(created_at=self.requested_at + timedelta(days=4))
+
+        refresh_time_in_step_views()
+
+        stage_times = {
+            stage_time.stage: stage_time for stage_time in get_leaving_stage_times()
+        }
+        self.assertEqual(
+            stage_times[LeavingStage.UKSBS_MANUAL_OFFBOARDING].median_seconds, DAY
+        )
+
+    def test_workflow_step_times(self):
+        self.create_task_status(
+            self.complete_request, step_id="notify_line_manager", days=1, done=True
+        )
+        self.create_task_status(
+            self.complete_request, step_id="have_sre_completed", days=9, done=True
+        )
+        self.create_task_status(
+            self.waiting_request, step_id="have_sre_completed", days=0, done=False
+        )
+
+        refresh_time_in_step_views()
+
+        step_times = get_workflow_step_times()
+        self.assertEqual(
+            [step_time.step_id for step_time in step_times],
+            ["have_sre_completed", "notify_line_manager"],
+        )
+        have_sre_completed = step_times[0]
+        self.assertEqual(have_sre_completed.done, 1)
+        self.assertEqual(have_sre_completed.waiting, 1)
+        self.assertEqual(have_sre_completed.median_seconds, 9 * DAY)
+        self.assertAlmostEqual(
+            have_sre_completed.longest_waiting_seconds,
+            (timezone.now() - self.requested_at).total_seconds(),
+            delta=60,
+        )
+
+    def test_report_view(self):
+        refresh_time_in_step_views()
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(reverse("admin-time-in-step"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["stage_times"]), 5)
+        self.assertEqual(len(response.context["waiting_leaving_requests"]), 1)
+        self.assertIsNotNone(response.context["refreshed_at"])
+
+    def test_report_view_staff_only(self):
+        self.client.force_login(UserFactory(is_staff=False))
+
+        response = self.client.get(reverse("admin-time-in-step"))
+
+        self.assertEqual(response.status_code, 403)
@@ -47,6 +47,26 @@ class ReturnOptions(TextChoices):
     HOME = "home", "Home collection by courier"
 
 
+class WorkflowStepOutcome(TextChoices):
+    PROGRESSED = "progressed", "Progressed"
+    WAITING = "waiting", "Waiting"
+    SKIPPED = "skipped", "Skipped"
+    ERROR = "error", "Error"
+
+
+class LeavingStage(TextChoices):
+    LEAVER = "leaver", "Leaver"
+    LINE_MANAGER = "line_manager", "Line manager"
+    SRE = "sre", "SRE team"
+    SECURITY_BUILDING_PASS = "security_building_pass", "Security team (building pass)"
+    SECURITY_ROSA_KIT = "security_rosa_kit", "Security team (ROSA kit)"
+    UKSBS_MANUAL_OFFBOARDING = (
+        "uksbs_manual_offboarding",
+        "Manual UK SBS offboarding",
+    )
+    CYCLE = "cycle", "Whole request"
+
+
 class LeaverDetails(TypedDict):
     first_name: str
     last_name: str
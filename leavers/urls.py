@@ -376,6 +376,16 @@ admin_urlpatterns = [
         admin_views.LeavingRequestManuallyOffboarded.as_view(),
         name="admin-leaving-request-manually-offboard-uksbs",
     ),
+    path(
+        "workflow-steps/",
+        admin_views.WorkflowStepSummaryView.as_view(),
+        name="admin-workflow-steps",
+    ),
+    path(
+        "time-in-step/",
+        admin_views.TimeInStepReportView.as_view(),
+        name="admin-time-in-step",
+    ),
 ]
 
 workflow_urlpatterns = [
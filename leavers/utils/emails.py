@@ -111,7 +111,7 @@ def get_leaving_request_email_personalisation(
     )
 
     leaver_information: Optional[LeaverInformation] = (
-        leaving_request.leaver_information.first()
+        leaving_request.get_leaver_information()
     )
 
     if not leaver_information:
@@ -590,7 +590,7 @@ def send_it_ops_asset_email(
         raise ValueError("leaving_date is not set")
 
     leaver_information: Optional[LeaverInformation] = (
-        leaving_request.leaver_information.first()
+        leaving_request.get_leaver_information()
     )
 
     if not leaver_information:
@@ -631,7 +631,7 @@ def send_feetham_security_pass_office_email(
         raise ValueError("leaving_date is not set")
 
     leaver_information: Optional[LeaverInformation] = (
-        leaving_request.leaver_information.first()
+        leaving_request.get_leaver_information()
     )
 
     if not leaver_information:
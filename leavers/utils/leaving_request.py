@@ -4,8 +4,9 @@ from uuid import uuid4
 from django.conf import settings
 
 from activity_stream.models import ActivityStreamStaffSSOUser
-from core.uksbs import get_uksbs_interface
-from core.uksbs.types import PersonData, PersonHierarchyData
+from core.uksbs.interfaces import clear_user_hierarchy_cache
+from core.uksbs.org_hierarchy import expire_org_hierarchy, get_reports
+from core.uksbs.types import PersonData
 from core.utils.staff_index import (
     ConsolidatedStaffDocument,
     StaffDocument,
@@ -23,6 +24,20 @@ if TYPE_CHECKING:
     from user.models import User
 
 
+def clear_leaver_hierarchy_cache(leaving_request: LeavingRequest) -> None:
+    """Clear the cached and stored UK SBS hierarchy of the leaver.
+
+    Call this when the leaving request's manager changes, so the next lookup
+    gets the leaver's current managers from UK SBS.
+    """
+    leaver: Optional[ActivityStreamStaffSSOUser] = (
+        leaving_request.leaver_activitystream_user
+    )
+    if leaver and (leaver_person_id := leaver.get_person_id()):
+        clear_user_hierarchy_cache(person_id=leaver_person_id)
+        expire_org_hierarchy(person_id=leaver_person_id)
+
+
 def update_or_create_leaving_request(
     *, leaver: ActivityStreamStaffSSOUser, user_requesting: "User", **kwargs
 ) -> LeavingRequest:
@@ -82,7 +97,6 @@ def initialise_line_reports(
     if leaving_request.line_reports:
         return leaving_request.line_reports
 
-    uksbs_interface = get_uksbs_interface()
     leaver_as_user: ActivityStreamStaffSSOUser = (
         leaving_request.leaver_activitystream_user
     )
@@ -90,10 +104,7 @@ def initialise_line_reports(
     if not leaver_person_id:
         raise LeaverDoesNotHaveUKSBSPersonId()
 
-    leaver_hierarchy_data: PersonHierarchyData = uksbs_interface.get_user_hierarchy(
-        person_id=leaver_person_id,
-    )
-    person_data_line_reports: List[PersonData] = leaver_hierarchy_data.get("report", [])
+    person_data_line_reports: List[PersonData] = get_reports(person_id=leaver_person_id)
 
     lr_line_reports: List[LeavingRequestLineReport] = []
     for line_report in person_data_line_reports:
@@ -0,0 +1,66 @@
+"""
+Report how long leaving requests spend in each stage and workflow step.
+
+The times of each leaving request are stored in the
+`leavers_leavingrequeststagetime` materialized view, and aggregated by the
+`leavers_leavingstagetime` and `leavers_workflowsteptime` materialized views
+(see the `0100_time_in_step_views` and `0101_leavingrequeststagetime`
+migrations), so reading them doesn't depend on how many leaving requests there
+are. The views are refreshed by `leavers.tasks.refresh_time_in_step_views`.
+"""
+
+from typing import List
+
+from django.db import connection
+from django.db.models import F
+
+from leavers.models import (
+    LeavingRequestStageTime,
+    LeavingStage,
+    LeavingStageTime,
+    WorkflowStepTime,
+)
+
+# In the order they need to be refreshed in, the stage times are aggregated
+# from the leaving request stage times.
+TIME_IN_STEP_VIEWS: List[str] = [
+    LeavingRequestStageTime._meta.db_table,
+    LeavingStageTime._meta.db_table,
+    WorkflowStepTime._meta.db_table,
+]
+
+
+def refresh_time_in_step_views() -> None:
+    """Refresh the views, without blocking the reports that read them."""
+    with connection.cursor() as cursor:
+        for view in TIME_IN_STEP_VIEWS:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+
+
+def get_leaving_stage_times() -> List[LeavingStageTime]:
+    """Get the times for each stage, in the order the stages happen."""
+    stage_times = {
+        stage_time.stage: stage_time for stage_time in LeavingStageTime.objects.all()
+    }
+    return [stage_times[stage] for stage in LeavingStage.values if stage in stage_times]
+
+
+def get_longest_waiting_leaving_requests(
+    limit: int = 20,
+) -> List[LeavingRequestStageTime]:
+    """Get the leaving requests that have been waiting longest in a stage."""
+    return list(
+        LeavingRequestStageTime.objects.filter(completed_at__isnull=True)
+        .exclude(stage=LeavingStage.CYCLE)
+        .select_related("leaving_request")
+        .order_by("started_at", "id")[:limit]
+    )
+
+
+def get_workflow_step_times() -> List[WorkflowStepTime]:
+    """Get the times for each workflow step, the slowest steps first."""
+    return list(
+        WorkflowStepTime.objects.order_by(
+            F("median_seconds").desc(nulls_last=True), "step_id"
+        )
+    )
@@ -2,6 +2,8 @@ from datetime import date, timedelta
 
 from govuk_bank_holidays.bank_holidays import BankHolidays
 
+from core.utils.working_days import get_working_day_calendar
+
 # In UKSBS, the Payroll cut off is 3rd of each month.
 # if not a working day, it is the last Friday before the 3rd.
 # The cut off is the last day when changes to the current month payroll are accepted
@@ -23,31 +25,18 @@ def calculate_working_day_date(start_date: date, working_day_delta: int) -> date
     calculate_working_day_date(today_date, 1)
     It takes into account bank holidays and weekend to calculate the new date.
     The start date could be a weekend or a bankholiday"""
-    bank_holidays = BankHolidays()
-    area = BankHolidays.ENGLAND_AND_WALES
-    new_date = start_date
     if working_day_delta == 0:
         raise Exception("Invalid value for calculating working day")
-    if working_day_delta < 0:
-        increment = -1
-        delta = -working_day_delta
-    else:
-        increment = 1
-        delta = working_day_delta
-    while delta != 0:
-        new_date += timedelta(increment)
-        if bank_holidays.is_work_day(new_date, division=area):
-            delta -= 1
-    return new_date
+    calendar = get_working_day_calendar(BankHolidays.ENGLAND_AND_WALES)
+    return calendar.add_work_days(start_date, working_day_delta)
 
 
 def pay_cut_off_date(month: int, year: int) -> date:
     # Payroll cut off is 3rd of each month,
     # if not a working day, the last friday before the 3rd.
-    bank_holidays = BankHolidays()
-    area = BankHolidays.ENGLAND_AND_WALES
+    calendar = get_working_day_calendar(BankHolidays.ENGLAND_AND_WALES)
     cut_off_day = date(year, month, PAY_CUT_OFF_DAY)
-    if bank_holidays.is_work_day(cut_off_day, division=area):
+    if calendar.is_work_day(cut_off_day):
         return cut_off_day
 
     # Find the designated date, in this case the previous Friday
@@ -65,9 +54,9 @@ def pay_cut_off_date(month: int, year: int) -> date:
         days += 7
     cut_off_day -= timedelta(days)
     # If the previous designated day is also a bankholiday,
-    # return the previous working day
-    while not bank_holidays.is_work_day(cut_off_day, division=area):
-        cut_off_day -= timedelta(-1)
+    # move on to the next working day.
+    if not calendar.is_work_day(cut_off_day):
+        cut_off_day = calendar.get_next_work_day(cut_off_day)
     return cut_off_day
 
 
@@ -76,9 +65,8 @@ def is_date_within_payroll_cut_off_interval(date_to_check: date) -> tuple[bool,
     It returns True if the date is in the predefined period
     before the payroll cut off date, and the system must notify HR
     """
-    bank_holidays = BankHolidays()
-    area = BankHolidays.ENGLAND_AND_WALES
-    if not bank_holidays.is_work_day(date_to_check, division=area):
+    calendar = get_working_day_calendar(BankHolidays.ENGLAND_AND_WALES)
+    if not calendar.is_work_day(date_to_check):
         # Ignore non working days
         return False, date_to_check
 
@@ -1,5 +1,5 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
 from uuid import UUID
 
@@ -16,6 +16,7 @@ from django.db.models.fields.reverse_related import ForeignObjectRel
 from django.http.response import HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.views.generic import FormView
 from django_workflow_engine.models import Flow
@@ -26,7 +27,17 @@ from core.views import BaseTemplateView
 from leavers.forms.admin import ManuallyOffboardedFromUKSBSForm
 from leavers.models import LeavingRequest, TaskLog
 from leavers.types import LeavingReason, LeavingRequestLineReport
+from leavers.utils.time_in_step import (
+    get_leaving_stage_times,
+    get_longest_waiting_leaving_requests,
+    get_workflow_step_times,
+)
 from leavers.views import base
+from leavers.workflow.metrics import (
+    DURATION_BUCKETS,
+    QUEUE_LAG_BUCKETS,
+    get_step_run_summary,
+)
 
 LEAVING_REQUEST_QUERIES = {
     "leaver_not_submitted": Q(
@@ -366,3 +377,49 @@ class OfflineServiceNowAdmin(BaseTemplateView):
             data=data,
         )
         return context
+
+
+class WorkflowStepSummaryView(UserPassesTestMixin, BaseTemplateView):
+    template_name = "leavers/admin/workflow_steps.html"
+    default_days = 7
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get_days(self) -> int:
+        try:
+            days = int(self.request.GET.get("days", self.default_days))
+        except ValueError:
+            return self.default_days
+        return max(days, 1)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        days = self.get_days()
+        context.update(
+            page_title="Workflow steps",
+            days=days,
+            steps=get_step_run_summary(since=timezone.now() - timedelta(days=days)),
+            duration_buckets=[label for label, _, _ in DURATION_BUCKETS],
+            queue_lag_buckets=[label for label, _, _ in QUEUE_LAG_BUCKETS],
+        )
+        return context
+
+
+class TimeInStepReportView(UserPassesTestMixin, BaseTemplateView):
+    template_name = "leavers/admin/time_in_step.html"
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        stage_times = get_leaving_stage_times()
+        context.update(
+            page_title="Time in step",
+            stage_times=stage_times,
+            step_times=get_workflow_step_times(),
+            waiting_leaving_requests=get_longest_waiting_leaving_requests(),
+            refreshed_at=stage_times[0].refreshed_at if stage_times else None,
+        )
+        return context
@@ -37,8 +37,12 @@ from leavers.forms import leaver as leaver_forms
 from leavers.forms.leaver import ReturnOptions
 from leavers.models import LeaverInformation
 from leavers.types import LeavingReason, StaffType, WhoIsLeaving
-from leavers.utils.leaving_request import update_or_create_leaving_request
+from leavers.utils.leaving_request import (
+    clear_leaver_hierarchy_cache,
+    update_or_create_leaving_request,
+)
 from leavers.views.base import LeavingRequestViewMixin, SaveAndCloseViewMixin
+from leavers.workflow.schedule import progress_flow_on_commit
 from leavers.workflow.utils import get_or_create_leaving_workflow
 from user.models import User
 
@@ -911,6 +915,7 @@ class RemoveLineManagerFromLeavingRequestView(LeavingJourneyViewMixin, RedirectV
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
         self.leaving_request.manager_activitystream_user = None
         self.leaving_request.save(update_fields=["manager_activitystream_user"])
+        clear_leaver_hierarchy_cache(leaving_request=self.leaving_request)
 
         return super().get(request, *args, **kwargs)
 
@@ -959,6 +964,9 @@ class LeaverDatesView(LeavingJourneyViewMixin, BaseTemplateView, FormView):
                         self.leaving_request.save(
                             update_fields=["manager_activitystream_user"]
                         )
+                        clear_leaver_hierarchy_cache(
+                            leaving_request=self.leaving_request
+                        )
 
         return super().dispatch(request, *args, **kwargs)
 
@@ -1599,6 +1607,7 @@ class ConfirmDetailsView(LeavingJourneyViewMixin, BaseTemplateView, FormView):
 
         # Create the workflow
         self.create_workflow(requester=user)
+        progress_flow_on_commit(self.leaving_request.flow)
 
         return super().form_valid(form)
 
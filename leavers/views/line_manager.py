@@ -20,8 +20,8 @@ from django.views.generic.edit import FormView
 from activity_stream.models import ActivityStreamStaffSSOUser
 from core.govuk_components import GovUKLink
 from core.staff_search.views import StaffSearchView
-from core.uksbs import get_uksbs_interface
 from core.uksbs.client import UKSBSPersonNotFound, UKSBSUnexpectedResponse
+from core.uksbs.org_hierarchy import is_manager_of
 from core.utils.helpers import make_possessive
 from core.utils.staff_index import (
     ConsolidatedStaffDocument,
@@ -36,6 +36,7 @@ from leavers.types import LeavingReason, LeavingRequestLineReport
 from leavers.utils.leaving_request import initialise_line_reports
 from leavers.views.base import CancelLeavingRequestViewMixin, SaveAndCloseViewMixin
 from leavers.views.leaver import LeavingRequestViewMixin
+from leavers.workflow.schedule import progress_flow_on_commit
 from user.models import User
 
 DATA_RECIPIENT_SEARCH_PARAM = "data_recipient_id"
@@ -110,29 +111,27 @@ class LineManagerViewMixin:
         ):
             return False
 
-        uksbs_interface = get_uksbs_interface()
-
         try:
-            leaver_hierarchy_data = uksbs_interface.get_user_hierarchy(
-                person_id=leaver_person_id
+            user_is_uksbs_manager = is_manager_of(
+                manager_person_id=user_person_id,
+                report_person_id=leaver_person_id,
             )
         except (UKSBSUnexpectedResponse, UKSBSPersonNotFound):
             return False
 
-        for uksbs_manager in leaver_hierarchy_data.get("manager", []):
-            if str(uksbs_manager["person_id"]) == str(user_person_id):
-                # The user is in UK SBS as the manager of the leaver.
-                leaving_request.manager_activitystream_user = user_activitystream_user
-                leaving_request.processing_manager_activitystream_user = (
-                    user_activitystream_user
-                )
-                leaving_request.save(
-                    update_fields=[
-                        "manager_activitystream_user",
-                        "processing_manager_activitystream_user",
-                    ]
-                )
-                return True
+        if user_is_uksbs_manager:
+            # The user is in UK SBS as the manager of the leaver.
+            leaving_request.manager_activitystream_user = user_activitystream_user
+            leaving_request.processing_manager_activitystream_user = (
+                user_activitystream_user
+            )
+            leaving_request.save(
+                update_fields=[
+                    "manager_activitystream_user",
+                    "processing_manager_activitystream_user",
+                ]
+            )
+            return True
         return False
 
     def line_manager_access(
@@ -1024,6 +1023,7 @@ class ConfirmDetailsView(ReviewViewMixin, BaseTemplateView, FormView):
     def form_valid(self, form) -> HttpResponse:
         self.leaving_request.line_manager_complete = timezone.now()
         self.leaving_request.save()
+        progress_flow_on_commit(self.leaving_request.flow)
 
         return super().form_valid(form)
 
@@ -1108,6 +1108,7 @@ class OfflineServiceNowView(OfflineServiceNowBaseView, BaseTemplateView, FormVie
     def form_valid(self, form) -> HttpResponse:
         self.leaving_request.line_manager_service_now_complete = timezone.now()
         self.leaving_request.save(update_fields=["line_manager_service_now_complete"])
+        progress_flow_on_commit(self.leaving_request.flow)
 
         return super().form_valid(form)
 
@@ -36,6 +36,7 @@ from leavers.utils.security_team import (
 from leavers.views import base
 from leavers.views.leaver import LeavingRequestViewMixin
 from leavers.views.sre import ServiceInfo
+from leavers.workflow.schedule import progress_flow_on_commit
 from user.models import User
 
 ROSA_KIT: List[str] = [
@@ -405,6 +406,7 @@ class BuildingPassConfirmationCloseView(SecurityViewMixin, FormView):
     def form_valid(self, form):
         self.leaving_request.security_team_building_pass_complete = timezone.now()
         self.leaving_request.save()
+        progress_flow_on_commit(self.leaving_request.flow)
         return super().form_valid(form)
 
     def get_page_title(self):
@@ -851,6 +853,7 @@ class RosaKitConfirmationCloseView(SecurityViewMixin, FormView):
     def form_valid(self, form):
         self.leaving_request.security_team_rosa_kit_complete = timezone.now()
         self.leaving_request.save()
+        progress_flow_on_commit(self.leaving_request.flow)
         return super().form_valid(form)
 
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
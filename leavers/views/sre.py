@@ -25,6 +25,7 @@ from leavers.forms.sre import (
 from leavers.models import LeaverInformation, LeavingRequest, TaskLog
 from leavers.views import base
 from leavers.views.leaver import LeavingRequestViewMixin
+from leavers.workflow.schedule import progress_flow_on_commit
 from user.models import User
 
 
@@ -409,6 +410,7 @@ class TaskCompleteConfirmationView(SreTaskViewMixin, FormView):
 
         self.leaving_request.sre_complete = timezone.now()
         self.leaving_request.save(update_fields=["sre_complete"])
+        progress_flow_on_commit(self.leaving_request.flow)
 
         return response
 
@@ -0,0 +1,270 @@
+"""Simulate the leaving workflow for synthetic leavers.
+
+See `python manage.py benchmark_workflows --help`.
+"""
+
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+from django_workflow_engine.executor import WorkflowExecutor
+from django_workflow_engine.models import Flow
+from freezegun import freeze_time
+from govuk_bank_holidays.bank_holidays import BankHolidays
+
+from core.utils.staff_index import StaffDocument
+from leavers.factories import LeaverInformationFactory, LeavingRequestFactory
+from leavers.models import LeavingRequest
+from leavers.types import LeavingReason
+from leavers.workflow.progress import progress_flows
+from leavers.workflow.schedule import get_due_flows
+
+# The days after the request that the people involved submit their part.
+LINE_MANAGER_SUBMITS_AFTER_DAYS = 1
+PROCESSORS_SUBMIT_AFTER_LEAVING_DATE_DAYS = 1
+
+
+@dataclass
+class SimulationResult:
+    flows: int
+    days: int
+    ticks: int
+    duration_s: float = 0.0
+    flow_runs: int = 0
+    steps: int = 0
+    queries: int = 0
+    finished_flows: int = 0
+    emails_by_day: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def flows_per_second(self) -> float:
+        """Flow runs per second of time spent progressing flows."""
+        if not self.duration_s:
+            return 0.0
+        return self.flow_runs / self.duration_s
+
+    @property
+    def queries_per_step(self) -> float:
+        if not self.steps:
+            return 0.0
+        return self.queries / self.steps
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "flows": self.flows,
+            "days": self.days,
+            "ticks": self.ticks,
+            "duration_s": self.duration_s,
+            "flow_runs": self.flow_runs,
+            "flows_per_second": self.flows_per_second,
+            "steps": self.steps,
+            "queries": self.queries,
+            "queries_per_step": self.queries_per_step,
+            "finished_flows": self.finished_flows,
+            "emails_by_day": self.emails_by_day,
+        }
+
+
+def create_synthetic_leaving_requests(
+    *, count: int, start: datetime, seed: int = 0
+) -> List[Flow]:
+    """Create leaving requests, that the leavers have submitted, with flows.
+
+    The leaving dates are spread over the 4 weeks after `start`.
+    """
+    rand = random.Random(seed)
+    flows: List[Flow] = []
+
+    for i in range(count):
+        leaving_date = start + timedelta(days=rand.randint(3, 28))
+        leaving_request: LeavingRequest = LeavingRequestFactory(
+            leaving_date=leaving_date,
+            last_day=leaving_date - timedelta(days=rand.randint(0, 3)),
+            leaver_complete=start,
+            reason_for_leaving=LeavingReason.RESIGNATION.value,
+            is_rosa_user=rand.random() < 0.2,
+            leaver_activitystream_user__uksbs_person_id=f"benchmark-{i}",
+            leaver_activitystream_user__employee_numbers=[f"benchmark-{i}"],
+            manager_activitystream_user__uksbs_person_id=f"benchmark-{i}manager",
+        )
+        LeaverInformationFactory(
+            leaving_request=leaving_request,
+            leaver_date_of_birth=datetime(1990, 1, 1).date(),
+            dse_assets=[],
+            cirrus_assets=[],
+        )
+        leaving_request.processing_manager_activitystream_user = (
+            leaving_request.manager_activitystream_user
+        )
+        leaving_request.flow = Flow.objects.create(
+            workflow_name="leaving",
+            flow_name=f"Benchmark leaver {i}",
+            executed_by=leaving_request.user_requesting,
+        )
+        leaving_request.save()
+        flows.append(leaving_request.flow)
+
+    return flows
+
+
+def submit_due_forms(*, flow_pks: List[int], now: datetime) -> None:
+    """Submit the line manager and processor forms that are due."""
+    leaving_requests = LeavingRequest.objects.filter(flow_id__in=flow_pks)
+
+    leaving_requests.filter(
+        line_manager_complete__isnull=True,
+        leaver_complete__lte=now - timedelta(days=LINE_MANAGER_SUBMITS_AFTER_DAYS),
+    ).update(line_manager_complete=now, last_modified=now)
+
+    leaving_requests.filter(
+        sre_complete__isnull=True,
+        leaving_date__lte=now
+        - timedelta(days=PROCESSORS_SUBMIT_AFTER_LEAVING_DATE_DAYS),
+    ).update(
+        sre_complete=now,
+        security_team_building_pass_complete=now,
+        security_team_rosa_kit_complete=now,
+        last_modified=now,
+    )
+
+
+@contextmanager
+def stub_external_services(emails_sent: Counter) -> Iterator[None]:
+    """Stub UK SBS, Service Now, the LSD help desk, Notify, Slack, the Staff
+    index and the GOV.UK bank holidays.
+
+    Every email address sent to is counted in `emails_sent`, by day.
+    """
+
+    def email(email_addresses, template_id, personalisation):
+        emails_sent[timezone.now().date().isoformat()] += len(email_addresses)
+
+    def get_staff_document(*, sso_email_user_id=None, staff_uuid=None):
+        return StaffDocument(
+            uuid=staff_uuid or sso_email_user_id or "",
+            available_in_staff_sso=True,
+            staff_sso_activity_stream_id="",
+            staff_sso_email_user_id=sso_email_user_id or "",
+            staff_sso_legacy_id="",
+            staff_sso_first_name="Benchmark",
+            staff_sso_last_name="Leaver",
+            staff_sso_contact_email_address="",
+            staff_sso_email_addresses=[],
+            people_finder_first_name="",
+            people_finder_last_name="",
+            people_finder_job_title="",
+            people_finder_directorate="",
+            people_finder_phone="",
+            people_finder_grade="",
+            people_finder_email="",
+            people_finder_photo=None,
+            people_finder_photo_small=None,
+        )
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            override_settings(
+                UKSBS_INTERFACE="core.uksbs.interfaces.UKSBSStubbed",
+                SERVICE_NOW_INTERFACE="core.service_now.interfaces.ServiceNowStubbed",
+                LSD_HELP_DESK_LIVE=False,
+                JML_TEAM_EMAILS=[],
+            )
+        )
+        stack.enter_context(mock.patch("core.notify.email", side_effect=email))
+        stack.enter_context(mock.patch("core.utils.sre_messages.send_slack_message"))
+        stack.enter_context(
+            mock.patch(
+                "leavers.utils.leaving_request.get_staff_document_from_staff_index",
+                side_effect=get_staff_document,
+            )
+        )
+        stack.enter_context(
+            mock.patch(
+                "govuk_bank_holidays.bank_holidays.requests.get",
+                return_value=mock.Mock(json=BankHolidays.load_backup_data),
+            )
+        )
+        yield
+
+
+def run_simulation(
+    *,
+    flows: int,
+    days: int,
+    ticks_per_day: int = 24,
+    start: datetime,
+    seed: int = 0,
+) -> SimulationResult:
+    """Run the leaving workflow for synthetic leavers on a virtual clock.
+
+    The clock starts at `start` and moves forward one beat at a time, at each
+    beat the due flows are progressed with the real executor. Everything the
+    simulation creates is rolled back.
+    """
+    result = SimulationResult(flows=flows, days=days, ticks=days * ticks_per_day)
+    emails_sent: Counter = Counter()
+
+    # Keep the real clock, freezegun patches `time.perf_counter`.
+    perf_counter = time.perf_counter
+    original_execute_step = WorkflowExecutor.execute_step
+
+    def execute_step(executor, *args, **kwargs):
+        result.steps += 1
+        return original_execute_step(executor, *args, **kwargs)
+
+    def count_query(execute, sql, params, many, context):
+        result.queries += 1
+        return execute(sql, params, many, context)
+
+    with ExitStack() as stack:
+        clock = stack.enter_context(freeze_time(start))
+        stack.enter_context(stub_external_services(emails_sent))
+        stack.enter_context(
+            mock.patch.object(WorkflowExecutor, "execute_step", execute_step)
+        )
+        stack.enter_context(transaction.atomic())
+
+        flow_pks = [
+            flow.pk
+            for flow in create_synthetic_leaving_requests(
+                count=flows, start=start, seed=seed
+            )
+        ]
+
+        tick = timedelta(days=1) / ticks_per_day
+        for i in range(result.ticks):
+            now = start + tick * i
+            clock.move_to(now)
+            submit_due_forms(flow_pks=flow_pks, now=now)
+
+            due_flow_pks = list(
+                get_due_flows()
+                .filter(pk__in=flow_pks)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            if not due_flow_pks:
+                continue
+
+            with connection.execute_wrapper(count_query):
+                tick_start = perf_counter()
+                counts = progress_flows(due_flow_pks)
+                result.duration_s += perf_counter() - tick_start
+            result.flow_runs += counts["progressed"]
+
+        result.finished_flows = Flow.objects.filter(
+            pk__in=flow_pks, finished__isnull=False
+        ).count()
+        result.emails_by_day = dict(sorted(emails_sent.items()))
+
+        transaction.set_rollback(True)
+
+    return result
@@ -0,0 +1,68 @@
+"""
+The data that the tasks in a workflow run share.
+
+The leaving request, its leaver information and the leaver's, manager's and
+data recipient's SSO emails are loaded once per run, and every task (and the
+model helpers they call) use the loaded data.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.db.models import Prefetch, prefetch_related_objects
+from django_workflow_engine.models import Flow
+
+from leavers.models import LeaverInformation, LeavingRequest
+
+FLOW_CONTEXT_ATTR = "_flow_context"
+
+# The relations of a LeavingRequest that the tasks use.
+LEAVING_REQUEST_SELECT_RELATED: List[str] = [
+    "leaver_activitystream_user",
+    "manager_activitystream_user",
+    "data_recipient_activitystream_user",
+]
+
+
+def get_leaving_request_prefetches(prefix: str = "") -> List[Prefetch]:
+    return [
+        Prefetch(
+            f"{prefix}leaver_information",
+            queryset=LeaverInformation.objects.order_by("pk"),
+        ),
+        Prefetch(f"{prefix}leaver_activitystream_user__sso_emails"),
+        Prefetch(f"{prefix}manager_activitystream_user__sso_emails"),
+        Prefetch(f"{prefix}data_recipient_activitystream_user__sso_emails"),
+    ]
+
+
+@dataclass
+class FlowContext:
+    leaving_request: LeavingRequest
+    leaver_information: Optional[LeaverInformation]
+
+
+def get_flow_context(flow: Flow) -> FlowContext:
+    """Get the context for the flow's current run, loading it on first use."""
+    flow_context: Optional[FlowContext] = getattr(flow, FLOW_CONTEXT_ATTR, None)
+    if flow_context:
+        return flow_context
+
+    leaving_request: Optional[LeavingRequest] = getattr(flow, "leaving_request", None)
+    if not leaving_request:
+        raise Exception("The Flow is missing the LeavingRequest that it relates to.")
+
+    # Lookups that have already been prefetched aren't fetched again.
+    prefetch_related_objects([leaving_request], *get_leaving_request_prefetches())
+
+    flow_context = FlowContext(
+        leaving_request=leaving_request,
+        leaver_information=leaving_request.get_leaver_information(),
+    )
+    setattr(flow, FLOW_CONTEXT_ATTR, flow_context)
+    return flow_context
+
+
+def clear_flow_context(flow: Flow) -> None:
+    if hasattr(flow, FLOW_CONTEXT_ATTR):
+        delattr(flow, FLOW_CONTEXT_ATTR)
@@ -0,0 +1,198 @@
+"""
+Time the runs of each workflow step.
+
+Every run of a `LeavingRequestTask` is recorded as a `WorkflowStepRun`, with
+how long the task took, its outcome and its queue lag. The queue lag is the
+time from when the flow became due (see `leavers.workflow.schedule`) to the
+start of the run, so it includes the time spent waiting for a beat and in the
+Celery queue.
+
+The step runs of a flow run are saved together once the run ends, see
+`start_flow_run` and `save_step_runs`.
+"""
+
+import time
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Avg, Count, Max, Q, Sum
+from django.utils import timezone
+from django_workflow_engine.models import Flow, TaskStatus
+
+from leavers.models import WorkflowStepRun
+from leavers.types import WorkflowStepOutcome
+
+STEP_RUNS_ATTR = "_step_runs"
+FLOW_DUE_AT_ATTR = "_flow_due_at"
+
+# The histogram buckets, as (label, lower bound, upper bound) in milliseconds.
+DURATION_BUCKETS: List[Tuple[str, int, Optional[int]]] = [
+    ("< 100ms", 0, 100),
+    ("100ms - 1s", 100, 1000),
+    ("1s - 10s", 1000, 10 * 1000),
+    ("10s - 1m", 10 * 1000, 60 * 1000),
+    ("1m +", 60 * 1000, None),
+]
+QUEUE_LAG_BUCKETS: List[Tuple[str, int, Optional[int]]] = [
+    ("< 1m", 0, 60 * 1000),
+    ("1m - 10m", 60 * 1000, 10 * 60 * 1000),
+    ("10m - 1h", 10 * 60 * 1000, 60 * 60 * 1000),
+    ("1h - 1d", 60 * 60 * 1000, 24 * 60 * 60 * 1000),
+    ("1d +", 24 * 60 * 60 * 1000, None),
+]
+
+
+def start_flow_run(flow: Flow, due_at: Optional[datetime]) -> None:
+    """Collect the step runs of the flow until `save_step_runs` is called."""
+    setattr(flow, STEP_RUNS_ATTR, [])
+    setattr(flow, FLOW_DUE_AT_ATTR, due_at)
+
+
+def get_queue_lag_ms(flow: Flow, started_at: datetime) -> Optional[int]:
+    due_at: Optional[datetime] = getattr(flow, FLOW_DUE_AT_ATTR, None)
+    if not due_at:
+        return None
+    return max(int((started_at - due_at).total_seconds() * 1000), 0)
+
+
+def record_step_run(
+    flow: Flow,
+    *,
+    task_status: TaskStatus,
+    outcome: WorkflowStepOutcome,
+    started_at: datetime,
+    duration_ms: int,
+) -> WorkflowStepRun:
+    """Record a run of a step.
+
+    Outside of a flow run (see `start_flow_run`) the step run is saved
+    straight away.
+    """
+    step_run = WorkflowStepRun(
+        flow=flow,
+        step_id=task_status.step_id,
+        task_name=task_status.task_name,
+        outcome=outcome.value,
+        started_at=started_at,
+        duration_ms=duration_ms,
+        queue_lag_ms=get_queue_lag_ms(flow, started_at),
+    )
+
+    step_runs: Optional[List[WorkflowStepRun]] = getattr(flow, STEP_RUNS_ATTR, None)
+    if step_runs is None:
+        step_run.save()
+    else:
+        step_runs.append(step_run)
+    return step_run
+
+
+def save_step_runs(flow: Flow) -> List[WorkflowStepRun]:
+    """Save the step runs recorded since `start_flow_run`, in one query."""
+    step_runs: List[WorkflowStepRun] = getattr(flow, STEP_RUNS_ATTR, None) or []
+    if hasattr(flow, STEP_RUNS_ATTR):
+        delattr(flow, STEP_RUNS_ATTR)
+    if hasattr(flow, FLOW_DUE_AT_ATTR):
+        delattr(flow, FLOW_DUE_AT_ATTR)
+
+    return WorkflowStepRun.objects.bulk_create(step_runs)
+
+
+def timed_execute(execute: Callable) -> Callable:
+    """Wrap a task's `execute` method to record each run of the step.
+
+    The task can set `skipped` to mark a done run as skipped, e.g. when
+    `LeavingRequestTask.should_skip` is True.
+    """
+
+    @wraps(execute)
+    def wrapper(task, task_info):
+        task.skipped = False
+        started_at = timezone.now()
+        start = time.perf_counter()
+
+        outcome = WorkflowStepOutcome.ERROR
+        try:
+            targets, task_done = execute(task, task_info)
+            if task_done:
+                outcome = (
+                    WorkflowStepOutcome.SKIPPED
+                    if task.skipped
+                    else WorkflowStepOutcome.PROGRESSED
+                )
+            else:
+                outcome = WorkflowStepOutcome.WAITING
+            return targets, task_done
+        finally:
+            record_step_run(
+                task.flow,
+                task_status=task.task_status,
+                outcome=outcome,
+                started_at=started_at,
+                duration_ms=int((time.perf_counter() - start) * 1000),
+            )
+
+    return wrapper
+
+
+def get_bucket_counts(
+    field: str, buckets: List[Tuple[str, int, Optional[int]]]
+) -> Dict[str, Count]:
+    bucket_counts: Dict[str, Count] = {}
+    for i, (_, lower, upper) in enumerate(buckets):
+        bucket_filter = Q(**{f"{field}__gte": lower})
+        if upper is not None:
+            bucket_filter &= Q(**{f"{field}__lt": upper})
+        bucket_counts[f"{field}_bucket_{i}"] = Count("pk", filter=bucket_filter)
+    return bucket_counts
+
+
+def get_step_run_summary(*, since: datetime) -> List[Dict[str, Any]]:
+    """Summarise the step runs since the given time, by step.
+
+    The steps that took the most time in total come first.
+    """
+    step_runs = (
+        WorkflowStepRun.objects.filter(started_at__gte=since)
+        .values("step_id", "task_name")
+        .annotate(
+            runs=Count("pk"),
+            **{
+                outcome.value: Count("pk", filter=Q(outcome=outcome.value))
+                for outcome in WorkflowStepOutcome
+            },
+            total_duration_ms=Sum("duration_ms"),
+            avg_duration_ms=Avg("duration_ms"),
+            max_duration_ms=Max("duration_ms"),
+            avg_queue_lag_ms=Avg("queue_lag_ms"),
+            max_queue_lag_ms=Max("queue_lag_ms"),
+            **get_bucket_counts("duration_ms", DURATION_BUCKETS),
+            **get_bucket_counts("queue_lag_ms", QUEUE_LAG_BUCKETS),
+        )
+        .order_by("-total_duration_ms", "step_id")
+    )
+
+    summary: List[Dict[str, Any]] = []
+    for step_run in step_runs:
+        step_run["duration_histogram"] = [
+            step_run.pop(f"duration_ms_bucket_{i}")
+            for i in range(len(DURATION_BUCKETS))
+        ]
+        step_run["queue_lag_histogram"] = [
+            step_run.pop(f"queue_lag_ms_bucket_{i}")
+            for i in range(len(QUEUE_LAG_BUCKETS))
+        ]
+        summary.append(step_run)
+    return summary
+
+
+def delete_old_step_runs() -> int:
+    """Delete the step runs older than WORKFLOW_STEP_RUN_RETENTION_DAYS.
+
+    Returns:
+        int: The number of step runs that were deleted.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.WORKFLOW_STEP_RUN_RETENTION_DAYS)
+    deleted, _ = WorkflowStepRun.objects.filter(started_at__lt=cutoff).delete()
+    return deleted
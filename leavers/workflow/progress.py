@@ -0,0 +1,204 @@
+"""
+Progress workflows in batches.
+
+The flows in a batch are loaded together with the data the tasks share (see
+`leavers.workflow.context`), so it isn't queried for one flow at a time.
+
+At most one run of a flow is queued (see `mark_flows_queued`) or running (see
+`flow_lock`) at a time, so a slow run can't overlap with the next beat. A run
+that finds the flow locked is queued again (see `requeue_flows`), so a change
+made during a long run isn't lost.
+"""
+
+import logging
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django_workflow_engine.exceptions import WorkflowNotAuthError
+from django_workflow_engine.executor import WorkflowExecutor
+from django_workflow_engine.models import Flow
+
+from leavers.models import FlowSchedule
+from leavers.workflow.context import (
+    LEAVING_REQUEST_SELECT_RELATED,
+    clear_flow_context,
+    get_leaving_request_prefetches,
+)
+from leavers.workflow.metrics import save_step_runs, start_flow_run
+from leavers.workflow.schedule import (
+    clear_step_due_times,
+    get_flow_due_at,
+    schedule_flow,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_flow_queued_key(flow_pk: int) -> str:
+    return f"progress_workflow_queued_{flow_pk}"
+
+
+def get_flow_lock_key(flow_pk: int) -> str:
+    return f"progress_workflow_lock_{flow_pk}"
+
+
+def mark_flows_queued(flow_pks: Sequence[int]) -> List[int]:
+    """Mark the flows as queued for a run.
+
+    Returns:
+        List[int]: The flows that weren't already queued, only these should be
+            enqueued.
+    """
+    return [
+        flow_pk
+        for flow_pk in flow_pks
+        if cache.add(
+            get_flow_queued_key(flow_pk),
+            True,
+            timeout=settings.WORKFLOW_PROGRESS_LOCK_TIMEOUT,
+        )
+    ]
+
+
+def unmark_flows_queued(flow_pks: Sequence[int]) -> None:
+    cache.delete_many([get_flow_queued_key(flow_pk) for flow_pk in flow_pks])
+
+
+@contextmanager
+def flow_lock(flow_pk: int) -> Iterator[bool]:
+    """Lock the flow for a run.
+
+    The lock is a lease, it expires after WORKFLOW_PROGRESS_LOCK_TIMEOUT
+    seconds in case the worker holding it dies.
+
+    Yields:
+        bool: True if the lock was acquired.
+    """
+    lock_key = get_flow_lock_key(flow_pk)
+    token = uuid.uuid4().hex
+    acquired = cache.add(
+        lock_key, token, timeout=settings.WORKFLOW_PROGRESS_LOCK_TIMEOUT
+    )
+    try:
+        yield acquired
+    finally:
+        # Only release the lock if the lease hasn't passed to another run.
+        if acquired and cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+def requeue_flows(flow_pks: Sequence[int]) -> List[int]:
+    """Queue another run of the flows, after the debounce window.
+
+    Returns:
+        List[int]: The flows that were queued, a flow that already has a run
+            queued isn't queued again.
+    """
+    from core.tasks import progress_workflow
+
+    flow_pks = mark_flows_queued(flow_pks)
+    for flow_pk in flow_pks:
+        progress_workflow.apply_async(
+            kwargs={"flow_pk": flow_pk},
+            countdown=settings.WORKFLOW_PROGRESS_DEBOUNCE_SECONDS,
+        )
+    return flow_pks
+
+
+def finish_cancelled_flows(flow_pks: Sequence[int]) -> int:
+    """Finish the unfinished flows of cancelled leaving requests.
+
+    Returns:
+        int: The number of flows that were finished.
+    """
+    cancelled_flows = Flow.objects.filter(
+        pk__in=flow_pks,
+        finished__isnull=True,
+        leaving_request__cancelled__isnull=False,
+    )
+    cancelled_flow_pks = list(cancelled_flows.values_list("pk", flat=True))
+    if not cancelled_flow_pks:
+        return 0
+
+    Flow.objects.filter(pk__in=cancelled_flow_pks).update(finished=timezone.now())
+    FlowSchedule.objects.filter(flow_id__in=cancelled_flow_pks).delete()
+    return len(cancelled_flow_pks)
+
+
+def get_flows_to_progress(flow_pks: Sequence[int]) -> List[Flow]:
+    """Get the unfinished flows, with the data the tasks need prefetched."""
+    return list(
+        Flow.objects.filter(pk__in=flow_pks, finished__isnull=True)
+        .select_related(
+            "schedule",
+            "leaving_request",
+            *[f"leaving_request__{field}" for field in LEAVING_REQUEST_SELECT_RELATED],
+        )
+        .prefetch_related(*get_leaving_request_prefetches("leaving_request__"))
+        .order_by("pk")
+    )
+
+
+def progress_flow(flow: Flow, loaded_at: Optional[datetime] = None) -> None:
+    """Run the flow, then schedule when it next has work due.
+
+    `loaded_at` is when the flow and its leaving request were loaded, it
+    defaults to the start of the run.
+    """
+    loaded_at = loaded_at or timezone.now()
+    clear_step_due_times(flow)
+    clear_flow_context(flow)
+    start_flow_run(flow, due_at=get_flow_due_at(flow))
+    executor = WorkflowExecutor(flow)
+    try:
+        executor.run_flow(user=None)
+    except WorkflowNotAuthError as e:
+        logger.warning(f"{e}")
+        return None
+    finally:
+        save_step_runs(flow)
+
+    schedule_flow(flow, scheduled_at=loaded_at)
+
+
+def progress_flows(flow_pks: Sequence[int]) -> Counter[str]:
+    """Progress a batch of flows.
+
+    A flow that fails is logged, and doesn't stop the rest of the batch. A flow
+    that another run holds the lock for is skipped, and queued again.
+
+    Returns:
+        Counter[str]: The number of flows that were "cancelled", "progressed",
+            "failed" and "contended".
+    """
+    # The flows are no longer queued, a new run can be queued from here on.
+    unmark_flows_queued(flow_pks)
+
+    counts: Counter[str] = Counter()
+    counts["cancelled"] = finish_cancelled_flows(flow_pks)
+
+    contended_flow_pks: List[int] = []
+    loaded_at = timezone.now()
+    for flow in get_flows_to_progress(flow_pks):
+        with flow_lock(flow.pk) as acquired:
+            if not acquired:
+                contended_flow_pks.append(flow.pk)
+                continue
+
+            try:
+                progress_flow(flow, loaded_at=loaded_at)
+            except Exception:
+                logger.exception(f"Failed to progress flow {flow.pk}")
+                counts["failed"] += 1
+            else:
+                counts["progressed"] += 1
+
+    counts["contended"] = len(contended_flow_pks)
+    requeue_flows(contended_flow_pks)
+    return counts
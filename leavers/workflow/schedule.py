@@ -0,0 +1,150 @@
+"""
+Schedule when each workflow next has work due.
+
+Tasks that are waiting on a known time (a leaving date, working hours, a
+reminder date) can call `LeavingRequestTask.set_next_due_at`. After a run,
+`schedule_flow` stores the earliest of those times as the flow's
+`FlowSchedule.next_due_at`. If a waiting step didn't set a time, the flow is
+due straight away, so it is progressed on the next beat as before.
+
+A flow is also due when its leaving request has changed since it was
+scheduled, as the change might move the times that the tasks set.
+
+Submissions that a workflow is waiting on use `progress_flow_on_commit` to
+progress the workflow straight away, rather than on the next beat.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.query import QuerySet
+from django.utils import timezone
+from django_workflow_engine.models import Flow
+
+from leavers.models import FlowSchedule
+
+STEP_DUE_TIMES_ATTR = "_step_due_times"
+
+
+def get_step_due_times(flow: Flow) -> Dict[str, datetime]:
+    """Get the due times set by the tasks in the current run, keyed by step."""
+    if not hasattr(flow, STEP_DUE_TIMES_ATTR):
+        setattr(flow, STEP_DUE_TIMES_ATTR, {})
+    return getattr(flow, STEP_DUE_TIMES_ATTR)
+
+
+def set_step_due_at(flow: Flow, step_id: str, due_at: datetime) -> None:
+    step_due_times = get_step_due_times(flow)
+    if step_id not in step_due_times or due_at < step_due_times[step_id]:
+        step_due_times[step_id] = due_at
+
+
+def clear_step_due_times(flow: Flow) -> None:
+    setattr(flow, STEP_DUE_TIMES_ATTR, {})
+
+
+def get_next_due_at(flow: Flow) -> datetime:
+    """Get when the flow next has work due, after a run."""
+    now = timezone.now()
+    step_due_times = get_step_due_times(flow)
+    waiting_step_ids: List[str] = list(
+        flow.tasks.filter(executed_at__isnull=True).values_list("step_id", flat=True)
+    )
+
+    due_times: List[Optional[datetime]] = [
+        step_due_times.get(step_id) for step_id in waiting_step_ids
+    ]
+    if not due_times or None in due_times:
+        return now
+    return max(min(due_times), now)
+
+
+def schedule_flow(
+    flow: Flow, scheduled_at: Optional[datetime] = None
+) -> Optional[FlowSchedule]:
+    """Store when the flow next has work due, after a run.
+
+    `scheduled_at` should be when the run loaded the flow's leaving request, so
+    a change committed during the run still makes the flow due.
+    """
+    if flow.finished:
+        FlowSchedule.objects.filter(flow=flow).delete()
+        return None
+
+    flow_schedule, _ = FlowSchedule.objects.update_or_create(
+        flow=flow,
+        defaults={
+            "next_due_at": get_next_due_at(flow),
+            "scheduled_at": scheduled_at or timezone.now(),
+        },
+    )
+    return flow_schedule
+
+
+def get_due_flows() -> QuerySet[Flow]:
+    """Get the unfinished flows that have work due."""
+    return Flow.objects.filter(finished__isnull=True).filter(
+        Q(schedule__isnull=True)
+        | Q(schedule__next_due_at__lte=timezone.now())
+        | Q(leaving_request__last_modified__gt=F("schedule__scheduled_at"))
+    )
+
+
+def get_flow_due_at(flow: Flow) -> Optional[datetime]:
+    """Get when the flow became due, before a run.
+
+    Returns:
+        Optional[datetime]: None if the flow hasn't been scheduled yet.
+    """
+    flow_schedule: Optional[FlowSchedule] = getattr(flow, "schedule", None)
+    if not flow_schedule:
+        return None
+
+    due_at = flow_schedule.next_due_at
+    leaving_request = getattr(flow, "leaving_request", None)
+    if leaving_request and leaving_request.last_modified > flow_schedule.scheduled_at:
+        due_at = min(due_at, leaving_request.last_modified)
+    return due_at
+
+
+def get_progress_flow_lock_key(flow_pk: int) -> str:
+    return f"progress_flow_on_commit_{flow_pk}"
+
+
+def enqueue_flow_progress(flow_pk: int) -> bool:
+    """Enqueue a run of the flow, unless one has been enqueued recently.
+
+    Returns:
+        bool: True if a run was enqueued.
+    """
+    from core.tasks import progress_workflow
+    from leavers.workflow.progress import mark_flows_queued
+
+    debounce_seconds = settings.WORKFLOW_PROGRESS_DEBOUNCE_SECONDS
+    if not cache.add(
+        get_progress_flow_lock_key(flow_pk), True, timeout=debounce_seconds
+    ):
+        return False
+
+    # A queued run that hasn't started yet will see the change.
+    if not mark_flows_queued([flow_pk]):
+        return False
+
+    # Wait out the debounce window, so the run sees every change in the burst.
+    progress_workflow.apply_async(
+        kwargs={"flow_pk": flow_pk}, countdown=debounce_seconds
+    )
+    return True
+
+
+def progress_flow_on_commit(flow: Optional[Flow]) -> None:
+    """Progress the flow once the current transaction commits."""
+    if not flow or flow.finished:
+        return
+
+    flow_pk = flow.pk
+    transaction.on_commit(lambda: enqueue_flow_progress(flow_pk))
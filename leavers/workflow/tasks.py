@@ -1,6 +1,6 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from warnings import warn
 
 from django.db.models.query import QuerySet
@@ -17,9 +17,9 @@ from core.service_now.types import AssetDetails
 from core.uksbs import get_uksbs_interface
 from core.uksbs.client import UKSBSPersonNotFound, UKSBSUnexpectedResponse
 from core.uksbs.types import PersonData
-from core.utils.helpers import is_work_day_and_time
+from core.utils.helpers import get_next_work_day_and_time, is_work_day_and_time
 from leavers.exceptions import LeaverDoesNotHaveUKSBSPersonId
-from leavers.models import LeaverInformation, LeavingRequest, TaskLog
+from leavers.models import LeaverInformation, LeavingRequest
 from leavers.types import LeavingReason, ReminderEmailDict
 from leavers.utils.emails import (
     get_leaving_request_email_personalisation,
@@ -44,6 +44,9 @@ from leavers.utils.emails import (
     send_security_team_offboard_rk_leaver_email,
 )
 from leavers.utils.leaving_request import get_leaver_details
+from leavers.workflow.context import get_flow_context
+from leavers.workflow.metrics import timed_execute
+from leavers.workflow.schedule import set_step_due_at
 
 
 class SkipCondition(Enum):
@@ -55,21 +58,35 @@ class SkipCondition(Enum):
 
 class LeavingRequestTask(Task):
     abstract = True
+    # Set by `should_skip`, runs that are skipped are recorded as such.
+    skipped: bool = False
+    # True if the task only waits on changes to the leaving request, which make
+    # the flow due straight away (see `leavers.workflow.schedule.get_due_flows`).
+    waits_on_leaving_request: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record the duration and outcome of every run of the task.
+        if "execute" in cls.__dict__:
+            cls.execute = timed_execute(cls.__dict__["execute"])
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        leaving_request: Optional[LeavingRequest] = getattr(
-            self.flow, "leaving_request", None
-        )
-        if not leaving_request:
-            raise Exception(
-                "The Flow is missing the LeavingRequest that it relates to."
-            )
-        self.leaving_request: LeavingRequest = leaving_request
+        # Shared by every task in the run.
+        flow_context = get_flow_context(self.flow)
+        self.leaving_request: LeavingRequest = flow_context.leaving_request
         self.leaving_information: Optional[LeaverInformation] = (
-            leaving_request.leaver_information.first()
+            flow_context.leaver_information
         )
 
+    def set_next_due_at(self, due_at: datetime) -> None:
+        """
+        Set when this task should next be run, if it isn't done.
+
+        Without this, the flow is progressed again on the next beat.
+        """
+        set_step_due_at(self.flow, step_id=self.task_status.step_id, due_at=due_at)
+
     def should_skip(self, task_info) -> bool:
         skip_conditions: List[str] = task_info.get("skip_conditions", [])
         skip_results: List[bool] = []
@@ -94,7 +111,8 @@ class LeavingRequestTask(Task):
                     not self.leaving_information.is_health_and_safety_officer
                     and not self.leaving_information.is_floor_liaison_officer
                 )
-        return any(skip_results)
+        self.skipped = any(skip_results)
+        return self.skipped
 
 
 class BasicTask(LeavingRequestTask):
@@ -122,6 +140,12 @@ class PauseTask(LeavingRequestTask):
 
     def execute(self, task_info):
         if self.should_pause(task_info):
+            pass_condition: str = task_info.get("pass_condition", "")
+            if (
+                pass_condition == "after_leaving_date"
+                and self.leaving_request.leaving_date
+            ):
+                self.set_next_due_at(self.leaving_request.leaving_date)
             return [], False
         return [], True
 
@@ -311,7 +335,7 @@ class ServiceNowSendLeaverDetails(LeavingRequestTask):
 
         leaver_details = get_leaver_details(leaving_request=self.leaving_request)
         leaver_information: Optional[LeaverInformation] = (
-            self.leaving_request.leaver_information.first()
+            self.leaving_request.get_leaver_information()
         )
 
         if not leaver_information:
@@ -553,6 +577,44 @@ class EmailTask(LeavingRequestTask):
         """
         return True
 
+    def get_latest_email_sent_at(self, email_id: EmailIds) -> Optional[datetime]:
+        """
+        Get when the email was last sent for the leaving request.
+        """
+        return (
+            self.leaving_request.email_send_records.filter(email_id=email_id.value)
+            .order_by("-sent_at")
+            .values_list("sent_at", flat=True)
+            .first()
+        )
+
+    def get_next_email_date(self, email_id: EmailIds) -> Optional[datetime]:
+        """
+        Get when the email should next be sent, if it is a reminder.
+
+        None if the email should be sent straight away, or isn't a reminder.
+        """
+        return None
+
+    def set_next_reminder_at(self, next_email_date: datetime) -> None:
+        """
+        Set when the reminder loop should next be run.
+
+        The steps that the reminder loops back to are given the same time, if
+        they only wait on the leaving request, so the loop isn't run again
+        until the next reminder is due.
+        """
+        due_at = get_next_work_day_and_time(next_email_date)
+        self.set_next_due_at(due_at)
+
+        step = self.flow.workflow.get_step(self.task_status.step_id)
+        if not step or not isinstance(step.targets, list):
+            return
+        for target in step.targets:
+            target_step = self.flow.workflow.get_step(target)
+            if target_step and target_step.task.waits_on_leaving_request:
+                set_step_due_at(self.flow, step_id=target, due_at=due_at)
+
     def get_send_email_method(self, email_id: EmailIds) -> Callable:
         send_email_method: Optional[Callable] = EMAIL_MAPPING.get(email_id, None)
 
@@ -580,15 +642,24 @@ class EmailTask(LeavingRequestTask):
                 task_name=f"Sending email {email_id.value}",
             )
             self.leaving_request.email_task_logs.add(email_task_log)
+            self.leaving_request.email_send_records.create(
+                email_id=email_id.value,
+                sent_at=email_task_log.created_at,
+                task_log=email_task_log,
+            )
             self.leaving_request.save()
 
     def execute(self, task_info):
-        if not is_work_day_and_time(timezone.now()):
+        now = timezone.now()
+        if not is_work_day_and_time(now):
+            self.set_next_due_at(get_next_work_day_and_time(now))
             return None, False
 
         if not self.should_skip(task_info=task_info):
             email_id: EmailIds = EmailIds(task_info["email_id"])
             self.send_email(email_id=email_id)
+            if next_email_date := self.get_next_email_date(email_id=email_id):
+                self.set_next_reminder_at(next_email_date)
         return None, True
 
 
@@ -603,24 +674,21 @@ class DailyReminderEmail(EmailTask):
     task_name = "daily_reminder_email"
     auto = True
 
+    def get_next_email_date(self, email_id: EmailIds) -> Optional[datetime]:
+        latest_email_sent_at = self.get_latest_email_sent_at(email_id=email_id)
+
+        if not latest_email_sent_at:
+            return None
+        return latest_email_sent_at + timedelta(days=1)
+
     def should_send_email(
         self,
         email_id: EmailIds,
     ) -> bool:
-        latest_email: Optional[TaskLog] = (
-            self.leaving_request.email_task_logs.filter(
-                task_name__contains=email_id.value,
-            )
-            .order_by("-created_at")
-            .first()
-        )
-
-        if not latest_email:
-            return True
+        next_email_date = self.get_next_email_date(email_id=email_id)
 
-        next_email_date = latest_email.created_at + timedelta(days=1)
         # Send the email if the next email date has passed
-        if timezone.now() >= next_email_date:
+        if not next_email_date or timezone.now() >= next_email_date:
             return True
         return False
 
@@ -630,10 +698,7 @@ class ReminderEmail(EmailTask):
     task_name = "reminder_email"
     auto = True
 
-    def should_send_email(
-        self,
-        email_id: EmailIds,
-    ) -> bool:
+    def get_next_email_date(self, email_id: EmailIds) -> Optional[datetime]:
         """
         Sends reminder emails following the following rules:
         - If the last day isn't set:
@@ -645,39 +710,40 @@ class ReminderEmail(EmailTask):
           - Send the email daily for the days after the last day
         """
         last_day = self.leaving_request.get_last_day()
-        latest_email: Optional[TaskLog] = (
-            self.leaving_request.email_task_logs.filter(
-                task_name__contains=email_id.value,
-            )
-            .order_by("-created_at")
-            .first()
-        )
+        latest_email_sent_at = self.get_latest_email_sent_at(email_id=email_id)
 
         # If the last day isn't set, we should send the email daily.
         if not last_day:
-            if not latest_email:
-                return True
+            if not latest_email_sent_at:
+                return None
             else:
-                next_email_date = latest_email.created_at + timedelta(days=1)
+                next_email_date = latest_email_sent_at + timedelta(days=1)
         else:
             two_weeks_before_last_day = last_day - timedelta(days=14)
             one_week_before_last_day = last_day - timedelta(days=7)
 
             # Work out when the next email should be sent
-            if not latest_email:
+            if not latest_email_sent_at:
                 # 2 Weeks before the last day
                 next_email_date = two_weeks_before_last_day
             else:
-                latest_email_date = latest_email.created_at
-                if latest_email_date < one_week_before_last_day:
+                if latest_email_sent_at < one_week_before_last_day:
                     # 2 week email was sent
                     next_email_date = one_week_before_last_day
                 else:
                     # 1 week email was sent
-                    next_email_date = latest_email_date + timedelta(days=1)
+                    next_email_date = latest_email_sent_at + timedelta(days=1)
+
+        return next_email_date
+
+    def should_send_email(
+        self,
+        email_id: EmailIds,
+    ) -> bool:
+        next_email_date = self.get_next_email_date(email_id=email_id)
 
         # Send the email if the next email date has passed
-        if timezone.now() >= next_email_date:
+        if not next_email_date or timezone.now() >= next_email_date:
             return True
         return False
 
@@ -698,8 +764,8 @@ class ProcessorReminderEmail(EmailTask):
         self,
         email_id: EmailIds,
     ) -> bool:
-        already_sent = self.leaving_request.email_task_logs.filter(
-            task_name__contains=email_id.value,
+        already_sent = self.leaving_request.email_send_records.filter(
+            email_id=email_id.value,
         ).exists()
 
         return not already_sent
@@ -771,6 +837,39 @@ class ProcessorReminderEmail(EmailTask):
 
         raise Exception(f"Email method not found for {email_id.value}")
 
+    def get_next_processor_email_date(
+        self, task_info: Dict[Any, Any]
+    ) -> Optional[datetime]:
+        """
+        Get when the next of the reminder emails is due, if any are left.
+        """
+        last_working_day = self.leaving_request.get_last_day()
+        leaving_date = self.leaving_request.get_leaving_date()
+        assert last_working_day
+        assert leaving_date
+
+        email_dates: List[Tuple[str, datetime]] = [
+            ("on_ld", leaving_date),
+            ("one_day_after_ld", leaving_date + timedelta(days=1)),
+            ("five_days_after_ld_lm", leaving_date + timedelta(days=5)),
+            ("five_days_after_ld_proc", leaving_date + timedelta(days=5)),
+        ]
+        if last_working_day.date() != leaving_date.date():
+            email_dates += [
+                ("day_after_lwd", last_working_day + timedelta(days=1)),
+                ("two_days_after_lwd", last_working_day + timedelta(days=2)),
+            ]
+
+        now = timezone.now()
+        return min(
+            (
+                email_date
+                for key, email_date in email_dates
+                if task_info.get(key) and email_date > now
+            ),
+            default=None,
+        )
+
     def send_day_after_last_working_day_email(self, task_info: Dict[Any, Any]):
         today = timezone.now()
         last_working_day = self.leaving_request.get_last_day()
@@ -897,7 +996,9 @@ class ProcessorReminderEmail(EmailTask):
             return None, True
 
         # Check to see if it is a work day
-        if not is_work_day_and_time(timezone.now()):
+        now = timezone.now()
+        if not is_work_day_and_time(now):
+            self.set_next_due_at(get_next_work_day_and_time(now))
             return None, False
 
         self.processor_emails: List[str] = task_info["processor_emails"]
@@ -932,6 +1033,12 @@ class ProcessorReminderEmail(EmailTask):
             task_info=task_info,
         )
 
+        self.set_next_reminder_at(
+            self.get_next_processor_email_date(task_info=task_info)
+            # Once all of the reminders have been sent, check again daily.
+            or now + timedelta(days=1)
+        )
+
         return None, True
 
 
@@ -939,6 +1046,7 @@ class HasLineManagerCompleted(LeavingRequestTask):
     abstract = False
     task_name = "has_line_manager_completed"
     auto = True
+    waits_on_leaving_request = True
 
     def execute(self, task_info):
         if self.leaving_request.line_manager_complete:
@@ -960,6 +1068,7 @@ class HaveSecurityCarriedOutBuildingPassLeavingTasks(LeavingRequestTask):
     abstract = False
     task_name = "have_security_carried_out_bp_leaving_tasks"
     auto = True
+    waits_on_leaving_request = True
 
     def execute(self, task_info):
         if (
@@ -974,6 +1083,7 @@ class HaveSecurityCarriedOutRosaKitLeavingTasks(LeavingRequestTask):
     abstract = False
     task_name = "have_security_carried_out_rk_leaving_tasks"
     auto = True
+    waits_on_leaving_request = True
 
     def execute(self, task_info):
         if not self.leaving_request.is_rosa_user:
@@ -992,6 +1102,7 @@ class HaveSRECarriedOutLeavingTasks(LeavingRequestTask):
     abstract = False
     task_name = "have_sre_carried_out_leaving_tasks"
     auto = True
+    waits_on_leaving_request = True
 
     def execute(self, task_info):
         if self.leaving_request.sre_complete:
@@ -1033,6 +1144,7 @@ class HasLineManagerUpdatedServiceNow(LeavingRequestTask):
     abstract = False
     task_name = "has_line_manager_updated_service_now"
     auto = True
+    waits_on_leaving_request = True
 
     def execute(self, task_info):
         if (
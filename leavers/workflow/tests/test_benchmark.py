@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from django.test import TestCase
+from django.utils.timezone import make_aware
+from django_workflow_engine.models import Flow
+
+from leavers.models import LeavingRequest
+from leavers.workflow.benchmark import SimulationResult, run_simulation
+
+
+class TestSimulationResult(TestCase):
+    def test_rates(self):
+        result = SimulationResult(
+            flows=2, days=1, ticks=24, duration_s=2.0, flow_runs=10, steps=20
+        )
+        result.queries = 100
+
+        self.assertEqual(result.flows_per_second, 5.0)
+        self.assertEqual(result.queries_per_step, 5.0)
+        self.assertEqual(result.to_dict()["flows_per_second"], 5.0)
+
+    def test_rates_without_runs(self):
+        result = SimulationResult(flows=0, days=0, ticks=0)
+
+        self.assertEqual(result.flows_per_second, 0.0)
+        self.assertEqual(result.queries_per_step, 0.0)
+
+
+class TestRunSimulation(TestCase):
+    def test_run_simulation(self):
+        result = run_simulation(
+            flows=2,
+            days=3,
+            ticks_per_day=4,
+            start=make_aware(datetime(2022, 11, 28)),
+        )
+
+        self.assertEqual(result.ticks, 12)
+        self.assertGreater(result.flow_runs, 0)
+        self.assertGreater(result.steps, 0)
+        self.assertGreater(result.queries, 0)
+        self.assertGreater(sum(result.emails_by_day.values()), 0)
+        # Nothing that the simulation created is kept.
+        self.assertFalse(LeavingRequest.objects.exists())
+        self.assertFalse(Flow.objects.exists())
@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from typing import cast
+
+from django.test import TestCase
+from django.utils.timezone import make_aware
+from django_workflow_engine.models import Flow, TaskStatus
+
+from activity_stream.factories import ActivityStreamStaffSSOUserEmailFactory
+from leavers.factories import LeaverInformationFactory, LeavingRequestFactory
+from leavers.models import LeavingRequest
+from leavers.utils.emails import get_leaving_request_email_personalisation
+from leavers.workflow.context import clear_flow_context, get_flow_context
+from leavers.workflow.tasks import BasicTask
+from leavers.workflow.tests.factories import FlowFactory, TaskStatusFactory
+
+
+class TestFlowContext(TestCase):
+    def setUp(self):
+        self.flow = cast(Flow, FlowFactory())
+        self.leaving_request = cast(
+            LeavingRequest,
+            LeavingRequestFactory(
+                flow=self.flow,
+                last_day=make_aware(datetime(2022, 12, 1)),
+                leaving_date=make_aware(datetime(2022, 12, 2)),
+            ),
+        )
+        self.leaver_information = LeaverInformationFactory(
+            leaving_request=self.leaving_request,
+            leaver_date_of_birth=date(1990, 1, 1),
+        )
+        ActivityStreamStaffSSOUserEmailFactory(
+            staff_sso_user=self.leaving_request.manager_activitystream_user,
+            is_primary=True,
+        )
+        # Load the Flow again, so nothing is cached on it.
+        self.flow = Flow.objects.get(pk=self.flow.pk)
+
+    def test_loaded_once_per_run(self):
+        task_status = cast(TaskStatus, TaskStatusFactory(flow=self.flow))
+
+        flow_context = get_flow_context(self.flow)
+        self.assertEqual(flow_context.leaving_request, self.leaving_request)
+        self.assertEqual(flow_context.leaver_information, self.leaver_information)
+
+        with self.assertNumQueries(0):
+            task = BasicTask(None, task_status, self.flow)
+            other_task = BasicTask(None, task_status, self.flow)
+
+        self.assertIs(task.leaving_request, flow_context.leaving_request)
+        self.assertIs(other_task.leaving_request, flow_context.leaving_request)
+
+    def test_model_helpers_use_loaded_data(self):
+        leaving_request = get_flow_context(self.flow).leaving_request
+
+        with self.assertNumQueries(0):
+            personalisation = get_leaving_request_email_personalisation(leaving_request)
+
+        self.assertEqual(
+            personalisation["manager_email"],
+            leaving_request.get_line_manager().get_primary_email(),
+        )
+        self.assertEqual(personalisation["leaving_date"], "02 December 2022")
+
+    def test_clear_flow_context(self):
+        flow_context = get_flow_context(self.flow)
+
+        clear_flow_context(self.flow)
+
+        self.assertIsNot(get_flow_context(self.flow), flow_context)
+
+    def test_missing_leaving_request(self):
+        flow = cast(Flow, FlowFactory())
+
+        with self.assertRaises(Exception):
+            get_flow_context(flow)
@@ -0,0 +1,176 @@
+from datetime import datetime, timedelta
+from typing import cast
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import make_aware
+from django_workflow_engine.models import Flow, TaskStatus
+from freezegun import freeze_time
+
+from leavers.factories import LeavingRequestFactory
+from leavers.models import LeavingRequest, WorkflowStepRun
+from leavers.types import LeavingReason, WorkflowStepOutcome
+from leavers.workflow.metrics import (
+    delete_old_step_runs,
+    get_step_run_summary,
+    save_step_runs,
+    start_flow_run,
+)
+from leavers.workflow.tasks import BasicTask, NotificationEmail, PauseTask
+from leavers.workflow.tests.factories import FlowFactory, TaskStatusFactory
+from user.test.factories import UserFactory
+
+
+@freeze_time("2022-11-28 12:00:00")
+class TestStepRuns(TestCase):
+    def setUp(self):
+        self.flow = cast(Flow, FlowFactory())
+        self.leaving_request = cast(
+            LeavingRequest,
+            LeavingRequestFactory(
+                flow=self.flow, leaving_date=timezone.now() + timedelta(days=1)
+            ),
+        )
+        self.task_status = cast(
+            TaskStatus,
+            TaskStatusFactory(flow=self.flow, step_id="step_1", task_name="pause_task"),
+        )
+
+    def test_progressed(self):
+        BasicTask(None, self.task_status, self.flow).execute({})
+
+        step_run = WorkflowStepRun.objects.get()
+        self.assertEqual(step_run.flow, self.flow)
+        self.assertEqual(step_run.step_id, "step_1")
+        self.assertEqual(step_run.task_name, "pause_task")
+        self.assertEqual(step_run.outcome, WorkflowStepOutcome.PROGRESSED)
+        self.assertEqual(step_run.started_at, timezone.now())
+        self.assertIsNone(step_run.queue_lag_ms)
+
+    def test_waiting(self):
+        PauseTask(None, self.task_status, self.flow).execute(
+            {"pass_condition": "after_leaving_date"}
+        )
+
+        step_run = WorkflowStepRun.objects.get()
+        self.assertEqual(step_run.outcome, WorkflowStepOutcome.WAITING)
+
+    def test_skipped(self):
+        self.leaving_request.reason_for_leaving = LeavingReason.TRANSFER.value
+        self.leaving_request.save()
+
+        NotificationEmail(None, self.task_status, self.flow).execute(
+            {"email_id": "leaver_thank_you_email", "skip_conditions": ["is_transfer"]}
+        )
+
+        step_run = WorkflowStepRun.objects.get()
+        self.assertEqual(step_run.outcome, WorkflowStepOutcome.SKIPPED)
+
+    @mock.patch(
+        "leavers.workflow.tasks.PauseTask.should_pause",
+        side_effect=Exception("Failed"),
+    )
+    def test_error(self, mock_should_pause):
+        with self.assertRaises(Exception):
+            PauseTask(None, self.task_status, self.flow).execute({})
+
+        step_run = WorkflowStepRun.objects.get()
+        self.assertEqual(step_run.outcome, WorkflowStepOutcome.ERROR)
+
+    def test_flow_run(self):
+        start_flow_run(self.flow, due_at=timezone.now() - timedelta(minutes=5))
+
+        BasicTask(None, self.task_status, self.flow).execute({})
+        PauseTask(None, self.task_status, self.flow).execute({})
+        # The step runs are saved at the end of the flow run.
+        self.assertFalse(WorkflowStepRun.objects.exists())
+
+        with self.assertNumQueries(1):
+            save_step_runs(self.flow)
+
+        self.assertEqual(
+            list(
+                WorkflowStepRun.objects.order_by("pk").values_list(
+                    "outcome", "queue_lag_ms"
+                )
+            ),
+            [
+                (WorkflowStepOutcome.PROGRESSED, 5 * 60 * 1000),
+                (WorkflowStepOutcome.WAITING, 5 * 60 * 1000),
+            ],
+        )
+
+
+class TestStepRunSummary(TestCase):
+    def setUp(self):
+        self.flow = cast(Flow, FlowFactory())
+        self.since = make_aware(datetime(2022, 11, 21))
+        for step_id, outcome, duration_ms, queue_lag_ms in [
+            ("send_uksbs", WorkflowStepOutcome.PROGRESSED, 20000, 1000),
+            ("send_uksbs", WorkflowStepOutcome.ERROR, 40000, None),
+            ("pause", WorkflowStepOutcome.WAITING, 50, 2 * 60 * 60 * 1000),
+            ("pause", WorkflowStepOutcome.SKIPPED, 150, 0),
+        ]:
+            WorkflowStepRun.objects.create(
+                flow=self.flow,
+                step_id=step_id,
+                task_name=step_id,
+                outcome=outcome.value,
+                started_at=self.since + timedelta(days=1),
+                duration_ms=duration_ms,
+                queue_lag_ms=queue_lag_ms,
+            )
+        # Outside of the summary period.
+        WorkflowStepRun.objects.create(
+            flow=self.flow,
+            step_id="pause",
+            task_name="pause",
+            outcome=WorkflowStepOutcome.WAITING.value,
+            started_at=self.since - timedelta(days=1),
+            duration_ms=100000,
+        )
+
+    def test_get_step_run_summary(self):
+        summary = get_step_run_summary(since=self.since)
+
+        self.assertEqual([step["step_id"] for step in summary], ["send_uksbs", "pause"])
+        send_uksbs, pause = summary
+        self.assertEqual(send_uksbs["runs"], 2)
+        self.assertEqual(send_uksbs["progressed"], 1)
+        self.assertEqual(send_uksbs["error"], 1)
+        self.assertEqual(send_uksbs["total_duration_ms"], 60000)
+        self.assertEqual(send_uksbs["max_duration_ms"], 40000)
+        self.assertEqual(send_uksbs["duration_histogram"], [0, 0, 0, 2, 0])
+        self.assertEqual(send_uksbs["queue_lag_histogram"], [1, 0, 0, 0, 0])
+        self.assertEqual(pause["waiting"], 1)
+        self.assertEqual(pause["skipped"], 1)
+        self.assertEqual(pause["duration_histogram"], [1, 1, 0, 0, 0])
+        self.assertEqual(pause["queue_lag_histogram"], [1, 0, 0, 1, 0])
+
+    @freeze_time("2022-11-28 12:00:00")
+    def test_delete_old_step_runs(self):
+        with self.settings(WORKFLOW_STEP_RUN_RETENTION_DAYS=7):
+            self.assertEqual(delete_old_step_runs(), 1)
+
+        self.assertEqual(WorkflowStepRun.objects.count(), 4)
+
+    @freeze_time("2022-11-28 12:00:00")
+    def test_summary_view(self):
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(reverse("admin-workflow-steps"), {"days": 7})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [step["step_id"] for step in response.context["steps"]],
+            ["send_uksbs", "pause"],
+        )
+
+    def test_summary_view_staff_only(self):
+        self.client.force_login(UserFactory(is_staff=False))
+
+        response = self.client.get(reverse("admin-workflow-steps"))
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,157 @@
+from typing import List, cast
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from django_workflow_engine.models import Flow
+
+from leavers.factories import LeaverInformationFactory, LeavingRequestFactory
+from leavers.models import FlowSchedule, LeavingRequest
+from leavers.workflow.context import get_flow_context
+from leavers.workflow.progress import (
+    finish_cancelled_flows,
+    flow_lock,
+    get_flows_to_progress,
+    mark_flows_queued,
+    progress_flows,
+    requeue_flows,
+)
+from leavers.workflow.schedule import schedule_flow
+from leavers.workflow.tests.factories import FlowFactory
+
+
+class TestProgressFlows(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.flows: List[Flow] = []
+        self.leaving_requests: List[LeavingRequest] = []
+        for _ in range(3):
+            flow = cast(Flow, FlowFactory())
+            leaving_request = cast(LeavingRequest, LeavingRequestFactory(flow=flow))
+            LeaverInformationFactory(leaving_request=leaving_request)
+            self.flows.append(flow)
+            self.leaving_requests.append(leaving_request)
+        self.flow_pks = [flow.pk for flow in self.flows]
+
+    def test_finish_cancelled_flows(self):
+        cancelled_request = self.leaving_requests[0]
+        cancelled_request.cancelled = timezone.now()
+        cancelled_request.save()
+        schedule_flow(self.flows[0])
+
+        self.assertEqual(finish_cancelled_flows(self.flow_pks), 1)
+
+        self.assertEqual(
+            list(
+                Flow.objects.filter(finished__isnull=False).values_list("pk", flat=True)
+            ),
+            [self.flows[0].pk],
+        )
+        self.assertFalse(FlowSchedule.objects.filter(flow=self.flows[0]).exists())
+
+    def test_get_flows_to_progress_prefetched(self):
+        # The flows, then the leaver information and the SSO emails.
+        with self.assertNumQueries(5):
+            flows = get_flows_to_progress(self.flow_pks)
+
+        with self.assertNumQueries(0):
+            for flow in flows:
+                leaver_information = flow.leaving_request.get_leaver_information()
+                self.assertIsNotNone(leaver_information)
+                flow.leaving_request.leaver.get_email_addresses_for_contact()
+                flow.leaving_request.get_line_manager().get_primary_email()
+                get_flow_context(flow)
+
+    def test_get_flows_to_progress_excludes_finished(self):
+        self.flows[0].finished = timezone.now()
+        self.flows[0].save()
+
+        self.assertEqual(
+            [flow.pk for flow in get_flows_to_progress(self.flow_pks)],
+            self.flow_pks[1:],
+        )
+
+    @mock.patch("leavers.workflow.progress.progress_flow")
+    def test_progress_flows(self, mock_progress_flow):
+        self.leaving_requests[0].cancelled = timezone.now()
+        self.leaving_requests[0].save()
+
+        counts = progress_flows(self.flow_pks)
+
+        self.assertEqual(counts["cancelled"], 1)
+        self.assertEqual(counts["progressed"], 2)
+        self.assertEqual(
+            [call.args[0].pk for call in mock_progress_flow.call_args_list],
+            self.flow_pks[1:],
+        )
+
+    @mock.patch("leavers.workflow.progress.progress_flow")
+    def test_progress_flows_failure(self, mock_progress_flow):
+        mock_progress_flow.side_effect = [Exception("Failed"), None, None]
+
+        counts = progress_flows(self.flow_pks)
+
+        self.assertEqual(counts["progressed"], 2)
+        self.assertEqual(counts["failed"], 1)
+        self.assertEqual(mock_progress_flow.call_count, 3)
+
+    @mock.patch("core.tasks.progress_workflow.apply_async")
+    @mock.patch("leavers.workflow.progress.progress_flow")
+    def test_progress_flows_contended(self, mock_progress_flow, mock_apply_async):
+        with flow_lock(self.flow_pks[0]) as acquired:
+            self.assertTrue(acquired)
+            counts = progress_flows(self.flow_pks)
+
+        self.assertEqual(counts["contended"], 1)
+        self.assertEqual(counts["progressed"], 2)
+        self.assertEqual(
+            [call.args[0].pk for call in mock_progress_flow.call_args_list],
+            self.flow_pks[1:],
+        )
+        # The contended flow is queued again, to pick up changes made during
+        # the other run.
+        mock_apply_async.assert_called_once_with(
+            kwargs={"flow_pk": self.flow_pks[0]}, countdown=5
+        )
+
+    @mock.patch("core.tasks.progress_workflow.apply_async")
+    def test_requeue_flows(self, mock_apply_async):
+        self.assertEqual(requeue_flows(self.flow_pks[:2]), self.flow_pks[:2])
+        # The flows already have a run queued.
+        self.assertEqual(requeue_flows(self.flow_pks), self.flow_pks[2:])
+
+        self.assertEqual(mock_apply_async.call_count, 3)
+
+    @mock.patch("leavers.workflow.progress.progress_flow")
+    def test_progress_flows_unmarks_queued(self, mock_progress_flow):
+        self.assertEqual(mark_flows_queued(self.flow_pks), self.flow_pks)
+        self.assertEqual(mark_flows_queued(self.flow_pks), [])
+
+        progress_flows(self.flow_pks[:1])
+
+        self.assertEqual(mark_flows_queued(self.flow_pks), self.flow_pks[:1])
+
+
+class TestFlowLock(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_lock(self):
+        with flow_lock(1) as acquired:
+            self.assertTrue(acquired)
+            with flow_lock(1) as acquired_again:
+                self.assertFalse(acquired_again)
+            with flow_lock(2) as other_acquired:
+                self.assertTrue(other_acquired)
+
+        with flow_lock(1) as acquired:
+            self.assertTrue(acquired)
+
+    def test_expired_lease_not_released(self):
+        with flow_lock(1) as acquired:
+            self.assertTrue(acquired)
+            # Another run takes over the lock after the lease expires.
+            cache.set("progress_workflow_lock_1", "other")
+
+        self.assertEqual(cache.get("progress_workflow_lock_1"), "other")
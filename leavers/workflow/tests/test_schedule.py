@@ -0,0 +1,234 @@
+from datetime import datetime, timedelta
+from typing import cast
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.timezone import make_aware
+from django_workflow_engine.models import Flow, TaskStatus
+from freezegun import freeze_time
+
+from leavers.factories import LeavingRequestFactory
+from leavers.models import FlowSchedule, LeavingRequest
+from leavers.workflow.schedule import (
+    clear_step_due_times,
+    enqueue_flow_progress,
+    get_due_flows,
+    get_flow_due_at,
+    get_next_due_at,
+    progress_flow_on_commit,
+    schedule_flow,
+    set_step_due_at,
+)
+from leavers.workflow.tasks import NotificationEmail, PauseTask, ReminderEmail
+from leavers.workflow.tests.factories import FlowFactory, TaskStatusFactory
+
+
+@freeze_time("2022-11-28 12:00:00")
+class TestSchedule(TestCase):
+    def setUp(self):
+        self.flow = cast(Flow, FlowFactory())
+        self.leaving_request = cast(
+            LeavingRequest, LeavingRequestFactory(flow=self.flow)
+        )
+        self.task_status = cast(
+            TaskStatus,
+            TaskStatusFactory(flow=self.flow, step_id="step_1", executed_at=None),
+        )
+        clear_step_due_times(self.flow)
+
+    def test_next_due_at_without_due_times(self):
+        self.assertEqual(get_next_due_at(self.flow), timezone.now())
+
+    def test_next_due_at_earliest_due_time(self):
+        TaskStatusFactory(flow=self.flow, step_id="step_2", executed_at=None)
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+        set_step_due_at(self.flow, "step_2", timezone.now() + timedelta(days=1))
+
+        self.assertEqual(get_next_due_at(self.flow), timezone.now() + timedelta(days=1))
+
+    def test_next_due_at_step_without_due_time(self):
+        TaskStatusFactory(flow=self.flow, step_id="step_2", executed_at=None)
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+
+        self.assertEqual(get_next_due_at(self.flow), timezone.now())
+
+    def test_next_due_at_ignores_executed_steps(self):
+        TaskStatusFactory(flow=self.flow, step_id="step_2", executed_at=timezone.now())
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+
+        self.assertEqual(get_next_due_at(self.flow), timezone.now() + timedelta(days=2))
+
+    def test_schedule_flow(self):
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+
+        flow_schedule = schedule_flow(self.flow)
+
+        assert flow_schedule
+        self.assertEqual(flow_schedule.next_due_at, timezone.now() + timedelta(days=2))
+
+    def test_schedule_finished_flow(self):
+        schedule_flow(self.flow)
+        self.flow.finished = timezone.now()
+        self.flow.save()
+
+        self.assertIsNone(schedule_flow(self.flow))
+        self.assertFalse(FlowSchedule.objects.filter(flow=self.flow).exists())
+
+    def test_due_flows(self):
+        self.assertIn(self.flow, get_due_flows())
+
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+        schedule_flow(self.flow)
+        self.assertNotIn(self.flow, get_due_flows())
+
+        with freeze_time(timezone.now() + timedelta(days=2)):
+            self.assertIn(self.flow, get_due_flows())
+
+    def test_due_flows_leaving_request_changed(self):
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+        schedule_flow(self.flow)
+
+        with freeze_time(timezone.now() + timedelta(minutes=5)):
+            self.leaving_request.save()
+            self.assertIn(self.flow, get_due_flows())
+
+    def test_due_flows_leaving_request_changed_fields(self):
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+        schedule_flow(self.flow)
+
+        with freeze_time(timezone.now() + timedelta(minutes=5)):
+            self.leaving_request.sre_complete = timezone.now()
+            self.leaving_request.save(update_fields=["sre_complete"])
+            self.assertIn(self.flow, get_due_flows())
+
+    def test_due_flows_leaving_request_changed_during_run(self):
+        loaded_at = timezone.now()
+        set_step_due_at(self.flow, "step_1", loaded_at + timedelta(days=2))
+
+        # The leaving request changes after the run loaded it.
+        with freeze_time(loaded_at + timedelta(minutes=1)):
+            self.leaving_request.save()
+        with freeze_time(loaded_at + timedelta(minutes=2)):
+            schedule_flow(self.flow, scheduled_at=loaded_at)
+            self.assertIn(self.flow, get_due_flows())
+
+    def test_flow_due_at(self):
+        self.assertIsNone(get_flow_due_at(self.flow))
+
+        set_step_due_at(self.flow, "step_1", timezone.now() + timedelta(days=2))
+        schedule_flow(self.flow)
+        flow = Flow.objects.select_related("schedule", "leaving_request").get()
+        self.assertEqual(get_flow_due_at(flow), timezone.now() + timedelta(days=2))
+
+        with freeze_time(timezone.now() + timedelta(minutes=5)):
+            self.leaving_request.save()
+        flow = Flow.objects.select_related("schedule", "leaving_request").get()
+        self.assertEqual(get_flow_due_at(flow), timezone.now() + timedelta(minutes=5))
+
+    def test_pause_task_due_on_leaving_date(self):
+        self.leaving_request.leaving_date = make_aware(datetime(2022, 12, 2))
+        self.leaving_request.save()
+        task = PauseTask(None, self.task_status, self.flow)
+
+        task.execute({"pass_condition": "after_leaving_date"})
+
+        self.assertEqual(get_next_due_at(self.flow), make_aware(datetime(2022, 12, 2)))
+
+    @freeze_time("2022-11-28 18:00:00")
+    @mock.patch("leavers.workflow.tasks.EmailTask.send_email")
+    def test_email_task_due_next_working_day(self, mock_send_email):
+        task = NotificationEmail(None, self.task_status, self.flow)
+
+        task.execute({"email_id": "leaver_thank_you_email"})
+
+        mock_send_email.assert_not_called()
+        self.assertEqual(
+            get_next_due_at(self.flow), make_aware(datetime(2022, 11, 29, 9))
+        )
+
+    @mock.patch("leavers.workflow.tasks.EmailTask.get_send_email_method")
+    def test_waiting_on_line_manager_due_at_next_reminder(
+        self, mock_get_send_email_method
+    ):
+        self.flow.workflow_name = "leaving"
+        self.flow.save()
+        self.task_status.delete()
+        self.leaving_request.last_day = make_aware(datetime(2022, 12, 12))
+        self.leaving_request.save()
+        reminder_task_status = cast(
+            TaskStatus,
+            TaskStatusFactory(
+                flow=self.flow,
+                step_id="send_line_manager_reminder",
+                task_name="reminder_email",
+                executed_at=timezone.now(),
+            ),
+        )
+        # The reminder loops back to checking if the line manager has completed.
+        TaskStatusFactory(
+            flow=self.flow,
+            step_id="has_line_manager_completed",
+            task_name="has_line_manager_completed",
+            executed_at=None,
+        )
+
+        ReminderEmail(None, reminder_task_status, self.flow).execute(
+            {"email_id": "line_manager_reminder"}
+        )
+        schedule_flow(self.flow)
+
+        mock_get_send_email_method.return_value.assert_called_once()
+        # The next reminder is 1 week before the last day, at the start of the
+        # working day.
+        next_reminder_at = make_aware(datetime(2022, 12, 5, 9))
+        self.assertEqual(self.flow.schedule.next_due_at, next_reminder_at)
+        self.assertNotIn(self.flow, get_due_flows())
+
+        with freeze_time(next_reminder_at - timedelta(minutes=5)):
+            self.assertNotIn(self.flow, get_due_flows())
+        with freeze_time(next_reminder_at):
+            self.assertIn(self.flow, get_due_flows())
+
+
+@mock.patch("core.tasks.progress_workflow.apply_async")
+class TestProgressFlowOnCommit(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.flow = cast(Flow, FlowFactory())
+
+    def test_enqueued_on_commit(self, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            progress_flow_on_commit(self.flow)
+        mock_apply_async.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+        mock_apply_async.assert_called_once_with(
+            kwargs={"flow_pk": self.flow.pk}, countdown=5
+        )
+
+    def test_burst_enqueued_once(self, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            progress_flow_on_commit(self.flow)
+            progress_flow_on_commit(self.flow)
+        progress_flow_on_commit(self.flow)
+        self.assertFalse(enqueue_flow_progress(self.flow.pk))
+
+        mock_apply_async.assert_called_once()
+
+    def test_no_flow(self, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            progress_flow_on_commit(None)
+
+        mock_apply_async.assert_not_called()
+
+    def test_finished_flow(self, mock_apply_async):
+        self.flow.finished = timezone.now()
+        self.flow.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            progress_flow_on_commit(self.flow)
+
+        mock_apply_async.assert_not_called()
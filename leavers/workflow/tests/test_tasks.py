@@ -119,6 +119,45 @@ class TestSkipConditions(TestCase):
         )
 
 
+class TestEmailTask(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+
+        self.flow = FlowFactory(executed_by=self.user)
+        self.task_record = TaskStatusFactory(executed_by=self.user, flow=self.flow)
+        self.leaving_request = LeavingRequestFactory()
+        self.flow.leaving_request = self.leaving_request
+        self.flow.save()
+
+        self.task = DailyReminderEmail(self.user, self.task_record, self.flow)
+
+    @freeze_time("2021-11-30 12:00:00")
+    @mock.patch("leavers.workflow.tasks.DailyReminderEmail.get_send_email_method")
+    def test_send_email_records_send(self, mock_get_send_email_method):
+        self.assertIsNone(
+            self.task.get_latest_email_sent_at(EmailIds.LINE_MANAGER_CORRECTION)
+        )
+
+        self.task.send_email(email_id=EmailIds.LINE_MANAGER_CORRECTION)
+
+        mock_get_send_email_method.return_value.assert_called_once()
+        email_send_record = self.leaving_request.email_send_records.get()
+        self.assertEqual(
+            email_send_record.email_id, EmailIds.LINE_MANAGER_CORRECTION.value
+        )
+        self.assertEqual(
+            email_send_record.task_log.task_name,
+            f"Sending email {EmailIds.LINE_MANAGER_CORRECTION.value}",
+        )
+        self.assertEqual(
+            self.task.get_latest_email_sent_at(EmailIds.LINE_MANAGER_CORRECTION),
+            email_send_record.sent_at,
+        )
+        self.assertIsNone(
+            self.task.get_latest_email_sent_at(EmailIds.LINE_MANAGER_REMINDER)
+        )
+
+
 class TestDailyReminderEmail(TestCase):
     def setUp(self):
         self.user = UserFactory()
@@ -133,11 +172,6 @@ class TestDailyReminderEmail(TestCase):
 
         self.task = DailyReminderEmail(self.user, self.task_record, self.flow)
 
-        self.task_name = (
-            "Some task name that contains an Email ID "
-            f"{EmailIds.LINE_MANAGER_CORRECTION.value}"
-        )
-
     @freeze_time("2021-11-30 12:00:00")  # Tuesday
     def test_daily_logic(self):
         self.assertTrue(
@@ -145,9 +179,8 @@ class TestDailyReminderEmail(TestCase):
                 email_id=EmailIds.LINE_MANAGER_CORRECTION,
             )
         )
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -161,9 +194,8 @@ class TestDailyReminderEmail(TestCase):
                     email_id=EmailIds.LINE_MANAGER_CORRECTION,
                 )
             )
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
             self.assertFalse(
                 self.task.should_send_email(
@@ -177,9 +209,8 @@ class TestDailyReminderEmail(TestCase):
                     email_id=EmailIds.LINE_MANAGER_CORRECTION,
                 )
             )
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
             self.assertFalse(
                 self.task.should_send_email(
@@ -202,11 +233,6 @@ class TestReminderEmail(TestCase):
 
         self.task = ReminderEmail(self.user, self.task_record, self.flow)
 
-        self.task_name = (
-            "Some task name that contains an Email ID "
-            f"{EmailIds.LINE_MANAGER_CORRECTION.value}"
-        )
-
     @freeze_time("2021-11-30 12:00:00")  # Tuesday
     def test_before_two_weeks(self):
         # Test no email sent yet
@@ -226,9 +252,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -247,9 +272,8 @@ class TestReminderEmail(TestCase):
 
         # Test 2 week email sent
         with freeze_time("2022-12-7 12:00:00"):  # Wednesday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertFalse(
             self.task.should_send_email(
@@ -258,9 +282,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -279,9 +302,8 @@ class TestReminderEmail(TestCase):
 
         # Test 2 week email sent
         with freeze_time("2022-11-30 12:00:00"):  # Wednesday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -290,9 +312,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -311,9 +332,8 @@ class TestReminderEmail(TestCase):
 
         # Test 1 week email sent
         with freeze_time("2022-12-7 12:00:00"):  # Wednesday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -322,9 +342,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -343,9 +362,8 @@ class TestReminderEmail(TestCase):
 
         # Test 6 days email sent
         with freeze_time("2022-12-8 12:00:00"):  # Thursday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -354,9 +372,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -375,9 +392,8 @@ class TestReminderEmail(TestCase):
 
         # Test 5 days email sent
         with freeze_time("2022-12-9 12:00:00"):
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -386,9 +402,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -407,9 +422,8 @@ class TestReminderEmail(TestCase):
 
         # Test 4 days email sent
         with freeze_time("2022-12-10 12:00:00"):  # Saturday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -418,9 +432,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -439,9 +452,8 @@ class TestReminderEmail(TestCase):
 
         # Test 3 days email sent
         with freeze_time("2022-12-11 12:00:00"):  # Sunday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -450,9 +462,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -471,9 +482,8 @@ class TestReminderEmail(TestCase):
 
         # Test 2 days email sent
         with freeze_time("2022-12-12 12:00:00"):  # Monday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -482,9 +492,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -503,9 +512,8 @@ class TestReminderEmail(TestCase):
 
         # Test 1 days email sent
         with freeze_time("2022-12-13 12:00:00"):  # Tuesday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -514,9 +522,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -535,9 +542,8 @@ class TestReminderEmail(TestCase):
 
         # Test same day email sent
         with freeze_time("2022-12-14 12:00:00"):  # Wednesday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -546,9 +552,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -567,9 +572,8 @@ class TestReminderEmail(TestCase):
 
         # Test next day email sent
         with freeze_time("2022-12-15 12:00:00"):  # Thursday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -578,9 +582,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -599,9 +602,8 @@ class TestReminderEmail(TestCase):
 
         # Test 2 days after email sent
         with freeze_time("2022-12-16 12:00:00"):  # Friday
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=self.task_name,
+            self.leaving_request.email_send_records.create(
+                email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
             )
         self.assertTrue(
             self.task.should_send_email(
@@ -610,9 +612,8 @@ class TestReminderEmail(TestCase):
         )
 
         # Test email already sent
-        self.leaving_request.email_task_logs.create(
-            user=self.user,
-            task_name=self.task_name,
+        self.leaving_request.email_send_records.create(
+            email_id=EmailIds.LINE_MANAGER_CORRECTION.value,
         )
         self.assertFalse(
             self.task.should_send_email(
@@ -626,7 +627,7 @@ class TestProcessorReminderEmail(TestCase):
         self.user = UserFactory()
 
         # Leaving Request with different dates
-        self.flow = FlowFactory(executed_by=self.user)
+        self.flow = FlowFactory(executed_by=self.user, workflow_name="leaving")
         self.task_record = TaskStatusFactory(executed_by=self.user, flow=self.flow)
         self.leaving_request = LeavingRequestFactory(
             last_day=make_aware(datetime(2022, 12, 5)),  # Monday
@@ -636,7 +637,7 @@ class TestProcessorReminderEmail(TestCase):
         self.flow.save()
 
         # Leaving Request with same dates
-        self.flow2 = FlowFactory(executed_by=self.user)
+        self.flow2 = FlowFactory(executed_by=self.user, workflow_name="leaving")
         self.task_record2 = TaskStatusFactory(executed_by=self.user, flow=self.flow2)
         self.leaving_request2 = LeavingRequestFactory(
             last_day=make_aware(datetime(2022, 12, 9)),  # Friday
@@ -662,9 +663,8 @@ class TestProcessorReminderEmail(TestCase):
     @freeze_time("2022-12-5 12:00:00")  # Monday
     def test_should_send_email_already_sent(self):
         for _, email_id in self.email_ids.items():
-            self.leaving_request.email_task_logs.create(
-                user=self.user,
-                task_name=f"Some task name that contains an Email ID {email_id}",
+            self.leaving_request.email_send_records.create(
+                email_id=email_id,
             )
             with self.subTest(email_id=email_id):
                 self.assertFalse(
@@ -677,6 +677,25 @@ class TestProcessorReminderEmail(TestCase):
         self.task.execute(task_info=self.task_info)
         mock_get_send_email_method.assert_not_called()
 
+    @freeze_time("2022-12-5 12:00:00")  # Monday
+    def test_next_processor_email_date(self):
+        # Day after Last working day
+        self.assertEqual(
+            self.task.get_next_processor_email_date(task_info=self.task_info),
+            make_aware(datetime(2022, 12, 6)),
+        )
+        # Leaving date, as Last working day is the same day
+        self.assertEqual(
+            self.task2.get_next_processor_email_date(task_info=self.task_info),
+            make_aware(datetime(2022, 12, 9)),
+        )
+
+    @freeze_time("2022-12-15 12:00:00")  # Thursday
+    def test_next_processor_email_date_all_sent(self):
+        self.assertIsNone(
+            self.task.get_next_processor_email_date(task_info=self.task_info)
+        )
+
     @freeze_time("2022-12-6 12:00:00")  # Tuesday
     @mock.patch("leavers.workflow.tasks.ProcessorReminderEmail.get_send_email_method")
     def test_day_after_lwd(self, mock_get_send_email_method):
@@ -690,9 +709,8 @@ class TestProcessorReminderEmail(TestCase):
     def test_two_days_after_lwd(self, mock_get_send_email_method):
         for _, email_id in self.email_ids.items():
             if email_id != self.email_ids["two_days_after_lwd"]:
-                self.leaving_request.email_task_logs.create(
-                    user=self.user,
-                    task_name=f"Some task name that contains an Email ID {email_id}",
+                self.leaving_request.email_send_records.create(
+                    email_id=email_id,
                 )
 
         self.task.execute(task_info=self.task_info)
@@ -705,9 +723,8 @@ class TestProcessorReminderEmail(TestCase):
     def test_on_ld(self, mock_get_send_email_method):
         for _, email_id in self.email_ids.items():
             if email_id != self.email_ids["on_ld"]:
-                self.leaving_request.email_task_logs.create(
-                    user=self.user,
-                    task_name=f"Some task name that contains an Email ID {email_id}",
+                self.leaving_request.email_send_records.create(
+                    email_id=email_id,
                 )
 
         self.task.execute(task_info=self.task_info)
@@ -720,9 +737,8 @@ class TestProcessorReminderEmail(TestCase):
     def test_one_day_after_ld_weekend(self, mock_get_send_email_method):
         for _, email_id in self.email_ids.items():
             if email_id != self.email_ids["one_day_after_ld"]:
-                self.leaving_request.email_task_logs.create(
-                    user=self.user,
-                    task_name=f"Some task name that contains an Email ID {email_id}",
+                self.leaving_request.email_send_records.create(
+                    email_id=email_id,
                 )
 
         self.task.execute(task_info=self.task_info)
@@ -733,9 +749,8 @@ class TestProcessorReminderEmail(TestCase):
     def test_one_day_after_ld_weekday(self, mock_get_send_email_method):
         for _, email_id in self.email_ids.items():
             if email_id != self.email_ids["one_day_after_ld"]:
-                self.leaving_request.email_task_logs.create(
-                    user=self.user,
-                    task_name=f"Some task name that contains an Email ID {email_id}",
+                self.leaving_request.email_send_records.create(
+                    email_id=email_id,
                 )
 
         self.task.execute(task_info=self.task_info)
@@ -751,9 +766,8 @@ class TestProcessorReminderEmail(TestCase):
                 self.email_ids["five_days_after_ld_lm"],
                 self.email_ids["five_days_after_ld_proc"],
             ]:
-                self.leaving_request.email_task_logs.create(
-                    user=self.user,
-                    task_name=f"Some task name that contains an Email ID {email_id}",
+                self.leaving_request.email_send_records.create(
+                    email_id=email_id,
                 )
 
         self.task.execute(task_info=self.task_info)
@@ -767,9 +781,8 @@ class TestProcessorReminderEmail(TestCase):
                 self.email_ids["five_days_after_ld_lm"],
                 self.email_ids["five_days_after_ld_proc"],
             ]:
-                self.leaving_request.email_task_logs.create(
-                    user=self.user,
-                    task_name=f"Some task name that contains an Email ID {email_id}",
+                self.leaving_request.email_send_records.create(
+                    email_id=email_id,
                 )
 
         self.task.execute(task_info=self.task_info)